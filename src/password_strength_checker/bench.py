@@ -0,0 +1,190 @@
+"""
+Benchmark runner for the evaluation pipeline (`psc bench`).
+
+Times evaluate(), each rule, estimate_times() and dictionary loading over synthetic
+corpora, reports throughput and latency percentiles, and can compare a run against a
+saved baseline JSON to catch regressions.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import string
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+from password_strength_checker.core.analysis import PasswordAnalysis, analyze
+from password_strength_checker.core.dictfile import compile_dictionary
+from password_strength_checker.core.estimates import estimate_times
+from password_strength_checker.core.evaluate import Evaluator
+from password_strength_checker.core.incremental import IncrementalEvaluator
+from password_strength_checker.core.models import Policy
+from password_strength_checker.core.rules.dictionary import DictionaryRule
+
+PASSWORD_LENGTHS = (8, 16, 64)
+DICTIONARY_SIZES = (1_000, 100_000)
+DEFAULT_TOLERANCE = 0.25
+
+_ALPHABET = string.ascii_letters + string.digits + string.punctuation
+_WORDS = ("password", "dragon", "monkey", "soleil", "azerty", "qwerty", "1234", "2024", "admin")
+
+
+def synthetic_passwords(count: int, length: int, seed: int = 0) -> list[str]:
+    """Random passwords, a third of them seeded with common words / sequences."""
+    rng = random.Random(seed * 1_000 + length)
+    out: list[str] = []
+    for i in range(count):
+        chars = [rng.choice(_ALPHABET) for _ in range(length)]
+        if i % 3 == 0:
+            w = rng.choice(_WORDS)[:length]
+            pos = rng.randrange(length - len(w) + 1)
+            chars[pos : pos + len(w)] = w
+        out.append("".join(chars))
+    return out
+
+
+def synthetic_dictionary(path: Path, size: int, seed: int = 0) -> Path:
+    rng = random.Random(seed + size)
+    with path.open("w", encoding="utf-8") as fh:
+        fh.write("# synthetic dictionary\n")
+        for w in _WORDS:
+            fh.write(w + "\n")
+        for _ in range(size - len(_WORDS)):
+            n = rng.randint(4, 12)
+            fh.write("".join(rng.choice(string.ascii_lowercase + string.digits) for _ in range(n)) + "\n")
+    return path
+
+
+def _percentile(sorted_ns: Sequence[int], q: float) -> float:
+    idx = min(len(sorted_ns) - 1, max(0, round(q * (len(sorted_ns) - 1))))
+    return sorted_ns[idx] / 1e3
+
+
+def measure(fn: Callable[[Any], object], items: Sequence[Any], repeat: int = 1) -> dict[str, float]:
+    """Time fn(item) for every item; latencies in microseconds."""
+    samples: list[int] = []
+    for _ in range(repeat):
+        for item in items:
+            t0 = time.perf_counter_ns()
+            fn(item)
+            samples.append(time.perf_counter_ns() - t0)
+    samples.sort()
+    total = sum(samples)
+    return {
+        "calls": len(samples),
+        "ops_per_sec": len(samples) / (total / 1e9) if total else float("inf"),
+        "mean_us": total / len(samples) / 1e3,
+        "p50_us": _percentile(samples, 0.50),
+        "p95_us": _percentile(samples, 0.95),
+        "p99_us": _percentile(samples, 0.99),
+    }
+
+
+def _rule_check(rule: object, policy: Policy) -> Callable[[PasswordAnalysis], object]:
+    check = rule.check  # type: ignore[attr-defined]
+
+    def run(a: PasswordAnalysis) -> object:
+        return check(a.password, policy, a)
+
+    return run
+
+
+def _type_last(item: tuple[IncrementalEvaluator, str]) -> object:
+    inc, ch = item
+    return inc.append(ch)
+
+
+def run_benchmarks(
+    count: int = 500,
+    lengths: Sequence[int] = PASSWORD_LENGTHS,
+    dictionary_sizes: Sequence[int] = DICTIONARY_SIZES,
+    policy: Policy = Policy(),
+) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+
+    with tempfile.TemporaryDirectory(prefix="psc-bench-") as tmp:
+        tmpdir = Path(tmp)
+
+        # Dictionary loading (text list vs compiled mmap); loaded rules are closed afterwards
+        # so their mmaps do not outlive the temporary directory
+        loaded: list[DictionaryRule] = []
+
+        def load(path: Path) -> None:
+            loaded.append(DictionaryRule.from_file(path))
+
+        try:
+            for size in dictionary_sizes:
+                txt = synthetic_dictionary(tmpdir / f"dict-{size}.txt", size)
+                pscd = tmpdir / f"dict-{size}.pscd"
+                compile_dictionary(txt, pscd)
+                results[f"dict_load[txt,{size}]"] = measure(load, [txt])
+                results[f"dict_load[pscd,{size}]"] = measure(load, [pscd], repeat=5)
+        finally:
+            for dictionary in loaded:
+                dictionary.close()
+
+        largest = max(dictionary_sizes, default=0)
+        data_dir = tmpdir / "data"
+        data_dir.mkdir()
+        if largest:
+            synthetic_dictionary(data_dir / "common_passwords.txt", largest)
+        ev = Evaluator(policy, data_dir)
+
+        for length in lengths:
+            pws = synthetic_passwords(count, length)
+            results[f"evaluate[len={length}]"] = measure(ev.evaluate, pws)
+            results[f"analyze[len={length}]"] = measure(analyze, pws)
+
+            # Live typing: one more character on top of an already evaluated prefix
+            typing = [(IncrementalEvaluator(ev, pw[:-1]), pw[-1]) for pw in pws]
+            results[f"incremental[len={length}]"] = measure(_type_last, typing)
+
+            analyses = [analyze(pw) for pw in pws]
+            for name, rule in ev.rules:
+                results[f"rule:{name}[len={length}]"] = measure(_rule_check(rule, policy), analyses)
+
+            scored = [(pw, r.score, r.findings) for pw, r in ((pw, ev.evaluate(pw)) for pw in pws)]
+            results[f"estimate_times[len={length}]"] = measure(lambda t: estimate_times(*t), scored)
+
+    return results
+
+
+def compare(
+    current: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float = DEFAULT_TOLERANCE,
+    metric: str = "p50_us",
+) -> list[str]:
+    """Regressions: benchmarks whose `metric` grew by more than `tolerance` vs the baseline."""
+    regressions: list[str] = []
+    for name, stats in current.items():
+        base = baseline.get(name)
+        if not base or metric not in base or not base[metric]:
+            continue
+        ratio = stats[metric] / base[metric]
+        if ratio > 1 + tolerance:
+            regressions.append(f"{name}: {metric} {base[metric]:.1f} -> {stats[metric]:.1f} (x{ratio:.2f})")
+    return regressions
+
+
+def format_report(results: dict[str, dict[str, float]]) -> str:
+    header = f"{'benchmark':<34} {'ops/s':>12} {'p50 µs':>10} {'p95 µs':>10} {'p99 µs':>10}"
+    lines = [header, "-" * len(header)]
+    for name, s in results.items():
+        lines.append(
+            f"{name:<34} {s['ops_per_sec']:>12.0f} {s['p50_us']:>10.1f} {s['p95_us']:>10.1f} {s['p99_us']:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def load_results(path: Path) -> dict[str, dict[str, float]]:
+    data: dict[str, dict[str, float]] = json.loads(path.read_text(encoding="utf-8"))
+    return data
+
+
+def save_results(results: dict[str, dict[str, float]], path: Path) -> None:
+    path.write_text(json.dumps(results, indent=2, sort_keys=True), encoding="utf-8")
@@ -1,50 +1,346 @@
 from __future__ import annotations
 
 import argparse
+import itertools
 import json
 import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
 from getpass import getpass
 from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
 
-from rich.console import Console
-from rich.table import Table
+from password_strength_checker.core.evaluate import Evaluator, evaluate, evaluate_many
+from password_strength_checker.core.models import Policy, Result
+from password_strength_checker.core.policy import CompiledPolicy, PolicyWatcher, load_policy
 
-from password_strength_checker.core.evaluate import evaluate
-from password_strength_checker.core.models import Policy
-from password_strength_checker.core.policy import load_policy
+if TYPE_CHECKING:
+    from password_strength_checker.core.tenants import TenantEvaluator
+
+
+def add_policy_args(p: argparse.ArgumentParser, suppress: bool = False) -> None:
+    # Subcommands use suppress=True so they don't clobber values given before the subcommand
+    def default(v: object) -> object:
+        return argparse.SUPPRESS if suppress else v
+
+    p.add_argument("--min-length", type=int, default=default(12), help="Longueur minimale recommandée.")
+    p.add_argument("--strong-length", type=int, default=default(16), help="Longueur 'forte'.")
+    p.add_argument("--policy", type=str, default=default(None), help="Chemin vers un fichier policy.json")
+    p.add_argument("--tenants", type=str, default=default(None), help="Configuration multi-tenant (JSON: policy par tenant).")
+    p.add_argument("--tenant", type=str, default=default(None), help="Tenant à utiliser avec --tenants (défaut: 'default').")
+    p.add_argument(
+        "--plugins",
+        action="store_true",
+        default=default(False),
+        help="Charge les règles tierces (entry points); aussi via PSC_PLUGINS=1.",
+    )
+
+
+def tenants_from_args(args: argparse.Namespace) -> TenantEvaluator | None:
+    if not args.tenants:
+        return None
+    from password_strength_checker.core.tenants import TenantEvaluator
+
+    return TenantEvaluator.from_file(Path(args.tenants))
+
+
+def policy_from_args(args: argparse.Namespace, tenants: TenantEvaluator | None = None) -> Policy | CompiledPolicy:
+    # --tenants: the selected tenant's policy wins over everything else
+    if tenants is None:
+        tenants = tenants_from_args(args)
+    if tenants is not None:
+        from password_strength_checker.core.tenants import UnknownTenantError
+
+        try:
+            return tenants.policy(args.tenant)
+        except UnknownTenantError:
+            raise SystemExit(f"Tenant inconnu: {args.tenant!r} (disponibles: {', '.join(tenants.tenants)})") from None
+
+    # Base policy from CLI args
+    policy = Policy(min_length=args.min_length, strong_length=args.strong_length)
+
+    # If --policy provided, load it (and it overrides the base policy)
+    if args.policy:
+        policy = load_policy(Path(args.policy))
+    return policy
+
+
+def default_evaluator_from_args(
+    args: argparse.Namespace, tenants: TenantEvaluator | None, watcher: PolicyWatcher | None
+) -> Evaluator | None:
+    # --tenants without a default tenant (and no --tenant): every request must name its tenant
+    if watcher is None and tenants is not None and args.tenant is None and tenants.default is None:
+        return None
+    return Evaluator(watcher.policy if watcher else policy_from_args(args, tenants))
+
+
+def policy_watcher_from_args(args: argparse.Namespace) -> PolicyWatcher | None:
+    if not getattr(args, "watch_policy", False):
+        return None
+    if not args.policy:
+        raise SystemExit("--watch-policy nécessite --policy")
+    return PolicyWatcher(Path(args.policy))
 
 
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="psc", description="Password Strength Checker (local)")
     p.add_argument("--password", help="Mot de passe (déconseillé: historique shell).")
     p.add_argument("--json", action="store_true", help="Sortie JSON.")
-    p.add_argument("--min-length", type=int, default=12, help="Longueur minimale recommandée.")
-    p.add_argument("--strong-length", type=int, default=16, help="Longueur 'forte'.")
-    p.add_argument("--policy", type=str, help="Chemin vers un fichier policy.json")
+    add_policy_args(p)
     p.add_argument("--explain", action="store_true", help="Affiche les détails de calcul (score/estimates).")
     p.add_argument("--strict", action="store_true", help="Considère WARNING comme non conforme (exit code non-zero).")
+    p.add_argument("--profile", action="store_true", help="Mesure le temps passé par règle (ajoute 'timings').")
+    p.add_argument(
+        "--short-circuit",
+        action="store_true",
+        help="Règles les moins coûteuses d'abord, arrêt au premier CRITICAL (résultat partiel).",
+    )
+
+    sub = p.add_subparsers(dest="command")
+
+    d = sub.add_parser("dict", help="Outils pour les dictionnaires de mots de passe.")
+    dsub = d.add_subparsers(dest="dict_command", required=True)
+    dc = dsub.add_parser("compile", help="Compile une liste de mots (.txt) en dictionnaire binaire (.pscd, mmap).")
+    dc.add_argument("source", help="Liste de mots, un par ligne (format common_passwords.txt).")
+    dc.add_argument("output", help="Fichier .pscd à écrire.")
+    dh = dsub.add_parser("hibp-index", help="Indexe un fichier SHA1:COUNT trié (HIBP) par préfixe (.idx).")
+    dh.add_argument("source", help="Fichier pwned-passwords (ordonné par hash).")
+    db = dsub.add_parser("bloom", help="Construit un filtre de Bloom (.bloom) pour les recherches exactes.")
+    db.add_argument("source", help="Dictionnaire utilisé (.txt ou .pscd); le filtre est ignoré s'il change.")
+    db.add_argument("output", help="Fichier .bloom à écrire.")
+    db.add_argument("--fp-rate", type=float, default=0.001, help="Taux de faux positifs visé (défaut: 0.001).")
+
+    b = sub.add_parser("batch", help="Évalue un flux de mots de passe (un par ligne) et écrit du JSONL.")
+    b.add_argument("--input", "-i", default="-", help="Fichier d'entrée ('-' = stdin, défaut).")
+    b.add_argument("--output", "-o", default="-", help="Fichier de sortie JSONL ('-' = stdout, défaut).")
+    b.add_argument("--workers", "-j", type=int, default=1, help="Nombre de processus (défaut: 1).")
+    b.add_argument("--chunk-size", type=int, default=512, help="Mots de passe par tâche avec --workers.")
+    b.add_argument("--unordered", action="store_true", help="Avec --workers: écrit les résultats dès qu'ils arrivent.")
+    b.add_argument("--vectorized", action="store_true", help="Moteur NumPy par lots (si numpy est installé).")
+    b.add_argument("--short-circuit", action="store_true", help="Arrêt au premier CRITICAL (conformité seule).")
+    add_policy_args(b, suppress=True)
+
+    sv = sub.add_parser("serve", help="Service HTTP local (POST /evaluate, /evaluate/batch, GET /metrics).")
+    sv.add_argument("--host", default="127.0.0.1", help="Adresse d'écoute (défaut: 127.0.0.1).")
+    sv.add_argument("--port", type=int, default=8765, help="Port (défaut: 8765).")
+    sv.add_argument("--max-body", type=int, default=1024 * 1024, help="Taille max d'une requête (octets).")
+    sv.add_argument("--max-batch", type=int, default=10_000, help="Mots de passe max par /evaluate/batch.")
+    sv.add_argument("--max-concurrency", type=int, default=64, help="Évaluations simultanées max (503 au-delà).")
+    sv.add_argument("--keepalive-timeout", type=float, default=15.0, help="Fermeture des connexions inactives (s).")
+    sv.add_argument("--watch-policy", action="store_true", help="Recharge --policy à chaud quand le fichier change.")
+    add_policy_args(sv, suppress=True)
+
+    rpc = sub.add_parser("rpc", help="Mode coprocessus: JSON ligne par ligne sur stdin/stdout ou socket Unix.")
+    rpc.add_argument("--socket", help="Écoute sur ce socket Unix au lieu de stdin/stdout.")
+    rpc.add_argument("--watch-policy", action="store_true", help="Recharge --policy à chaud quand le fichier change.")
+    add_policy_args(rpc, suppress=True)
+
+    bench = sub.add_parser("bench", help="Mesure les performances du pipeline d'évaluation.")
+    bench.add_argument("--quick", action="store_true", help="Corpus réduits (rapide, pour la CI).")
+    bench.add_argument("--json", action="store_true", help="Sortie JSON.")
+    bench.add_argument("--save", help="Enregistre les résultats (JSON) comme baseline.")
+    bench.add_argument("--baseline", help="Compare à une baseline JSON (exit code 1 si régression).")
+    bench.add_argument("--tolerance", type=float, default=0.25, help="Régression tolérée sur p50 (défaut: 0.25).")
     return p
 
 
-def main() -> None:
-    args = build_parser().parse_args()
-    pw = args.password or getpass("Mot de passe: ")
+def _read_passwords(fh: TextIO) -> Iterator[tuple[int, str]]:
+    for lineno, line in enumerate(fh, start=1):
+        pw = line.rstrip("\r\n")
+        if pw:
+            yield lineno, pw
 
-    # Base policy from CLI args
-    policy = Policy(min_length=args.min_length, strong_length=args.strong_length)
 
-    # If --policy provided, load it (and it overrides the base policy)
-    if args.policy:
-        policy = load_policy(Path(args.policy))
+def run_batch(args: argparse.Namespace) -> None:
+    policy = policy_from_args(args)
+
+    fin = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8", errors="replace")
+    fout = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        # Results are paired back with their line number; the password itself is never written.
+        if args.workers > 1:
+            from password_strength_checker.core.parallel import evaluate_many_parallel
 
-    result = evaluate(pw, policy=policy)
-    import sys
+            results: Iterable[tuple[int, Result]] = evaluate_many_parallel(
+                _read_passwords(fin),
+                policy=policy,
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+                ordered=not args.unordered,
+                vectorized=args.vectorized,
+                short_circuit=args.short_circuit,
+            )
+        else:
+            # tee() only buffers the one-item lag between both sides, so memory stays constant
+            numbered, entries = itertools.tee(_read_passwords(fin))
+            evaluated = evaluate_many(
+                (pw for _, pw in entries),
+                policy=policy,
+                vectorized=args.vectorized,
+                short_circuit=args.short_circuit,
+            )
+            results = zip((n for n, _ in numbered), evaluated)
 
+        for lineno, result in results:
+            row = {"line": lineno, **result.to_dict()}
+            fout.write(json.dumps(row, ensure_ascii=False) + "\n")
+    finally:
+        if fin is not sys.stdin:
+            fin.close()
+        if fout is not sys.stdout:
+            fout.close()
+        else:
+            fout.flush()
+
+
+def run_serve(args: argparse.Namespace) -> None:
+    from password_strength_checker.server.httpd import ServerConfig, serve
+
+    config = ServerConfig(
+        host=args.host,
+        port=args.port,
+        max_body=args.max_body,
+        max_batch=args.max_batch,
+        max_concurrency=args.max_concurrency,
+        keepalive_timeout=args.keepalive_timeout,
+    )
+    tenants = tenants_from_args(args)
+    watcher = policy_watcher_from_args(args)
+    evaluator = default_evaluator_from_args(args, tenants, watcher)
+    print(f"psc serve: http://{config.host}:{config.port}", file=sys.stderr)
+    if watcher is not None:
+        watcher.start()
+    try:
+        serve(evaluator, config, watcher, tenants)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if watcher is not None:
+            watcher.stop()
+
+
+def run_rpc(args: argparse.Namespace) -> None:
+    from password_strength_checker.server.rpc import serve_stdio, serve_unix
+
+    tenants = tenants_from_args(args)
+    watcher = policy_watcher_from_args(args)
+    evaluator = default_evaluator_from_args(args, tenants, watcher)
+    if watcher is not None:
+        watcher.start()
+    try:
+        if args.socket:
+            try:
+                serve_unix(evaluator, Path(args.socket), watcher, tenants)
+            except OSError as e:
+                raise SystemExit(f"psc rpc: {e}") from None
+        else:
+            serve_stdio(evaluator, watcher=watcher, tenants=tenants)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if watcher is not None:
+            watcher.stop()
+
+
+def run_bench(args: argparse.Namespace) -> None:
+    from password_strength_checker import bench
+
+    if args.quick:
+        results = bench.run_benchmarks(count=100, dictionary_sizes=(1_000, 10_000))
+    else:
+        results = bench.run_benchmarks()
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+    else:
+        print(bench.format_report(results))
+    if args.save:
+        bench.save_results(results, Path(args.save))
+
+    if args.baseline:
+        regressions = bench.compare(results, bench.load_results(Path(args.baseline)), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+def run_dict(args: argparse.Namespace) -> None:
+    from password_strength_checker.core.dictfile import (
+        MappedDictionary,
+        compile_dictionary,
+        is_compiled_dictionary,
+        read_word_list,
+    )
+
+    if args.dict_command == "hibp-index":
+        from password_strength_checker.core.breach import build_hibp_index
+
+        try:
+            idx = build_hibp_index(Path(args.source))
+        except ValueError as e:
+            raise SystemExit(str(e)) from None
+        print(f"Index -> {idx}", file=sys.stderr)
+        return
+
+    src, dst = Path(args.source), Path(args.output)
+    if args.dict_command == "compile":
+        count = compile_dictionary(src, dst)
+        print(f"{count} mots compilés -> {dst}", file=sys.stderr)
+    elif args.dict_command == "bloom":
+        from password_strength_checker.core.bloom import build_bloom_file
+
+        def words() -> Iterator[str]:
+            if is_compiled_dictionary(src):
+                return iter(MappedDictionary(src))
+            return read_word_list(src)
+
+        bf = build_bloom_file(words, dst, fp_rate=args.fp_rate, source=src)
+        print(f"{bf.n} mots, {bf.m // 8} octets, k={bf.k} -> {dst}", file=sys.stderr)
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    if getattr(args, "plugins", False):
+        from password_strength_checker.core.registry import load_plugins
+
+        load_plugins()
+    if args.command == "dict":
+        run_dict(args)
+        return
+    if args.command == "batch":
+        run_batch(args)
+        return
+    if args.command == "serve":
+        run_serve(args)
+        return
+    if args.command == "rpc":
+        run_rpc(args)
+        return
+    if args.command == "bench":
+        run_bench(args)
+        return
+
+    pw = args.password or getpass("Mot de passe: ")
+    policy = policy_from_args(args)
+    if args.profile:
+        ev = Evaluator(policy, instrument=True)
+        result = ev.evaluate(pw, short_circuit=args.short_circuit)
+        # One-shot CLI: rule loading (dictionary...) is part of what the user waits for
+        assert ev.stats is not None and result.timings is not None
+        loads = {k: round(v["total_ms"], 4) for k, v in ev.stats.snapshot().items() if k.startswith("load:")}
+        result = replace(result, timings={**loads, **result.timings})
+    else:
+        result = evaluate(pw, policy=policy, short_circuit=args.short_circuit)
 
     if args.json:
         print(json.dumps(result.to_dict(), ensure_ascii=False, indent=2))
         return
 
+    # rich is only needed for the human-readable report (keeps --json / batch startup lean)
+    from rich.console import Console
+    from rich.table import Table
+
     console = Console()
     console.print(f"\nScore: [bold]{result.score}[/bold]/100  Niveau: [bold]{result.label}[/bold]\n")
 
@@ -78,6 +374,14 @@ def main() -> None:
         console.print("- Note: bonus/ajustements possibles (scoring.py / estimates.py).")
 
 
+    if result.timings is not None:
+        prof = Table(title="Profil (ms)")
+        prof.add_column("Étape")
+        prof.add_column("Durée", justify="right")
+        for name, ms in result.timings.items():
+            prof.add_row(name, f"{ms:.3f}")
+        console.print(prof)
+
     console.print("\n[bold]Recommandations[/bold]")
     for r in result.recommendations:
         console.print(f"- {r}")
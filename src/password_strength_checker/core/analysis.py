@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import string
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+# Per-character class bits
+LOWER = 1
+UPPER = 2
+DIGIT = 4
+PUNCT = 8  # CharsetRule "symbol": string.punctuation
+OTHER = 16  # log10_keyspace "other": not isalnum()
+
+CHARSET_CLASSES = (LOWER, UPPER, DIGIT, PUNCT)
+
+_PUNCTUATION = frozenset(string.punctuation)
+
+# normalisation simple + "leet-lite" (dictionary matching)
+_LEET = str.maketrans({"@": "a", "0": "o", "1": "l", "!": "i", "$": "s", "3": "e", "5": "s", "7": "t"})
+
+
+def normalize(pw: str) -> str:
+    return pw.lower().translate(_LEET)
+
+
+def _char_bits(c: str) -> int:
+    bits = 0
+    if c.islower():
+        bits |= LOWER
+    if c.isupper():
+        bits |= UPPER
+    if c.isdigit():
+        bits |= DIGIT
+    if c in _PUNCTUATION:
+        bits |= PUNCT
+    if not c.isalnum():
+        bits |= OTHER
+    return bits
+
+
+# Fixed table for ASCII; other characters go through a bounded, thread-safe memo
+_ASCII_BITS: tuple[int, ...] = tuple(_char_bits(chr(i)) for i in range(128))
+_non_ascii_bits = lru_cache(maxsize=1024)(_char_bits)
+
+
+def class_bits(c: str) -> int:
+    o = ord(c)
+    return _ASCII_BITS[o] if o < 128 else _non_ascii_bits(c)
+
+
+@dataclass(frozen=True, slots=True)
+class PasswordAnalysis:
+    """Facts about a password derived in one scan, shared by every rule of the pipeline."""
+
+    password: str
+    length: int
+    lower: str
+    normalized: str
+    class_mask: int
+    # run-length encoding: (char, run length)
+    runs: tuple[tuple[str, int], ...]
+    longest_run: int
+    # Facts derived on first use (sequence runs, dictionary hits), shared by the rules and the
+    # guess estimator so one evaluation scans for each of them once
+    memo: dict[Any, Any] = field(default_factory=dict, compare=False, repr=False)
+
+    def has(self, bit: int) -> bool:
+        return bool(self.class_mask & bit)
+
+    @property
+    def classes(self) -> int:
+        """Number of CharsetRule classes present (lower/upper/digit/symbol)."""
+        return sum(1 for b in CHARSET_CLASSES if self.class_mask & b)
+
+
+def analyze(password: str) -> PasswordAnalysis:
+    mask = 0
+    runs: list[tuple[str, int]] = []
+    prev = ""
+    run = 0
+    longest = 0
+    ascii_bits = _ASCII_BITS
+    for c in password:
+        o = ord(c)
+        mask |= ascii_bits[o] if o < 128 else _non_ascii_bits(c)
+        if c == prev:
+            run += 1
+        else:
+            if run:
+                runs.append((prev, run))
+            prev, run = c, 1
+        if run > longest:
+            longest = run
+    if run:
+        runs.append((prev, run))
+
+    lower = password.lower()
+    return PasswordAnalysis(
+        password=password,
+        length=len(password),
+        lower=lower,
+        normalized=lower.translate(_LEET),
+        class_mask=mask,
+        runs=tuple(runs),
+        longest_run=longest,
+    )
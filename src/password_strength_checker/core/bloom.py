@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+
+# Serialized layout (little-endian):
+#   magic (8 bytes) | m bits (u64) | k hashes (u64) | n items (u64)
+#   | source size (u64) | source mtime_ns (u64) | bit array (ceil(m / 8) bytes)
+# The source stamp ties a sidecar to the dictionary file it was built from: a filter over
+# another (e.g. rebuilt) dictionary would give silent false negatives for exact matches.
+MAGIC = b"PSCBLOM2"
+_HEADER = struct.Struct("<8sQQQQQ")
+
+BLOOM_SUFFIX = ".bloom"
+DEFAULT_FP_RATE = 0.001
+
+
+def optimal_size(n: int, fp_rate: float) -> tuple[int, int]:
+    """(m bits, k hashes) for n items at the requested false-positive rate."""
+    if not 0 < fp_rate < 1:
+        raise ValueError("fp_rate must be in (0, 1)")
+    n = max(n, 1)
+    m = max(8, math.ceil(-n * math.log(fp_rate) / (math.log(2) ** 2)))
+    k = max(1, round(m / n * math.log(2)))
+    return m, k
+
+
+def source_stamp(path: Path) -> tuple[int, int]:
+    """(size, mtime_ns) of a dictionary file, as recorded in the filters built from it."""
+    st = path.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+def _hashes(word: str) -> tuple[int, int]:
+    digest = hashlib.blake2b(word.encode("utf-8"), digest_size=16).digest()
+    h1, h2 = struct.unpack("<QQ", digest)
+    return h1, h2 | 1
+
+
+class BloomFilter:
+    """
+    Probabilistic set membership: no false negatives, ~fp_rate false positives.
+    Used as a cheap prefilter in front of exact dictionary lookups.
+    """
+
+    def __init__(
+        self,
+        bits: bytearray | mmap.mmap,
+        m: int,
+        k: int,
+        n: int,
+        offset: int = 0,
+        source: tuple[int, int] | None = None,
+    ) -> None:
+        self._bits = bits
+        self._offset = offset
+        self.m = m
+        self.k = k
+        self.n = n
+        # source_stamp() of the dictionary the filter was built from (None: unknown)
+        self.source = source
+
+    @classmethod
+    def empty(cls, n: int, fp_rate: float = DEFAULT_FP_RATE) -> "BloomFilter":
+        m, k = optimal_size(n, fp_rate)
+        return cls(bytearray((m + 7) // 8), m, k, 0)
+
+    @classmethod
+    def build(cls, words: Iterable[str], n: int, fp_rate: float = DEFAULT_FP_RATE) -> "BloomFilter":
+        bf = cls.empty(n, fp_rate)
+        for w in words:
+            bf.add(w)
+        return bf
+
+    def add(self, word: str) -> None:
+        if not isinstance(self._bits, bytearray):
+            raise TypeError("Mapped bloom filters are read-only")
+        h1, h2 = _hashes(word)
+        for i in range(self.k):
+            bit = (h1 + i * h2) % self.m
+            self._bits[bit >> 3] |= 1 << (bit & 7)
+        self.n += 1
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        h1, h2 = _hashes(word)
+        bits, off, m = self._bits, self._offset, self.m
+        for i in range(self.k):
+            bit = (h1 + i * h2) % m
+            if not bits[off + (bit >> 3)] & (1 << (bit & 7)):
+                return False
+        return True
+
+    def matches_source(self, path: Path) -> bool:
+        try:
+            return self.source == source_stamp(path)
+        except OSError:
+            return False
+
+    def save(self, path: Path) -> None:
+        size, mtime_ns = self.source or (0, 0)
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as fh:
+            fh.write(_HEADER.pack(MAGIC, self.m, self.k, self.n, size, mtime_ns))
+            fh.write(self._bits[self._offset : self._offset + (self.m + 7) // 8])
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "BloomFilter":
+        """Open a serialized filter via mmap (shared through the page cache, no parsing)."""
+        with path.open("rb") as fh:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, m, k, n, size, mtime_ns = _HEADER.unpack_from(mm, 0)
+        except struct.error:
+            mm.close()
+            raise
+        if magic != MAGIC:
+            mm.close()
+            raise ValueError(f"Not a bloom filter file: {path}")
+        if len(mm) < _HEADER.size + (m + 7) // 8:
+            mm.close()
+            raise ValueError(f"Truncated bloom filter file: {path}")
+        source = (size, mtime_ns) if size or mtime_ns else None
+        return cls(mm, m, k, n, offset=_HEADER.size, source=source)
+
+    def close(self) -> None:
+        if isinstance(self._bits, mmap.mmap):
+            self._bits.close()
+
+
+def build_bloom_file(
+    words: Callable[[], Iterator[str]],
+    dst: Path,
+    fp_rate: float = DEFAULT_FP_RATE,
+    source: Path | None = None,
+) -> BloomFilter:
+    """
+    Two streaming passes over `words` (count, then fill) so huge corpora are never held in memory.
+    `source` is the dictionary file the words come from; its stamp is recorded in the header.
+    """
+    n = sum(1 for _ in words())
+    bf = BloomFilter.build(words(), n, fp_rate)
+    if source is not None:
+        bf.source = source_stamp(source)
+    bf.save(dst)
+    return bf
@@ -0,0 +1,142 @@
+"""
+Local "Have I Been Pwned"-style SHA-1 corpus, queried without loading it.
+
+Two layouts are supported, looked up by 5-hex-digit SHA-1 prefix (k-anonymity range):
+
+- a directory of range files `ABCDE.txt` whose lines are `SUFFIX35:COUNT`
+  (what the HIBP range downloader produces);
+- one hash-ordered file of `SHA1:COUNT` lines plus a `.idx` sidecar built with
+  `psc dict hibp-index`, holding the byte offset of every prefix (16**5 + 1 u64).
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+PREFIX_LEN = 5
+N_PREFIXES = 16**PREFIX_LEN
+INDEX_SUFFIX = ".idx"
+DEFAULT_BUCKET_CACHE = 256
+
+_OFFSET = struct.Struct("<Q")
+
+Bucket = tuple[list[str], list[int]]
+
+
+def sha1_hex(password: str) -> str:
+    return hashlib.sha1(password.encode("utf-8", "surrogatepass")).hexdigest().upper()
+
+
+def _parse_bucket(data: bytes, strip: int) -> Bucket:
+    # Lines are sorted by hash; `strip` drops the prefix when lines carry the full hash
+    suffixes: list[str] = []
+    counts: list[int] = []
+    for line in data.splitlines():
+        h, _, c = line.partition(b":")
+        if not h:
+            continue
+        suffixes.append(h[strip:].decode("ascii").upper())
+        counts.append(int(c or 0))
+    return suffixes, counts
+
+
+def build_hibp_index(path: Path) -> Path:
+    """
+    Write `<path>.idx`: start offset of each prefix in a hash-ordered SHA1:COUNT file.
+    Raises ValueError when the file is not sorted by hash (lookups would silently miss).
+    """
+    offsets = [0] * (N_PREFIXES + 1)
+    current = 0
+    pos = 0
+    prev = b""
+    with path.open("rb") as fh:
+        for lineno, line in enumerate(fh, 1):
+            if len(line) >= PREFIX_LEN and line[:1] != b"#":
+                h = line.partition(b":")[0].strip().upper()
+                if h < prev:
+                    raise ValueError(f"{path}:{lineno}: not sorted by hash (sort the file first)")
+                prev = h
+                p = int(line[:PREFIX_LEN], 16)
+                # prefixes without hashes start where the next present prefix starts
+                while current <= p:
+                    offsets[current] = pos
+                    current += 1
+            pos += len(line)
+    while current <= N_PREFIXES:
+        offsets[current] = pos
+        current += 1
+
+    idx = path.with_name(path.name + INDEX_SUFFIX)
+    tmp = idx.with_name(idx.name + ".tmp")
+    with tmp.open("wb") as out:
+        out.write(struct.pack(f"<{N_PREFIXES + 1}Q", *offsets))
+    os.replace(tmp, idx)
+    return idx
+
+
+class PwnedCorpus:
+    """Breach counts by SHA-1, reading one prefix bucket at a time (hot buckets kept in an LRU)."""
+
+    def __init__(self, path: Path, cache_size: int = DEFAULT_BUCKET_CACHE) -> None:
+        self.path = path
+        self._cache: OrderedDict[str, Bucket] = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self._mm: mmap.mmap | None = None
+        self._index: mmap.mmap | None = None
+        if path.is_file():
+            idx = path.with_name(path.name + INDEX_SUFFIX)
+            if not idx.exists():
+                raise FileNotFoundError(f"Missing index {idx} (run: psc dict hibp-index {path})")
+            with path.open("rb") as fh:
+                self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            with idx.open("rb") as fh:
+                self._index = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        elif not path.is_dir():
+            raise FileNotFoundError(path)
+
+    def _read_bucket(self, prefix: str) -> Bucket:
+        if self._mm is None:
+            try:
+                data = (self.path / f"{prefix}.txt").read_bytes()
+            except FileNotFoundError:
+                return [], []
+            return _parse_bucket(data, 0)
+
+        assert self._index is not None
+        i = int(prefix, 16)
+        start = _OFFSET.unpack_from(self._index, i * _OFFSET.size)[0]
+        end = _OFFSET.unpack_from(self._index, (i + 1) * _OFFSET.size)[0]
+        return _parse_bucket(self._mm[start:end], PREFIX_LEN)
+
+    def bucket(self, prefix: str) -> Bucket:
+        with self._lock:
+            b = self._cache.get(prefix)
+            if b is not None:
+                self._cache.move_to_end(prefix)
+                return b
+        b = self._read_bucket(prefix)
+        with self._lock:
+            self._cache[prefix] = b
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return b
+
+    def count_hash(self, digest: str) -> int:
+        suffixes, counts = self.bucket(digest[:PREFIX_LEN])
+        suffix = digest[PREFIX_LEN:]
+        i = bisect.bisect_left(suffixes, suffix)
+        if i < len(suffixes) and suffixes[i] == suffix:
+            return counts[i]
+        return 0
+
+    def count(self, password: str) -> int:
+        """How many times the password appears in the corpus (0 = not found)."""
+        return self.count_hash(sha1_hex(password))
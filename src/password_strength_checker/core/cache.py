@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from password_strength_checker.core.models import Result
+
+DEFAULT_MAXSIZE = 1024
+DEFAULT_TTL = 300.0
+
+
+class ResultCache:
+    """
+    Bounded LRU + TTL cache of evaluation results.
+
+    Keys are HMAC-SHA256(secret, policy fingerprint | dictionary version | mode | password):
+    the plaintext password is never stored, and the per-process random secret keeps keys
+    useless outside this process. When an evaluator reports a new dictionary version for a
+    policy, every entry is dropped.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: float | None = DEFAULT_TTL,
+        secret: bytes | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._secret = secret if secret is not None else os.urandom(32)
+        self._clock = clock
+        self._entries: OrderedDict[bytes, tuple[float, Result]] = OrderedDict()
+        # policy fingerprint -> dictionary version last seen with it
+        self._sources: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def key(self, password: str, policy_fingerprint: str, dictionary_version: str, mode: str = "") -> bytes:
+        msg = "\0".join((policy_fingerprint, dictionary_version, mode, password)).encode("utf-8", "surrogatepass")
+        return hmac.new(self._secret, msg, hashlib.sha256).digest()
+
+    def observe_sources(self, policy_fingerprint: str, dictionary_version: str) -> None:
+        """Drop everything when the dictionary behind a policy changed since last seen."""
+        with self._lock:
+            seen = self._sources.get(policy_fingerprint)
+            if seen is not None and seen != dictionary_version:
+                self._clear_locked()
+            self._sources[policy_fingerprint] = dictionary_version
+
+    def get(self, key: bytes) -> Result | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, result = entry
+            if self.ttl is not None and self._clock() - stored_at > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: bytes, result: Result) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self) -> None:
+        """Explicitly drop every entry (e.g. after loading a new policy or dictionary)."""
+        with self._lock:
+            self._clear_locked()
+            self._sources.clear()
+
+    def _clear_locked(self) -> None:
+        self._entries.clear()
+        self.invalidations += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
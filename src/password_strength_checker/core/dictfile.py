@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+# Compiled dictionary layout (little-endian):
+#   magic (8 bytes) | count (u64) | max_len (u64) | offsets ((count + 1) x u64) | utf-8 words
+# Words are lowercased, de-duplicated and sorted by their utf-8 bytes, so lookups are a
+# binary search directly over the mapped file: nothing is parsed or copied at open time.
+MAGIC = b"PSCDICT1"
+_HEADER = struct.Struct("<8sQQ")
+_OFFSET = struct.Struct("<Q")
+
+COMPILED_SUFFIX = ".pscd"
+
+
+def read_word_list(path: Path) -> Iterator[str]:
+    """Words from a common_passwords.txt-style file (one per line, '#' comments)."""
+    with path.open("r", encoding="utf-8", errors="ignore") as fh:
+        for line in fh:
+            w = line.strip().lower()
+            if w and not w.startswith("#"):
+                yield w
+
+
+def is_compiled_dictionary(path: Path) -> bool:
+    try:
+        with path.open("rb") as fh:
+            return fh.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def write_compiled_dictionary(words: Iterable[str], dst: Path) -> int:
+    encoded = sorted({w.encode("utf-8") for w in words if w})
+    max_len = max((len(w.decode("utf-8")) for w in encoded), default=0)
+
+    tmp = dst.with_name(dst.name + ".tmp")
+    with tmp.open("wb") as fh:
+        fh.write(_HEADER.pack(MAGIC, len(encoded), max_len))
+        off = 0
+        fh.write(_OFFSET.pack(off))
+        for w in encoded:
+            off += len(w)
+            fh.write(_OFFSET.pack(off))
+        for w in encoded:
+            fh.write(w)
+    os.replace(tmp, dst)
+    return len(encoded)
+
+
+def compile_dictionary(src: Path, dst: Path) -> int:
+    """Compile a text word list into the binary format. Returns the number of words."""
+    return write_compiled_dictionary(read_word_list(src), dst)
+
+
+class MappedDictionary:
+    """
+    Read-only, memory-mapped view of a compiled dictionary.
+    Pages are shared through the OS page cache between every process opening the same file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count, max_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"Not a compiled dictionary: {path}")
+        self._count: int = count
+        self.max_len: int = max_len
+        self._offsets = _HEADER.size
+        self._data = self._offsets + (count + 1) * _OFFSET.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _word_bytes(self, i: int) -> bytes:
+        start, end = struct.unpack_from("<QQ", self._mm, self._offsets + i * _OFFSET.size)
+        return self._mm[self._data + start : self._data + end]
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        key = word.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            w = self._word_bytes(mid)
+            if w < key:
+                lo = mid + 1
+            elif w > key:
+                hi = mid
+            else:
+                return True
+        return False
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._word_bytes(i).decode("utf-8")
+
+    def close(self) -> None:
+        self._mm.close()
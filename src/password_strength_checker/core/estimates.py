@@ -1,8 +1,15 @@
 from __future__ import annotations
-from password_strength_checker.core.models import Finding
 
+import datetime
 import math
+import re
+from collections.abc import Collection, Sequence
 from dataclasses import dataclass
+from itertools import pairwise
+from typing import Any, Protocol
+
+from password_strength_checker.core.analysis import DIGIT, LOWER, OTHER, UPPER, PasswordAnalysis, analyze
+from password_strength_checker.core.models import Finding
 
 
 @dataclass(frozen=True)
@@ -11,6 +18,9 @@ class CrackScenario:
     guesses_per_second: float
 
 
+# Keeps guesses/seconds finite floats (JSON has no inf)
+MAX_LOG10_GUESSES = 300.0
+
 DEFAULT_SCENARIOS = [
     CrackScenario("Online (throttled ~10/s)", 10.0),
     CrackScenario("Online (unthrottled ~1k/s)", 1_000.0),
@@ -37,16 +47,38 @@ def _format_seconds(seconds: float) -> str:
     return "~1000y+"
 
 
-def estimate_keyspace(password: str) -> int:
+def log10_keyspace(password: str, analysis: PasswordAnalysis | None = None) -> float:
+    """
+    log10 of estimate_keyspace(): O(1) with an analysis, no big integers whatever the length.
+    Classes always come from analyze() over the whole password, so both paths agree.
+    """
+    if analysis is None:
+        analysis = analyze(password)
+    alphabet = alphabet_size(analysis.has(LOWER), analysis.has(UPPER), analysis.has(DIGIT), analysis.has(OTHER))
+    return analysis.length * math.log10(alphabet)
+
+
+def estimate_keyspace(password: str, analysis: PasswordAnalysis | None = None) -> int:
     """
     Keyspace approximation based on character classes present.
     This is intentionally conservative and later penalized by findings/patterns.
+    Exact (big) integer: the evaluation pipeline uses log10_keyspace() instead.
     """
+    if analysis is not None:
+        alphabet = alphabet_size(
+            analysis.has(LOWER), analysis.has(UPPER), analysis.has(DIGIT), analysis.has(OTHER)
+        )
+        return int(alphabet ** analysis.length)
+
     has_lower = any(c.islower() for c in password)
     has_upper = any(c.isupper() for c in password)
     has_digit = any(c.isdigit() for c in password)
     has_other = any((not c.isalnum()) for c in password)
 
+    return int(alphabet_size(has_lower, has_upper, has_digit, has_other) ** len(password))
+
+
+def alphabet_size(has_lower: bool, has_upper: bool, has_digit: bool, has_other: bool) -> int:
     alphabet = 0
     if has_lower:
         alphabet += 26
@@ -61,26 +93,29 @@ def estimate_keyspace(password: str) -> int:
     if alphabet <= 1:
         alphabet = 1
 
-    return int(alphabet ** len(password))
+    return alphabet
 
 
-def estimate_times(password: str, score: int, findings: list[Finding], scenarios=DEFAULT_SCENARIOS) -> list[dict[str, str]]:
+def estimate_times(
+    password: str,
+    score: int,
+    findings: list[Finding],
+    scenarios: Sequence[CrackScenario] = DEFAULT_SCENARIOS,
+    log_keyspace: float | None = None,
+) -> list[dict[str, object]]:
     """
     Convert score + keyspace into rough crack-time estimates.
     We use a conservative adjustment factor based on score.
+    `log_keyspace` (log10) may be passed in when already computed (batch engine).
     """
-    keyspace = estimate_keyspace(password)
+    log_guesses = effective_log10_guesses(password, score, findings, log_keyspace)
+    if log_guesses < 15:
+        # exactly representable: keep the integer guess count of the linear formula
+        effective = float(max(1, math.floor(10**log_guesses)))
+    else:
+        effective = 10**log_guesses
 
-    # Score-based factor (rough)
-    factor = 10 ** ((score - 100) / 20)
-
-    # Findings-based multiplier (patterns/dictionary)
-    mult = effective_space_multiplier(findings)
-
-    effective = max(1, int(keyspace * factor * mult))
-
-
-    out: list[dict[str, str]] = []
+    out: list[dict[str, object]] = []
     for s in scenarios:
         seconds = effective / s.guesses_per_second
         out.append(
@@ -94,6 +129,26 @@ def estimate_times(password: str, score: int, findings: list[Finding], scenarios
 
     return out
 
+
+def effective_log10_guesses(
+    password: str,
+    score: int,
+    findings: list[Finding],
+    log_keyspace: float | None = None,
+) -> float:
+    """log10 of the guesses behind estimate_times(), capped at MAX_LOG10_GUESSES."""
+    if log_keyspace is None:
+        log_keyspace = log10_keyspace(password)
+
+    # Score-based factor (rough): 10 ** ((score - 100) / 20)
+    log_factor = (score - 100) / 20
+
+    # Findings-based multiplier (patterns/dictionary)
+    log_mult = math.log10(effective_space_multiplier(findings))
+
+    return min(max(0.0, log_keyspace + log_factor + log_mult), MAX_LOG10_GUESSES)
+
+
 def effective_space_multiplier(findings: list[Finding]) -> float:
     """
     If common patterns are detected, attackers don't brute-force the whole space.
@@ -103,8 +158,8 @@ def effective_space_multiplier(findings: list[Finding]) -> float:
 
     mult = 1.0
 
-    # Dictionary hits are devastating
-    if "DICT_EXACT" in codes:
+    # Dictionary / breach-corpus hits are devastating
+    if "DICT_EXACT" in codes or "BREACHED" in codes:
         mult *= 1e-12
     elif "DICT_CONTAINS" in codes:
         mult *= 1e-8
@@ -119,3 +174,340 @@ def effective_space_multiplier(findings: list[Finding]) -> float:
 
     # clamp
     return max(mult, 1e-15)
+
+
+# ---------------------------------------------------------------------------
+# Guess-count estimator (zxcvbn-style): cover the password with the cheapest
+# sequence of patterns, guesses = n! * prod(match guesses) + D^(n-1) for n matches.
+# ---------------------------------------------------------------------------
+
+BRUTEFORCE_CARDINALITY = 10
+MIN_SUBMATCH_GUESSES_SINGLE_CHAR = 10
+MIN_SUBMATCH_GUESSES_MULTI_CHAR = 50
+MIN_GUESSES_BEFORE_GROWING_SEQUENCE = 10_000
+MIN_YEAR_SPACE = 20
+# Only this many leading characters are decomposed; the rest counts as brute force
+MAX_DECOMPOSE_LEN = 128
+
+_DATE_SEP = re.compile(r"(\d{1,4})([-/._ ])(\d{1,2})\2(\d{1,4})")
+_DATE_NOSEP = re.compile(r"\d{4,8}")
+
+
+# Characters a date token is made of: only spans of 4+ of them are tried
+_DATE_SPAN = re.compile(r"[\d\-/._ ]{4,}")
+
+
+class _Dictionary(Protocol):
+    words: Collection[str]
+
+    def exact_in(self, analysis: PasswordAnalysis) -> bool: ...
+
+    def contained_in(self, analysis: PasswordAnalysis) -> list[tuple[int, str]]: ...
+
+
+@dataclass(frozen=True)
+class PatternMatch:
+    pattern: str  # "dictionary" | "sequence" | "repeat" | "date" | "bruteforce"
+    start: int
+    end: int  # exclusive
+    token: str
+    log10_guesses: float
+
+    def to_dict(self) -> dict[str, Any]:
+        # Never the token: it is a piece of the password (the whole of it for brute force)
+        return {
+            "pattern": self.pattern,
+            "i": self.start,
+            "j": self.end - 1,  # inclusive
+            "guesses": float(f"{10 ** min(self.log10_guesses, MAX_LOG10_GUESSES):.3g}"),
+        }
+
+
+@dataclass(frozen=True)
+class GuessEstimate:
+    log10_guesses: float
+    matches: tuple[PatternMatch, ...]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"log10": round(self.log10_guesses, 3), "matches": [m.to_dict() for m in self.matches]}
+
+
+def _log10_nck(n: int, k: int) -> float:
+    return math.log10(math.comb(n, k))
+
+
+def _log10_sum(a: float, b: float) -> float:
+    hi, lo = max(a, b), min(a, b)
+    return hi + math.log10(1 + 10 ** (lo - hi))
+
+
+def _uppercase_variations(token: str) -> float:
+    if token.islower() or not any(c.isalpha() for c in token):
+        return 0.0
+    alpha = [c for c in token if c.isalpha()]
+    if token[0].isupper() and all(not c.isupper() for c in token[1:]):
+        return math.log10(2)
+    if token[-1].isupper() and all(not c.isupper() for c in token[:-1]):
+        return math.log10(2)
+    if all(c.isupper() for c in alpha):
+        return math.log10(2)
+    upper = sum(1 for c in alpha if c.isupper())
+    lower = len(alpha) - upper
+    return math.log10(sum(math.comb(upper + lower, i) for i in range(1, min(upper, lower) + 1)))
+
+
+def _char_cardinality(c: str) -> int:
+    if c.isdigit():
+        return 10
+    if c.isalpha():
+        return 26
+    return 33
+
+
+def _min_submatch(log10_guesses: float, length: int) -> float:
+    floor = MIN_SUBMATCH_GUESSES_SINGLE_CHAR if length == 1 else MIN_SUBMATCH_GUESSES_MULTI_CHAR
+    return max(log10_guesses, math.log10(floor))
+
+
+def _lower_offsets(password: str) -> list[int]:
+    """Index in `password` of each character of password.lower(), plus the end."""
+    # str.lower() can expand a character ('İ' -> 'i̇'): offsets into analysis.lower/normalized
+    # are then past the matching password positions
+    pos = [i for i, c in enumerate(password) for _ in c.lower()]
+    pos.append(len(password))
+    return pos
+
+
+def _span(pos: list[int] | None, start: int, end: int) -> tuple[int, int]:
+    # [start, end) in analysis.lower -> [start, end) in the password
+    if pos is None:
+        return start, end
+    return pos[start], pos[end - 1] + 1
+
+
+def _dictionary_matches(
+    password: str, analysis: PasswordAnalysis, dictionary: _Dictionary, pos: list[int] | None = None
+) -> list[PatternMatch]:
+    norm = analysis.normalized
+    # No ranks in our word lists: a word costs half the list on average
+    base = math.log10(max(len(dictionary.words) / 2, 1))
+    hits = list(dictionary.contained_in(analysis))
+    if dictionary.exact_in(analysis) and (0, norm) not in hits:
+        hits.append((0, norm))
+    out: list[PatternMatch] = []
+    for at, word in hits:
+        start, end = _span(pos, at, at + len(word))
+        token = password[start:end]
+        # leet: each substituted character doubles the guesses
+        subs = sum(1 for a, b in zip(analysis.lower[at : at + len(word)], word) if a != b)
+        g = base + _uppercase_variations(token) + subs * math.log10(2)
+        out.append(PatternMatch("dictionary", start, end, token, g))
+    return out
+
+
+def _sequence_matches(password: str, analysis: PasswordAnalysis, pos: list[int] | None = None) -> list[PatternMatch]:
+    from password_strength_checker.core.rules.sequences import analysis_runs
+
+    out: list[PatternMatch] = []
+    for run in analysis_runs(analysis):
+        if run.length < 3:
+            continue
+        start, end = _span(pos, run.start, run.start + run.length)
+        token = password[start:end]
+        if run.kind == "keyboard":
+            base = 26
+        elif token[0] in "aAzZ019":
+            base = 4
+        else:
+            base = 10 if run.kind == "digit" else 26
+        g = math.log10(base * run.length * (2 if run.direction == "desc" else 1))
+        out.append(PatternMatch("sequence", start, end, token, g))
+    return out
+
+
+def _repeat_matches(analysis: PasswordAnalysis) -> list[PatternMatch]:
+    out: list[PatternMatch] = []
+    pos = 0
+    for ch, n in analysis.runs:
+        if n >= 3:
+            g = math.log10(_char_cardinality(ch) * n)
+            out.append(PatternMatch("repeat", pos, pos + n, ch * n, g))
+        pos += n
+    return out
+
+
+def _year_space(year: int) -> float:
+    return math.log10(max(abs(year - datetime.date.today().year), MIN_YEAR_SPACE))
+
+
+def _as_year(y: str) -> int | None:
+    if len(y) == 2:
+        v = int(y)
+        return 2000 + v if v <= 50 else 1900 + v
+    if len(y) == 4 and 1900 <= int(y) <= 2099:
+        return int(y)
+    return None
+
+
+def _valid_day_month(a: int, b: int) -> bool:
+    return (1 <= a <= 31 and 1 <= b <= 12) or (1 <= b <= 31 and 1 <= a <= 12)
+
+
+def _date_for(token: str) -> float | None:
+    """log10 guesses when token reads as a date (or a lone year), else None."""
+    m = _DATE_SEP.fullmatch(token)
+    if m is not None:
+        first, _, mid, last = m.groups()
+        for y, d in ((last, first), (first, last)):
+            year = _as_year(y)
+            if year is not None and len(d) <= 2 and _valid_day_month(int(d), int(mid)):
+                return _year_space(year) + math.log10(365 * 4)
+        return None
+    if not _DATE_NOSEP.fullmatch(token):
+        return None
+    if len(token) == 4:
+        year = _as_year(token)
+        if year is not None:
+            return _year_space(year)
+    for ylen in (4, 2):
+        for y, rest in ((token[-ylen:], token[:-ylen]), (token[:ylen], token[ylen:])):
+            year = _as_year(y)
+            if year is None or not 2 <= len(rest) <= 4:
+                continue
+            for cut in range(1, len(rest)):
+                a, b = rest[:cut], rest[cut:]
+                if len(a) <= 2 and len(b) <= 2 and _valid_day_month(int(a), int(b)):
+                    return _year_space(year) + math.log10(365)
+    return None
+
+
+def _date_matches(password: str) -> list[PatternMatch]:
+    out: list[PatternMatch] = []
+    for span in _DATE_SPAN.finditer(password):
+        lo, hi = span.span()
+        for i in range(lo, hi - 3):
+            if not password[i].isdigit():
+                continue
+            for j in range(i + 4, min(hi, i + 10) + 1):
+                token = password[i:j]
+                g = _date_for(token)
+                if g is not None:
+                    out.append(PatternMatch("date", i, j, token, g))
+    return out
+
+
+def _bruteforce(password: str, start: int, end: int) -> PatternMatch:
+    n = end - start
+    return PatternMatch(
+        "bruteforce", start, end, password[start:end], _min_submatch(n * math.log10(BRUTEFORCE_CARDINALITY), n)
+    )
+
+
+def _total_log10(count: int, log_product: float) -> float:
+    # count! * prod + D^(count-1): many small pieces are penalized
+    if count == 0:
+        return 0.0
+    return _log10_sum(
+        math.lgamma(count + 1) / math.log(10) + log_product,
+        (count - 1) * math.log10(MIN_GUESSES_BEFORE_GROWING_SEQUENCE),
+    )
+
+
+def estimate_guesses(
+    password: str,
+    analysis: PasswordAnalysis | None = None,
+    dictionary: _Dictionary | None = None,
+) -> GuessEstimate:
+    """
+    Minimum-guess decomposition of the password into dictionary / sequence / repeat / date
+    matches and brute-force gaps (dynamic programming over positions, Pareto-pruned on
+    the number of matches). Returns log10(guesses) and the chosen matches.
+    """
+    if not password:
+        return GuessEstimate(0.0, ())
+    head = password[:MAX_DECOMPOSE_LEN]
+    if analysis is None or len(head) != len(password):
+        analysis = analyze(head)
+    n = len(head)
+    pos = _lower_offsets(head) if len(analysis.lower) != n else None
+
+    # Dictionary hits and sequence runs are memoized on the analysis: the rules' scans are reused
+    candidates: list[PatternMatch] = []
+    if dictionary is not None:
+        candidates += _dictionary_matches(head, analysis, dictionary, pos)
+    candidates += _sequence_matches(head, analysis, pos)
+    candidates += _repeat_matches(analysis)
+    candidates += _date_matches(head)
+    by_start: dict[int, list[PatternMatch]] = {}
+    for m in candidates:
+        by_start.setdefault(m.start, []).append(m)
+    # Only match boundaries need states: between them the brute-force run just grows, so the
+    # DP jumps from one boundary to the next (backtracking merges brute force anyway)
+    stops = sorted({0, n, *by_start, *(m.end for m in candidates)})
+    next_stop = dict(pairwise(stops))
+
+    # states[k]: (match count, ends with brute force) -> (log10 product, previous state, match)
+    State = tuple[int, bool]
+    Entry = tuple[float, "tuple[int, State] | None", PatternMatch | None]
+    states: dict[int, dict[State, Entry]] = {k: {} for k in stops}
+    states[0][(0, False)] = (0.0, None, None)
+    bf_char = math.log10(BRUTEFORCE_CARDINALITY)
+
+    def offer(k: int, key: State, entry: Entry) -> None:
+        cur = states[k].get(key)
+        if cur is None or entry[0] < cur[0]:
+            states[k][key] = entry
+
+    for k in stops[:-1]:
+        kept = states[k]
+        if not kept:
+            continue
+        if len(kept) > 1:
+            # Pareto pruning: drop states beaten on both match count and product
+            frontier = sorted(kept.items(), key=lambda kv: (kv[0][0], not kv[0][1]))
+            kept = {}
+            best = math.inf
+            for key, entry in frontier:
+                if entry[0] < best:
+                    kept[key] = entry
+                    best = entry[0]
+            states[k] = kept
+
+        nxt = next_stop[k]
+        starting = by_start.get(k, ())
+        for (count, bf), (lp, _, _) in kept.items():
+            for m in starting:
+                g = _min_submatch(m.log10_guesses, m.end - m.start)
+                offer(m.end, (count + 1, False), (lp + g, (k, (count, bf)), m))
+            # brute force up to the next boundary (extends the current brute-force run)
+            offer(nxt, (count if bf else count + 1, True), (lp + (nxt - k) * bf_char, (k, (count, bf)), None))
+
+    total, end_key = min((_total_log10(key[0], lp), key) for key, (lp, _, _) in states[n].items())
+
+    # Backtrack, merging consecutive brute-force characters
+    parts: list[PatternMatch] = []
+    k, key = n, end_key
+    bf_end: int | None = None
+    while k > 0:
+        _, prev, match = states[k][key]
+        assert prev is not None
+        pk, pkey = prev
+        if match is None:
+            if bf_end is None:
+                bf_end = k
+        else:
+            if bf_end is not None:
+                parts.append(_bruteforce(head, k, bf_end))
+                bf_end = None
+            parts.append(match)
+        k, key = pk, pkey
+    if bf_end is not None:
+        parts.append(_bruteforce(head, 0, bf_end))
+    parts.reverse()
+
+    rest = len(password) - n
+    if rest:
+        # past the cap: plain brute force, one more match
+        parts.append(_bruteforce(password, n, len(password)))
+        total += rest * bf_char
+    return GuessEstimate(total, tuple(parts))
@@ -1,33 +1,45 @@
 from __future__ import annotations
 
-from importlib import resources
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
 
-from password_strength_checker.core.estimates import estimate_times
-from password_strength_checker.core.models import Policy, Result
-from password_strength_checker.core.rules.charset import CharsetRule
-from password_strength_checker.core.rules.dictionary import DictionaryRule
-from password_strength_checker.core.rules.length import LengthRule
-from password_strength_checker.core.rules.repeats import RepeatsRule
-from password_strength_checker.core.rules.sequences import SequencesRule
+from password_strength_checker.core.analysis import PasswordAnalysis, analyze
+from password_strength_checker.core.cache import ResultCache
+from password_strength_checker.core.estimates import (
+    effective_log10_guesses,
+    estimate_guesses,
+    estimate_times,
+    log10_keyspace,
+)
+from password_strength_checker.core.instrument import EvaluationStats, TimingHook
+from password_strength_checker.core.models import Finding, Policy, Result, Severity
+from password_strength_checker.core.policy import CompiledPolicy, compile_policy, policy_fingerprint
+from password_strength_checker.core.registry import RuleContext, RuleRegistry, default_registry
 from password_strength_checker.core.scoring import compute_score, label_for
 
+if TYPE_CHECKING:
+    from password_strength_checker.core.rules.dictionary import DictionaryRule
 
-def default_rules(data_dir: Path, policy: Policy) -> list[tuple[str, object]]:
-    common_path = data_dir / "common_passwords.txt"
-    rules: list[tuple[str, object]] = [
-        ("length", LengthRule()),
-        ("charset", CharsetRule()),
-        ("repeats", RepeatsRule()),
-        ("sequences", SequencesRule()),
-        ("dictionary", DictionaryRule.from_file(common_path)),
-    ]
+# Max number of warm evaluators kept around (one per distinct (data_dir, policy))
+MAX_CACHED_EVALUATORS = 8
+# How often cached evaluators re-check dictionary files for changes (seconds)
+STALE_CHECK_INTERVAL = 2.0
 
-    # If enabled_rules empty => everything enabled
-    if not policy.enabled_rules:
-        return rules
 
-    return [(name, rule) for name, rule in rules if policy.enabled_rules.get(name, True)]
+def default_rules(
+    data_dir: Path, policy: Policy, registry: RuleRegistry | None = None
+) -> list[tuple[str, object]]:
+    ctx = RuleContext(data_dir, policy)
+    specs = (registry or default_registry()).resolve(policy)
+    # Disabled rules are never imported nor instantiated
+    return [(spec.name, spec.create(ctx)) for spec in specs]
 
 
 def recommendations_from(result_score: int) -> list[str]:
@@ -47,31 +59,312 @@ def _default_data_dir_fallback() -> Path:
     return Path(__file__).resolve().parents[1] / "data"
 
 
+@lru_cache(maxsize=1)
 def _package_data_dir() -> Path:
-    # Works when data/ is included in the installed package / PyInstaller bundle
+    # Plain on-disk installs / PyInstaller bundles: no need to pay for importlib.resources
+    local = _default_data_dir_fallback()
+    if local.is_dir():
+        return local
+    # Works when data/ is included in the installed package (e.g. zipped)
     try:
+        from importlib import resources
+
         return Path(resources.files("password_strength_checker") / "data")
     except Exception:
-        return _default_data_dir_fallback()
+        return local
+
+
+class Evaluator:
+    """
+    Rule pipeline built once for a (data_dir, policy) pair.
+    Reuse it (or go through get_evaluator) to avoid reloading dictionaries per password.
+    """
+
+    def __init__(
+        self,
+        policy: Policy | CompiledPolicy = Policy(),
+        data_dir: Path | None = None,
+        instrument: bool = False,
+        hooks: Sequence[TimingHook] = (),
+        registry: RuleRegistry | None = None,
+    ) -> None:
+        self.compiled = compile_policy(policy)
+        policy = self.policy = self.compiled.policy
+        self.data_dir = data_dir if data_dir is not None else _package_data_dir()
+        self.fingerprint = self.compiled.fingerprint
+        self.dictionary_version = self._current_dictionary_version()
+        self._checked_at = time.monotonic()
+        # Opt-in timing: per-span stats on the evaluator + a `timings` block on each Result
+        self.stats: EvaluationStats | None = EvaluationStats(tuple(hooks)) if instrument or hooks else None
+
+        ctx = RuleContext(self.data_dir, policy, self.compiled)
+        self.rules: list[tuple[str, object]] = []
+        self.specs = (registry or default_registry()).resolve(self.compiled)
+        for spec in self.specs:
+            t0 = time.perf_counter()
+            self.rules.append((spec.name, spec.create(ctx)))
+            if self.stats is not None:
+                # "load:dictionary" is the dictionary load time
+                self.stats.record(f"load:{spec.name}", time.perf_counter() - t0)
+
+        # Short-circuit order: cheapest first. A rule is never cheaper than what it requires,
+        # and the sort is stable, so dependencies still run first.
+        effective: dict[str, int] = {}
+        for spec in self.specs:
+            effective[spec.name] = max([spec.cost, *(effective[d] for d in spec.requires)])
+        self.rules_by_cost = sorted(self.rules, key=lambda item: effective[item[0]])
+        # Word list reused by the guess estimator
+        self.dictionary = cast(
+            "DictionaryRule | None", next((rule for name, rule in self.rules if name == "dictionary"), None)
+        )
+
+    def _current_dictionary_version(self) -> str:
+        if self.policy.enabled_rules.get("dictionary", True) is False:
+            return "none"
+        from password_strength_checker.core.rules.dictionary import dictionary_version
+
+        return dictionary_version(self.data_dir)
+
+    def is_stale(self) -> bool:
+        """True when the dictionary files changed on disk since this evaluator was built."""
+        self._checked_at = time.monotonic()
+        return self._current_dictionary_version() != self.dictionary_version
+
+    def evaluate_cached(
+        self,
+        password: str,
+        cache: ResultCache,
+        short_circuit: bool = False,
+        compute: Callable[[str], Result] | None = None,
+    ) -> Result:
+        """`compute` produces misses instead of evaluate() (e.g. an IncrementalEvaluator)."""
+        cache.observe_sources(self.fingerprint, self.dictionary_version)
+        key = cache.key(password, self.fingerprint, self.dictionary_version, "sc" if short_circuit else "")
+        result = cache.get(key)
+        if result is None:
+            if compute is not None:
+                result = compute(password)
+            else:
+                result = self.evaluate(password, short_circuit=short_circuit)
+            cache.put(key, result)
+        return result
+
+    def evaluate(self, password: str, short_circuit: bool = False) -> Result:
+        """
+        short_circuit=True runs rules cheapest-first and stops at the first CRITICAL finding:
+        the Result is then partial (short_circuited=True, non-compliant, no estimates).
+        """
+        if self.stats is not None:
+            return self._evaluate_instrumented(password, self.stats, short_circuit)
+
+        # One scan of the password, shared by every rule and the keyspace estimate
+        analysis = analyze(password)
+        findings: list[Finding] = []
+        if short_circuit:
+            for i, (_, rule) in enumerate(self.rules_by_cost):
+                found = rule.check(password, self.policy, analysis)  # type: ignore[attr-defined]
+                findings.extend(found)
+                if _is_critical(found) and i < len(self.rules_by_cost) - 1:
+                    return self.build_result(password, findings, short_circuited=True)
+        else:
+            for _, rule in self.rules:
+                findings.extend(rule.check(password, self.policy, analysis))  # type: ignore[attr-defined]
+        return self.build_result(password, findings, log_keyspace=log10_keyspace(password, analysis), analysis=analysis)
+
+    def _evaluate_instrumented(self, password: str, stats: EvaluationStats, short_circuit: bool) -> Result:
+        timings: dict[str, float] = {}
+        clock = time.perf_counter
+        start = t0 = clock()
+
+        def lap(name: str) -> None:
+            nonlocal t0
+            t1 = clock()
+            timings[name] = t1 - t0
+            stats.record(name, t1 - t0)
+            t0 = t1
+
+        analysis = analyze(password)
+        lap("analyze")
+        findings: list[Finding] = []
+        rules = self.rules_by_cost if short_circuit else self.rules
+        stopped = False
+        for i, (name, rule) in enumerate(rules):
+            found = rule.check(password, self.policy, analysis)  # type: ignore[attr-defined]
+            findings.extend(found)
+            lap(f"rule:{name}")
+            if short_circuit and _is_critical(found) and i < len(rules) - 1:
+                stopped = True
+                break
+        if stopped:
+            result = self.build_result(password, findings, short_circuited=True)
+        else:
+            result = self.build_result(
+                password, findings, log_keyspace=log10_keyspace(password, analysis), analysis=analysis
+            )
+            lap("estimate")
+        total = clock() - start
+        stats.record("evaluate", total)
+        timings["evaluate"] = total
+
+        return replace(result, timings={k: round(v * 1e3, 4) for k, v in timings.items()})
+
+    def evaluate_batch(
+        self, passwords: Sequence[str], vectorized: bool = True, short_circuit: bool = False
+    ) -> list[Result]:
+        """
+        Evaluate a chunk of passwords. With NumPy installed (and vectorized=True), the
+        length/charset/repeats rules and the keyspace are computed for the whole chunk at once.
+        """
+        from password_strength_checker.core import vectorized as vec
+
+        if short_circuit or not (vectorized and vec.available()) or not passwords:
+            return [self.evaluate(pw, short_circuit) for pw in passwords]
+
+        measured = vec.measure(passwords)
+        out: list[Result] = []
+        for i, pw in enumerate(passwords):
+            pre = measured.findings(i, self.policy)
+            # the guess estimator needs one anyway; sharing it lets it reuse the rules' scans
+            analysis = analyze(pw)
+            findings: list[Finding] = []
+            for name, rule in self.rules:
+                if name in pre:
+                    findings.extend(pre[name])
+                else:
+                    findings.extend(rule.check(pw, self.policy, analysis))  # type: ignore[attr-defined]
+            out.append(
+                self.build_result(pw, findings, log_keyspace=measured.log10_keyspace(i), analysis=analysis)
+            )
+        return out
+
+    def build_result(
+        self,
+        password: str,
+        findings: list[Finding],
+        log_keyspace: float | None = None,
+        short_circuited: bool = False,
+        analysis: PasswordAnalysis | None = None,
+        guesses: dict[str, Any] | None = None,
+    ) -> Result:
+        """Score, estimates and guesses for `findings` (already computed for this evaluator's rules)."""
+        score = compute_score(password, findings)
+        label = label_for(score)
+        recs = recommendations_from(score)
+        # Partial results skip the estimates: callers only asked for compliance
+        if short_circuited:
+            estimates, log_guesses, guesses = [], None, None
+        else:
+            if log_keyspace is None:
+                log_keyspace = log10_keyspace(password, analysis)
+            estimates = estimate_times(password, score, findings, log_keyspace=log_keyspace)
+            log_guesses = round(effective_log10_guesses(password, score, findings, log_keyspace), 3)
+            # policy independent: evaluate_policies() computes it once for all policies
+            if guesses is None:
+                guesses = estimate_guesses(password, analysis, self.dictionary).to_dict()
+        violations = [f.code for f in findings if f.severity is Severity.CRITICAL]
+
+        return Result(
+            score=score,
+            label=label,
+            findings=findings,
+            recommendations=recs,
+            estimates=estimates,
+            compliant=not violations,
+            policy_violations=violations,
+            short_circuited=short_circuited,
+            log10_guesses=log_guesses,
+            guesses=guesses,
+        )
+
+
+def _is_critical(findings: list[Finding]) -> bool:
+    return any(f.severity is Severity.CRITICAL for f in findings)
+
+
+class EvaluatorCache:
+    """Warm evaluators by (data_dir, policy fingerprint), bounded LRU; stale ones are rebuilt."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._evaluators: OrderedDict[tuple[Path, str], Evaluator] = OrderedDict()
+        self._lock = threading.Lock()
+        _caches.append(self)
+
+    def get(self, policy: Policy | CompiledPolicy = Policy(), data_dir: Path | None = None) -> Evaluator:
+        if data_dir is None:
+            data_dir = _package_data_dir()
+        fingerprint = policy.fingerprint if isinstance(policy, CompiledPolicy) else policy_fingerprint(policy)
+        key = (data_dir, fingerprint)
+
+        with self._lock:
+            ev = self._evaluators.get(key)
+            if ev is not None:
+                self._evaluators.move_to_end(key)
+        if ev is not None:
+            if time.monotonic() - ev._checked_at < STALE_CHECK_INTERVAL or not ev.is_stale():
+                return ev
+
+        ev = Evaluator(policy, data_dir)
+        with self._lock:
+            self._evaluators[key] = ev
+            self._evaluators.move_to_end(key)
+            while len(self._evaluators) > self.maxsize:
+                self._evaluators.popitem(last=False)
+        return ev
+
+    def clear(self) -> None:
+        with self._lock:
+            self._evaluators.clear()
+
+
+_caches: list[EvaluatorCache] = []
+_evaluators = EvaluatorCache(MAX_CACHED_EVALUATORS)
+
+
+def get_evaluator(policy: Policy | CompiledPolicy = Policy(), data_dir: Path | None = None) -> Evaluator:
+    """Return a warm evaluator for (data_dir, policy), building it on first use (bounded LRU)."""
+    return _evaluators.get(policy, data_dir)
+
+
+def clear_evaluators() -> None:
+    for cache in _caches:
+        cache.clear()
+    from password_strength_checker.core.rules.dictionary import load_dictionary
+
+    load_dictionary.cache_clear()
 
 
-def evaluate(password: str, policy: Policy = Policy(), data_dir: Path | None = None) -> Result:
-    if data_dir is None:
-        data_dir = _package_data_dir()
+def evaluate(
+    password: str,
+    policy: Policy | CompiledPolicy = Policy(),
+    data_dir: Path | None = None,
+    short_circuit: bool = False,
+    cache: ResultCache | None = None,
+) -> Result:
+    ev = get_evaluator(policy, data_dir)
+    if cache is not None:
+        return ev.evaluate_cached(password, cache, short_circuit=short_circuit)
+    return ev.evaluate(password, short_circuit=short_circuit)
 
-    findings = []
-    for _, rule in default_rules(data_dir, policy):
-        findings.extend(rule.check(password, policy))
 
-    score = compute_score(password, findings)
-    label = label_for(score)
-    recs = recommendations_from(score)
-    estimates = estimate_times(password, score, findings)
+def evaluate_many(
+    passwords: Iterable[str],
+    policy: Policy | CompiledPolicy = Policy(),
+    data_dir: Path | None = None,
+    vectorized: bool = False,
+    chunk_size: int = 1024,
+    short_circuit: bool = False,
+) -> Iterator[Result]:
+    """
+    Lazily evaluate a stream of passwords with one warm evaluator (constant memory).
+    vectorized=True uses the NumPy batch engine on chunks of `chunk_size` when available.
+    """
+    ev = get_evaluator(policy, data_dir)
+    if not vectorized or short_circuit:
+        for pw in passwords:
+            yield ev.evaluate(pw, short_circuit=short_circuit)
+        return
 
-    return Result(
-        score=score,
-        label=label,
-        findings=findings,
-        recommendations=recs,
-        estimates=estimates,
-    )
+    it = iter(passwords)
+    while chunk := list(itertools.islice(it, chunk_size)):
+        yield from ev.evaluate_batch(chunk)
@@ -0,0 +1,172 @@
+"""
+Incremental evaluation for live (keystroke-by-keystroke) feedback.
+
+IncrementalEvaluator keeps, for every position of the password, the state the built-in
+rules reached after that character: class mask, repeat run, sequence runs in progress and
+dictionary automaton state (+ hits ending there). An edit at index i truncates that state
+to i and replays only the characters after it: typing at the end advances the rules by one
+character, whatever the dictionary size, instead of rescanning and re-matching everything.
+
+Building the Result is still O(n) per keystroke: result() assembles the analysis, the
+sorted sequence runs and dictionary hits, and runs the guess estimator (estimate_guesses)
+over the whole password. `psc bench` reports both paths (incremental[...] vs evaluate[...]).
+Results are identical to Evaluator.evaluate.
+"""
+
+from __future__ import annotations
+
+from password_strength_checker.core.analysis import PasswordAnalysis, class_bits, normalize
+from password_strength_checker.core.estimates import log10_keyspace
+from password_strength_checker.core.evaluate import Evaluator
+from password_strength_checker.core.measurements import Measurements, rule_findings
+from password_strength_checker.core.models import Finding, Result
+from password_strength_checker.core.rules.dictionary import DictionaryRule
+from password_strength_checker.core.rules.sequences import (
+    NO_RUNS,
+    RUNS_MEMO,
+    RunState,
+    SequenceRun,
+    advance_runs,
+    close_runs,
+)
+
+
+class IncrementalEvaluator:
+    """Evaluate a password being edited, reusing the per-position state of its unchanged prefix."""
+
+    def __init__(self, evaluator: Evaluator, password: str = "") -> None:
+        self.evaluator = evaluator
+        self._dictionary: DictionaryRule | None = next(
+            (r for _, r in evaluator.rules if isinstance(r, DictionaryRule)), None
+        )
+        self.password = ""
+        self._normalized = ""
+        # state after each position
+        self._mask: list[int] = []
+        self._run: list[int] = []
+        self._longest: list[int] = []
+        self._seq_active: list[RunState] = []
+        self._seq_closed: list[list[SequenceRun]] = []
+        self._ac_state: list[int] = []
+        self._hits: list[list[tuple[int, str]]] = []
+        if password:
+            self.append(password)
+
+    # ---- edits ----
+
+    def append(self, text: str) -> Result:
+        return self.replace(len(self.password), 0, text)
+
+    def delete(self, index: int, count: int = 1) -> Result:
+        return self.replace(index, count, "")
+
+    def replace(self, index: int, count: int, text: str) -> Result:
+        """Replace password[index:index + count] with text (insert: count=0, delete: text="")."""
+        if not 0 <= index <= len(self.password) or count < 0:
+            raise IndexError(index)
+        tail = text + self.password[index + count :]
+        self._truncate(index)
+        self._extend(tail)
+        return self.result()
+
+    def set_password(self, password: str) -> Result:
+        """Diff against the current password (common prefix) and apply the edit."""
+        old = self.password
+        i = 0
+        n = min(len(old), len(password))
+        while i < n and old[i] == password[i]:
+            i += 1
+        return self.replace(i, len(old) - i, password[i:])
+
+    # ---- state ----
+
+    def _truncate(self, k: int) -> None:
+        self.password = self.password[:k]
+        self._normalized = self._normalized[:k]
+        for buf in (
+            self._mask,
+            self._run,
+            self._longest,
+            self._seq_active,
+            self._seq_closed,
+            self._ac_state,
+            self._hits,
+        ):
+            del buf[k:]
+
+    def _extend(self, text: str) -> None:
+        dictionary = self._dictionary
+        start = len(self.password)
+        # One concatenation per edit (not per character: a paste would be quadratic)
+        self.password += text
+        # per-character normalisation == analyze() for ASCII (result() falls back otherwise)
+        self._normalized += "".join(normalize(ch)[:1] for ch in text)
+        for i in range(start, len(self.password)):
+            ch = self.password[i]
+            b = class_bits(ch)
+
+            if i == 0:
+                self._mask.append(b)
+                self._run.append(1)
+                self._longest.append(1)
+                self._seq_active.append(NO_RUNS)
+                self._seq_closed.append([])
+            else:
+                self._mask.append(self._mask[-1] | b)
+                run = self._run[-1] + 1 if self.password[i - 1] == ch else 1
+                self._run.append(run)
+                self._longest.append(max(self._longest[-1], run))
+                active, closed = advance_runs(self._seq_active[-1], self.password[i - 1].lower(), ch.lower(), i)
+                self._seq_active.append(active)
+                self._seq_closed.append(closed)
+
+            if dictionary is not None:
+                state, hits = dictionary.advance(self._ac_state[-1] if i else 0, self._normalized, i)
+                self._ac_state.append(state)
+                self._hits.append(hits)
+
+    def _analysis(self) -> PasswordAnalysis:
+        pw = self.password
+        runs: list[tuple[str, int]] = []
+        for i, r in enumerate(self._run):
+            if i + 1 == len(pw) or self._run[i + 1] == 1:
+                runs.append((pw[i], r))
+        return PasswordAnalysis(
+            password=pw,
+            length=len(pw),
+            lower=pw.lower(),
+            normalized=self._normalized,
+            class_mask=self._mask[-1] if pw else 0,
+            runs=tuple(runs),
+            longest_run=self._longest[-1] if pw else 0,
+        )
+
+    # ---- result ----
+
+    def result(self) -> Result:
+        ev = self.evaluator
+        pw = self.password
+        if not pw.isascii():
+            # str.lower() is context dependent outside ASCII (final sigma, dotted I, ...)
+            return ev.evaluate(pw)
+
+        analysis = self._analysis()
+        runs = [r for closed in self._seq_closed for r in closed]
+        if pw:
+            runs.extend(close_runs(self._seq_active[-1], len(pw) - 1))
+        runs.sort()
+        # what the rules and estimate_guesses() would scan for, already tracked per position
+        analysis.memo[RUNS_MEMO] = runs
+        dictionary = self._dictionary
+        exact = False
+        hits: list[tuple[int, str]] = []
+        if dictionary is not None:
+            exact = dictionary.is_exact(analysis.normalized)
+            hits = sorted((h for at in self._hits for h in at), key=lambda m: (m[0], -len(m[1])))
+            dictionary.remember(analysis, exact, hits)
+        m = Measurements(analysis, runs, dictionary, exact, () if exact else tuple(hits))
+        findings: list[Finding] = []
+        for _, rule in ev.rules:
+            findings.extend(rule_findings(rule, pw, ev.policy, m))
+        log_keyspace = log10_keyspace(pw, analysis)
+        return ev.build_result(pw, findings, log_keyspace=log_keyspace, analysis=analysis)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
+# Hook signature: (span name, duration in seconds). Names used by the evaluator:
+#   "load:<rule>" (rule construction, e.g. dictionary load), "analyze", "rule:<rule>",
+#   "estimate", "evaluate"
+TimingHook = Callable[[str, float], None]
+
+
+@dataclass
+class TimingStat:
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+class EvaluationStats:
+    """Cumulative per-span wall-clock timings of an instrumented evaluator (thread-safe)."""
+
+    def __init__(self, hooks: tuple[TimingHook, ...] = ()) -> None:
+        self.hooks = hooks
+        self.spans: dict[str, TimingStat] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            stat = self.spans.get(name)
+            if stat is None:
+                stat = self.spans[name] = TimingStat()
+            stat.calls += 1
+            stat.total += seconds
+            stat.max = max(stat.max, seconds)
+        for hook in self.hooks:
+            hook(name, seconds)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {
+                name: {
+                    "calls": s.calls,
+                    "total_ms": s.total * 1e3,
+                    "mean_ms": s.mean * 1e3,
+                    "max_ms": s.max * 1e3,
+                }
+                for name, s in self.spans.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.spans.clear()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+
+class AhoCorasick:
+    """
+    Multi-pattern substring matcher (Aho-Corasick automaton).
+    Built once from a word list; scanning a text is linear in its length (+ number of matches).
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        # state 0 is the root
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # word ending exactly at this state (or None)
+        self._word: list[str | None] = [None]
+        # nearest state on the fail chain that ends a word ("dictionary suffix link")
+        self._out: list[int] = [0]
+
+        for w in words:
+            if w:
+                self._insert(w)
+        self._build_links()
+
+    def __len__(self) -> int:
+        return sum(1 for w in self._word if w is not None)
+
+    def _insert(self, word: str) -> None:
+        state = 0
+        for ch in word:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._word.append(None)
+                self._out.append(0)
+                self._goto[state][ch] = nxt
+            state = nxt
+        self._word[state] = word
+
+    def _build_links(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                fs = self._fail[nxt]
+                self._out[nxt] = fs if self._word[fs] is not None else self._out[fs]
+                queue.append(nxt)
+
+    def step(self, state: int, ch: str) -> int:
+        """Advance the automaton by one character."""
+        goto = self._goto
+        while state and ch not in goto[state]:
+            state = self._fail[state]
+        return goto[state].get(ch, 0)
+
+    def words_at(self, state: int) -> Iterator[str]:
+        """Every word ending at `state` (longest first)."""
+        w = self._word[state]
+        if w is not None:
+            yield w
+        s = self._out[state]
+        while s:
+            w = self._word[s]
+            if w is not None:
+                yield w
+            s = self._out[s]
+
+    def finditer(self, text: str) -> Iterator[tuple[int, str]]:
+        """Yield (start, word) for every occurrence of every word in text."""
+        state = 0
+        for i, ch in enumerate(text):
+            state = self.step(state, ch)
+            if state:
+                for w in self.words_at(state):
+                    yield i - len(w) + 1, w
@@ -0,0 +1,147 @@
+"""
+Policy-independent measurements of a password, and the built-in rules as threshold checks on them.
+
+The built-in rules only differ between policies by their thresholds (min_length,
+max_repeated_run, forbid_sequences_len, ...). Measuring once (length, classes, longest run,
+sequence runs, dictionary matches) turns "one password x N policies" into one analysis plus
+N cheap threshold checks: see evaluate_policies().
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, overload
+
+from password_strength_checker.core.analysis import PasswordAnalysis, analyze
+from password_strength_checker.core.estimates import estimate_guesses, log10_keyspace
+from password_strength_checker.core.evaluate import EvaluatorCache
+from password_strength_checker.core.models import Finding, Policy, Result
+from password_strength_checker.core.policy import CompiledPolicy
+from password_strength_checker.core.rules.charset import CharsetRule, charset_findings
+from password_strength_checker.core.rules.dictionary import DictionaryRule, dictionary_findings
+from password_strength_checker.core.rules.length import LengthRule, length_findings
+from password_strength_checker.core.rules.repeats import RepeatsRule, repeat_findings
+from password_strength_checker.core.rules.sequences import (
+    SequenceRun,
+    SequencesRule,
+    analysis_runs,
+    sequence_findings,
+)
+
+# Warm evaluators for evaluate_policies(), kept apart from get_evaluator()'s LRU: more
+# policies than it holds would evict its entries and get rebuilt on every call
+MAX_POLICY_EVALUATORS = 256
+_policy_evaluators = EvaluatorCache(MAX_POLICY_EVALUATORS)
+
+
+@dataclass(frozen=True)
+class Measurements:
+    analysis: PasswordAnalysis
+    # every run of 2+ characters; policies pick theirs with forbid_sequences_len
+    sequence_runs: list[SequenceRun]
+    # the dictionary rule the two fields below were measured with
+    dictionary: DictionaryRule | None = None
+    dictionary_exact: bool = False
+    # (start, word), sorted by start, longest first
+    dictionary_matches: tuple[tuple[int, str], ...] = ()
+
+
+def measure(
+    password: str,
+    analysis: PasswordAnalysis | None = None,
+    dictionary: DictionaryRule | None = None,
+) -> Measurements:
+    if analysis is None:
+        analysis = analyze(password)
+    exact = False
+    matches: tuple[tuple[int, str], ...] = ()
+    if dictionary is not None:
+        exact = dictionary.exact_in(analysis)
+        if not exact:
+            matches = tuple(dictionary.contained_in(analysis))
+    # memoized on the analysis: estimate_guesses() reuses the runs and hits
+    return Measurements(analysis, analysis_runs(analysis), dictionary, exact, matches)
+
+
+def rule_findings(rule: object, password: str, policy: Policy, m: Measurements) -> list[Finding]:
+    """Findings of one pipeline rule: thresholds on `m` for built-in rules, else rule.check()."""
+    a = m.analysis
+    if isinstance(rule, LengthRule):
+        return length_findings(a.length, policy)
+    if isinstance(rule, CharsetRule):
+        return charset_findings(a.classes)
+    if isinstance(rule, RepeatsRule):
+        return repeat_findings(a.longest_run, policy)
+    if isinstance(rule, SequencesRule):
+        return sequence_findings(m.sequence_runs, policy)
+    if rule is m.dictionary and m.dictionary is not None:
+        if not policy.forbid_dictionary:
+            return []
+        return dictionary_findings(m.dictionary_exact, list(m.dictionary_matches))
+    found: list[Finding] = rule.check(password, policy, a)  # type: ignore[attr-defined]
+    return found
+
+
+@overload
+def evaluate_policies(
+    password: str,
+    policies: Mapping[str, Policy | CompiledPolicy],
+    data_dir: Path | None = None,
+) -> dict[str, Result]: ...
+
+
+@overload
+def evaluate_policies(
+    password: str,
+    policies: Sequence[Policy | CompiledPolicy],
+    data_dir: Path | None = None,
+) -> list[Result]: ...
+
+
+def evaluate_policies(
+    password: str,
+    policies: Sequence[Policy | CompiledPolicy] | Mapping[str, Policy | CompiledPolicy],
+    data_dir: Path | None = None,
+) -> list[Result] | dict[str, Result]:
+    """
+    Evaluate one password under many policies: measurements, keyspace and guess estimate are
+    computed once, then each policy only applies its thresholds (same Results as evaluate()).
+    A mapping of policies gives a mapping of results.
+    """
+    if isinstance(policies, Mapping):
+        keys: list[str] = list(policies)
+        values = [policies[k] for k in keys]
+    else:
+        values = list(policies)
+    analysis = analyze(password)
+    log_keyspace = log10_keyspace(password, analysis)
+    # per dictionary rule object (evaluators over the same data_dir share it)
+    measured: dict[int, Measurements] = {}
+    guesses: dict[int, dict[str, Any]] = {}
+
+    results: list[Result] = []
+    for policy in values:
+        ev = _policy_evaluators.get(policy, data_dir)
+        dictionary = ev.dictionary
+        m = measured.get(id(dictionary))
+        if m is None:
+            m = measured[id(dictionary)] = measure(password, analysis, dictionary)
+            guesses[id(dictionary)] = estimate_guesses(password, analysis, dictionary).to_dict()
+        findings: list[Finding] = []
+        for _, rule in ev.rules:
+            findings.extend(rule_findings(rule, password, ev.policy, m))
+        results.append(
+            ev.build_result(
+                password,
+                findings,
+                log_keyspace=log_keyspace,
+                analysis=analysis,
+                guesses=guesses[id(dictionary)],
+            )
+        )
+
+    if isinstance(policies, Mapping):
+        return dict(zip(keys, results))
+    return results
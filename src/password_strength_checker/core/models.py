@@ -32,12 +32,25 @@ class Result:
     compliant: bool = True
     policy_violations: list[str] = field(default_factory=list)
 
+    # Set by short-circuit evaluation: stopped at the first CRITICAL finding (partial findings)
+    short_circuited: bool = False
+
+    # Per-span durations in ms, only set by instrumented evaluators
+    timings: dict[str, float] | None = None
+
+    # log10 of the guesses behind `estimates` (None when short-circuited)
+    log10_guesses: float | None = None
+
+    # Minimum-guess decomposition (estimates.estimate_guesses): {"log10", "matches"}
+    guesses: dict[str, Any] | None = None
+
     def to_dict(self) -> dict[str, Any]:
-        return {
+        d: dict[str, Any] = {
             "score": self.score,
             "label": self.label,
             "compliant": self.compliant,
             "policy_violations": self.policy_violations,
+            "short_circuited": self.short_circuited,
             "findings": [
                 {
                     "code": f.code,
@@ -51,6 +64,13 @@ class Result:
             "recommendations": self.recommendations,
             "estimates": self.estimates,
         }
+        if self.log10_guesses is not None:
+            d["log10_guesses"] = self.log10_guesses
+        if self.guesses is not None:
+            d["guesses"] = self.guesses
+        if self.timings is not None:
+            d["timings"] = self.timings
+        return d
 
 
 
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import itertools
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import TypeVar
+
+from password_strength_checker.core.evaluate import Evaluator, get_evaluator
+from password_strength_checker.core.models import Policy, Result
+from password_strength_checker.core.policy import CompiledPolicy
+
+K = TypeVar("K")
+
+DEFAULT_CHUNK_SIZE = 512
+
+# Per-process evaluator, built once by the pool initializer (never pickled per task).
+# Compiled .pscd / .bloom dictionaries are mmap'ed, so workers share their pages.
+_worker_evaluator: Evaluator | None = None
+_worker_options: dict[str, bool] = {}
+
+
+def _init_worker(policy: Policy | CompiledPolicy, data_dir: Path | None, options: dict[str, bool]) -> None:
+    global _worker_evaluator, _worker_options
+    _worker_evaluator = get_evaluator(policy, data_dir)
+    _worker_options = options
+
+
+def _evaluate_chunk(chunk: list[tuple[K, str]]) -> list[tuple[K, Result]]:
+    ev = _worker_evaluator
+    assert ev is not None, "worker not initialized"
+    results = ev.evaluate_batch([pw for _, pw in chunk], **_worker_options)
+    return [(key, r) for (key, _), r in zip(chunk, results)]
+
+
+def _chunks(items: Iterable[tuple[K, str]], size: int) -> Iterator[list[tuple[K, str]]]:
+    it = iter(items)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+def evaluate_many_parallel(
+    items: Iterable[tuple[K, str]],
+    policy: Policy | CompiledPolicy = Policy(),
+    data_dir: Path | None = None,
+    workers: int = 2,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ordered: bool = True,
+    vectorized: bool = False,
+    short_circuit: bool = False,
+) -> Iterator[tuple[K, Result]]:
+    """
+    Evaluate (key, password) pairs across a process pool, yielding (key, Result).
+
+    Input is consumed lazily: at most 2 * workers chunks are in flight at any time.
+    ordered=False yields chunks as soon as they complete (higher throughput, any order).
+    vectorized=True runs each chunk through the NumPy batch engine when available.
+    short_circuit=True stops each evaluation at its first CRITICAL finding.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    max_pending = workers * 2
+    chunks = _chunks(items, chunk_size)
+
+    options = {"vectorized": vectorized, "short_circuit": short_circuit}
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(policy, data_dir, options)
+    ) as pool:
+        if ordered:
+            queue: deque[Future[list[tuple[K, Result]]]] = deque()
+            for chunk in chunks:
+                queue.append(pool.submit(_evaluate_chunk, chunk))
+                if len(queue) >= max_pending:
+                    yield from queue.popleft().result()
+            while queue:
+                yield from queue.popleft().result()
+        else:
+            pending: set[Future[list[tuple[K, Result]]]] = set()
+            for chunk in chunks:
+                pending.add(pool.submit(_evaluate_chunk, chunk))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        yield from fut.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    yield from fut.result()
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+import hashlib
 import json
-from dataclasses import replace
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
+from typing import Any
 
+from password_strength_checker.core.matching import AhoCorasick
 from password_strength_checker.core.models import Policy
 
+# Past this many banned words, one automaton pass beats a substring test per word
+BANNED_AUTOMATON_MIN = 8
+DEFAULT_WATCH_INTERVAL = 2.0
+
 
 def load_policy(path: Path) -> Policy:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    return policy_from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+def policy_from_dict(data: dict[str, Any]) -> Policy:
     # on garde seulement les champs connus
     allowed = {
     "min_length",
@@ -22,3 +34,161 @@ def load_policy(path: Path) -> Policy:
     }
     cleaned = {k: v for k, v in data.items() if k in allowed}
     return replace(Policy(), **cleaned)
+
+
+def policy_fingerprint(policy: Policy) -> str:
+    # Stable identity for a policy (Policy holds lists/dicts, so it is not hashable itself)
+    payload = json.dumps(asdict(policy), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class BannedWords:
+    """Policy banned words, normalised once (strip + lower) and matched against a lowercased password."""
+
+    __slots__ = ("words", "_matcher")
+
+    def __init__(self, words: Iterable[str]) -> None:
+        # (normalised, as written in the policy)
+        self.words: tuple[tuple[str, str], ...] = tuple((w.strip().lower(), w) for w in words if w.strip())
+        self._matcher = AhoCorasick(n for n, _ in self.words) if len(self.words) >= BANNED_AUTOMATON_MIN else None
+
+    def __bool__(self) -> bool:
+        return bool(self.words)
+
+    def first_match(self, lower: str) -> str | None:
+        """First banned word (policy order) contained in `lower`, as written in the policy."""
+        if self._matcher is not None:
+            found = {w for _, w in self._matcher.finditer(lower)}
+            if not found:
+                return None
+            return next(orig for norm, orig in self.words if norm in found)
+        for norm, orig in self.words:
+            if norm in lower:
+                return orig
+        return None
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledPolicy:
+    """
+    A Policy prepared once: private copy of its fields, stable fingerprint, banned-word matcher
+    and disabled-rule set. Immutable and hashable (by fingerprint), so it can key caches.
+    """
+
+    policy: Policy
+    fingerprint: str
+    banned: BannedWords
+    disabled_rules: frozenset[str]
+
+    def rule_enabled(self, name: str, default: bool = True) -> bool:
+        # Used by RuleRegistry.resolve(); `default`: the rule's RuleSpec.default_enabled,
+        # for rules the policy doesn't mention
+        if name in self.disabled_rules:
+            return False
+        return self.policy.enabled_rules.get(name, default)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CompiledPolicy) and other.fingerprint == self.fingerprint
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
+
+
+def compile_policy(policy: Policy | CompiledPolicy) -> CompiledPolicy:
+    if isinstance(policy, CompiledPolicy):
+        return policy
+    # Copy the mutable fields: later edits to the caller's lists must not leak in
+    policy = replace(policy, banned_words=list(policy.banned_words), enabled_rules=dict(policy.enabled_rules))
+    return CompiledPolicy(
+        policy=policy,
+        fingerprint=policy_fingerprint(policy),
+        banned=BannedWords(policy.banned_words),
+        disabled_rules=frozenset(name for name, on in policy.enabled_rules.items() if not on),
+    )
+
+
+def load_compiled_policy(path: Path) -> CompiledPolicy:
+    return compile_policy(load_policy(path))
+
+
+class PolicyWatcher:
+    """
+    Polls a policy.json and swaps in the newly compiled policy when the file changes.
+    Subscribers get the new CompiledPolicy; whoever is evaluating with the old one finishes
+    with it. An unreadable/invalid file keeps the current policy (see `error`); a subscriber
+    that raises doesn't stop the others or the watcher thread (see `callback_errors`).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        interval: float = DEFAULT_WATCH_INTERVAL,
+        on_change: Callable[[CompiledPolicy], None] | None = None,
+    ) -> None:
+        self.path = path
+        self.interval = interval
+        self.error: str | None = None
+        # errors raised by subscribers during the last swap, one entry per failing callback
+        self.callback_errors: list[str] = []
+        self._callbacks: list[Callable[[CompiledPolicy], None]] = [on_change] if on_change else []
+        self._stamp = self._stat()
+        self.policy = load_compiled_policy(path)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def subscribe(self, callback: Callable[[CompiledPolicy], None]) -> None:
+        self._callbacks.append(callback)
+
+    def poll(self) -> bool:
+        """Reload if the file changed; True when a different policy was swapped in."""
+        stamp = self._stat()
+        if stamp is None or stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        try:
+            compiled = load_compiled_policy(self.path)
+        except (OSError, ValueError, TypeError) as e:
+            # typically a half-written file: the next change retries
+            self.error = str(e)
+            return False
+        self.error = None
+        if compiled == self.policy:
+            return False
+        self.policy = compiled
+        errors = []
+        for callback in self._callbacks:
+            try:
+                callback(compiled)
+            except Exception as e:
+                name = getattr(callback, "__qualname__", repr(callback))
+                errors.append(f"{name}: {type(e).__name__}: {e}")
+        self.callback_errors = errors
+        return True
+
+    def start(self) -> "PolicyWatcher":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="psc-policy-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                # e.g. valid JSON that isn't an object: keep watching, report it like a parse error
+                self.error = f"{type(e).__name__}: {e}"
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
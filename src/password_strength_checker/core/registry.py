@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import importlib
+import os
+import threading
+import warnings
+from dataclasses import dataclass, replace
+from enum import IntEnum
+from pathlib import Path
+from typing import Any
+
+from password_strength_checker.core.models import Policy
+from password_strength_checker.core.policy import CompiledPolicy, compile_policy
+
+# Third-party packages register rules under this entry-point group, e.g. in pyproject.toml:
+#   [project.entry-points."password_strength_checker.rules"]
+#   acme_names = "acme_psc.rules:AcmeNamesRule"
+# The target is either a RuleSpec or a rule class/factory (optional `cost` / `requires` attributes).
+# Discovery scans every installed distribution, so it is opt-in: PSC_PLUGINS=1 or load_plugins().
+ENTRY_POINT_GROUP = "password_strength_checker.rules"
+PLUGINS_ENV = "PSC_PLUGINS"
+
+
+class Cost(IntEnum):
+    """Relative cost of a rule, used to order short-circuit evaluation (cheapest first)."""
+
+    TRIVIAL = 0  # O(1) / single attribute of the analysis
+    LINEAR = 1  # one pass over the password
+    LOOKUP = 2  # dictionary / index lookups
+    IO = 3  # may touch the disk
+
+
+@dataclass(frozen=True)
+class RuleContext:
+    """What a rule factory gets to build its instance (resources are looked up in data_dir)."""
+
+    data_dir: Path
+    policy: Policy
+    # Set by evaluators: pre-normalised policy data rules may reuse
+    compiled: CompiledPolicy | None = None
+
+
+@dataclass(frozen=True)
+class RuleSpec:
+    name: str
+    # "module:attribute", imported on first use so disabled rules cost nothing at startup
+    target: str
+    cost: Cost = Cost.LINEAR
+    # rules that must run before this one (and must be enabled)
+    requires: tuple[str, ...] = ()
+    # whether the rule runs when the policy's enabled_rules does not mention it
+    default_enabled: bool = True
+
+    def load(self) -> Any:
+        module, _, attr = self.target.partition(":")
+        obj = importlib.import_module(module)
+        for part in attr.split("."):
+            obj = getattr(obj, part)
+        return obj
+
+    def create(self, ctx: RuleContext) -> Any:
+        """Instantiate the rule: `target.from_context(ctx)` when defined, else `target()`."""
+        factory = self.load()
+        from_context = getattr(factory, "from_context", None)
+        if from_context is not None:
+            return from_context(ctx)
+        return factory()
+
+
+_RULES = "password_strength_checker.core.rules"
+
+# Built-in pipeline, in evaluation order
+BUILTIN_RULES: tuple[RuleSpec, ...] = (
+    RuleSpec("length", f"{_RULES}.length:LengthRule", Cost.TRIVIAL),
+    RuleSpec("charset", f"{_RULES}.charset:CharsetRule", Cost.TRIVIAL),
+    RuleSpec("repeats", f"{_RULES}.repeats:RepeatsRule", Cost.TRIVIAL),
+    RuleSpec("sequences", f"{_RULES}.sequences:SequencesRule", Cost.LINEAR),
+    RuleSpec("dictionary", f"{_RULES}.dictionary:DictionaryRule", Cost.LOOKUP),
+    RuleSpec("banned", f"{_RULES}.banned:BannedWordsRule", Cost.LINEAR),
+    # third-party corpus: only when the policy sets enabled_rules["breached"] = true
+    RuleSpec("breached", f"{_RULES}.breached:BreachedPasswordRule", Cost.IO, default_enabled=False),
+)
+
+
+class RuleRegistry:
+    """Known rules by name, in registration order. Thread-safe."""
+
+    def __init__(self, specs: tuple[RuleSpec, ...] = ()) -> None:
+        self._specs: dict[str, RuleSpec] = {}
+        self._lock = threading.Lock()
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: RuleSpec, replace_existing: bool = False) -> None:
+        with self._lock:
+            if spec.name in self._specs and not replace_existing:
+                raise ValueError(f"Rule already registered: {spec.name!r}")
+            self._specs[spec.name] = spec
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._specs.pop(name, None)
+
+    def get(self, name: str) -> RuleSpec | None:
+        return self._specs.get(name)
+
+    def specs(self) -> list[RuleSpec]:
+        with self._lock:
+            return list(self._specs.values())
+
+    def load_entry_points(self, group: str = ENTRY_POINT_GROUP) -> None:
+        """Register rules advertised by installed distributions (nothing is imported yet)."""
+        from importlib.metadata import entry_points
+
+        for ep in entry_points(group=group):
+            if ep.name in self._specs:
+                warnings.warn(f"Ignoring entry point rule {ep.name!r}: name already registered", stacklevel=2)
+                continue
+            self.register(_EntryPointSpec(ep.name, ep.value))
+
+    def resolve(self, policy: Policy | CompiledPolicy) -> list[RuleSpec]:
+        """
+        Enabled rules for `policy` in evaluation order: registration order, adjusted so
+        each rule runs after the rules it requires.
+        """
+        compiled = compile_policy(policy)
+        # Rules not mentioned in enabled_rules use their spec's default
+        enabled = [_materialize(s) for s in self.specs() if compiled.rule_enabled(s.name, s.default_enabled)]
+        by_name = {s.name: s for s in enabled}
+
+        ordered: list[RuleSpec] = []
+        state: dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(spec: RuleSpec) -> None:
+            if state.get(spec.name) == 2:
+                return
+            if state.get(spec.name) == 1:
+                raise ValueError(f"Dependency cycle involving rule {spec.name!r}")
+            state[spec.name] = 1
+            for dep in spec.requires:
+                if dep not in by_name:
+                    raise ValueError(f"Rule {spec.name!r} requires {dep!r}, which is disabled or unknown")
+                visit(by_name[dep])
+            state[spec.name] = 2
+            ordered.append(spec)
+
+        for spec in enabled:
+            visit(spec)
+        return ordered
+
+
+class _EntryPointSpec(RuleSpec):
+    """Entry-point rule whose cost/requires are only known once its target is imported."""
+
+
+def _materialize(spec: RuleSpec) -> RuleSpec:
+    if not isinstance(spec, _EntryPointSpec):
+        return spec
+    obj = spec.load()
+    if isinstance(obj, RuleSpec):
+        return replace(obj, name=spec.name)
+    return RuleSpec(
+        spec.name,
+        spec.target,
+        Cost(getattr(obj, "cost", Cost.LINEAR)),
+        tuple(getattr(obj, "requires", ())),
+    )
+
+
+_default_registry: RuleRegistry | None = None
+_plugins_loaded = False
+_default_lock = threading.Lock()
+
+
+def plugins_enabled() -> bool:
+    return os.environ.get(PLUGINS_ENV, "") not in ("", "0")
+
+
+def default_registry() -> RuleRegistry:
+    """Built-in rules, plus installed entry-point rules when plugins are enabled."""
+    global _default_registry, _plugins_loaded
+    with _default_lock:
+        if _default_registry is None:
+            _default_registry = RuleRegistry(BUILTIN_RULES)
+        if not _plugins_loaded and plugins_enabled():
+            _default_registry.load_entry_points()
+            _plugins_loaded = True
+        return _default_registry
+
+
+def load_plugins() -> None:
+    """
+    Opt in to entry-point rules for this process and the worker processes it starts
+    (affects evaluators built afterwards).
+    """
+    os.environ[PLUGINS_ENV] = "1"
+    default_registry()
+
+
+def register_rule(spec: RuleSpec, replace_existing: bool = False) -> None:
+    """Register an in-process rule in the default registry (affects evaluators built afterwards)."""
+    default_registry().register(spec, replace_existing)
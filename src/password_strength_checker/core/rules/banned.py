@@ -1,25 +1,43 @@
 from __future__ import annotations
 
+from password_strength_checker.core.analysis import PasswordAnalysis
 from password_strength_checker.core.models import Finding, Policy, Severity
+from password_strength_checker.core.policy import BannedWords
+from password_strength_checker.core.registry import RuleContext
 from password_strength_checker.core.rules.base import AbstractRule
 
 
+def banned_findings(word: str | None) -> list[Finding]:
+    if word is None:
+        return []
+    return [
+        Finding(
+            "BANNED_WORD",
+            f"Contient un mot interdit par la policy: '{word}'.",
+            Severity.CRITICAL,
+            penalty=-40,
+            meta={"word": word},
+        )
+    ]
+
+
 class BannedWordsRule(AbstractRule):
-    def check(self, password: str, policy: Policy) -> list[Finding]:
+    def __init__(self, banned: BannedWords | None = None) -> None:
+        # Pre-normalised words of the evaluator's policy (None: normalise per call)
+        self.banned = banned
+
+    @classmethod
+    def from_context(cls, ctx: RuleContext) -> "BannedWordsRule":
+        if ctx.compiled is not None:
+            return cls(ctx.compiled.banned)
+        return cls(BannedWords(ctx.policy.banned_words))
+
+    def check(
+        self, password: str, policy: Policy, analysis: PasswordAnalysis | None = None
+    ) -> list[Finding]:
         if not policy.banned_words:
             return []
 
-        pw_lower = password.lower()
-        for w in policy.banned_words:
-            ww = w.strip().lower()
-            if ww and ww in pw_lower:
-                return [
-                    Finding(
-                        "BANNED_WORD",
-                        f"Contient un mot interdit par la policy: '{w}'.",
-                        Severity.CRITICAL,
-                        penalty=-40,
-                        meta={"word": w},
-                    )
-                ]
-        return []
+        banned = self.banned if self.banned is not None else BannedWords(policy.banned_words)
+        pw_lower = analysis.lower if analysis is not None else password.lower()
+        return banned_findings(banned.first_match(pw_lower))
@@ -3,14 +3,21 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Protocol
 
+from password_strength_checker.core.analysis import PasswordAnalysis
 from password_strength_checker.core.models import Finding, Policy
 
 
 class Rule(Protocol):
-    def check(self, password: str, policy: Policy) -> list[Finding]: ...
+    def check(
+        self, password: str, policy: Policy, analysis: PasswordAnalysis | None = None
+    ) -> list[Finding]: ...
 
 
 class AbstractRule(ABC):
+    # `analysis` is the shared single-pass scan built by the evaluator;
+    # rules called directly (analysis=None) derive what they need themselves.
     @abstractmethod
-    def check(self, password: str, policy: Policy) -> list[Finding]:
+    def check(
+        self, password: str, policy: Policy, analysis: PasswordAnalysis | None = None
+    ) -> list[Finding]:
         raise NotImplementedError
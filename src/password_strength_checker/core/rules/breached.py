@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+
+from password_strength_checker.core.analysis import PasswordAnalysis
+from password_strength_checker.core.breach import PwnedCorpus
+from password_strength_checker.core.models import Finding, Policy, Severity
+from password_strength_checker.core.registry import RuleContext
+from password_strength_checker.core.rules.base import AbstractRule
+
+# Looked up in data_dir, in this order
+CORPUS_DIR = "pwned"
+CORPUS_FILE = "pwned-passwords.txt"
+
+
+def corpus_path(data_dir: Path) -> Path | None:
+    for name in (CORPUS_DIR, CORPUS_FILE):
+        p = data_dir / name
+        if p.exists():
+            return p
+    return None
+
+
+@lru_cache(maxsize=4)
+def open_corpus(path: Path) -> PwnedCorpus:
+    # One mapping (and bucket LRU) per corpus, shared by every evaluator/tenant using it
+    return PwnedCorpus(path)
+
+
+class BreachedPasswordRule(AbstractRule):
+    """Exact match against a local SHA-1 breach corpus (no-op when none is installed)."""
+
+    def __init__(self, corpus: PwnedCorpus | None) -> None:
+        self.corpus = corpus
+
+    @classmethod
+    def from_context(cls, ctx: RuleContext) -> "BreachedPasswordRule":
+        path = corpus_path(ctx.data_dir)
+        return cls(open_corpus(path) if path is not None else None)
+
+    def check(
+        self, password: str, policy: Policy, analysis: PasswordAnalysis | None = None
+    ) -> list[Finding]:
+        if self.corpus is None or not password:
+            return []
+
+        count = self.corpus.count(password)
+        if not count:
+            return []
+        return [
+            Finding(
+                "BREACHED",
+                f"Mot de passe présent dans des fuites de données ({count} fois).",
+                Severity.CRITICAL,
+                penalty=-45,
+                meta={"count": count},
+            )
+        ]
@@ -1,40 +1,197 @@
 from __future__ import annotations
 
+import struct
+from collections.abc import Collection
+from functools import lru_cache
 from pathlib import Path
 
+from password_strength_checker.core.analysis import PasswordAnalysis, normalize
+from password_strength_checker.core.bloom import BLOOM_SUFFIX, BloomFilter
+from password_strength_checker.core.dictfile import (
+    COMPILED_SUFFIX,
+    MappedDictionary,
+    is_compiled_dictionary,
+    read_word_list,
+)
+from password_strength_checker.core.matching import AhoCorasick
 from password_strength_checker.core.models import Finding, Policy, Severity
+from password_strength_checker.core.registry import RuleContext
 from password_strength_checker.core.rules.base import AbstractRule
 
 
-def _normalize(pw: str) -> str:
-    # normalisation simple + "leet-lite"
-    table = str.maketrans({"@": "a", "0": "o", "1": "l", "!": "i", "$": "s", "3": "e", "5": "s", "7": "t"})
-    return pw.lower().translate(table)
+# Shorter words are only matched exactly (too many false positives as substrings)
+CONTAINS_MIN_LEN = 5
 
 
 class DictionaryRule(AbstractRule):
-    def __init__(self, words: set[str]) -> None:
+    def __init__(self, words: Collection[str], prefilter: BloomFilter | None = None) -> None:
         self.words = words
+        # Optional bloom filter built from the same list: a miss skips the exact lookup
+        self.prefilter = prefilter
+        # In-memory word sets get an automaton; mapped dictionaries stay on disk and are probed
+        self._matcher: AhoCorasick | None = None
+        if not isinstance(words, MappedDictionary):
+            self._matcher = AhoCorasick(w for w in words if len(w) >= CONTAINS_MIN_LEN)
+
+    def find_contained(self, norm: str) -> list[tuple[int, str]]:
+        """All (start, word) dictionary hits inside an already-normalized password."""
+        if self._matcher is not None:
+            hits = list(self._matcher.finditer(norm))
+        else:
+            hits = self._probe_substrings(norm)
+        return sorted(hits, key=lambda m: (m[0], -len(m[1])))
+
+    def advance(self, state: int, norm: str, i: int) -> tuple[int, list[tuple[int, str]]]:
+        """
+        Match one more character norm[i], given the automaton state after norm[:i]:
+        returns the new state and the (start, word) hits ending at i.
+        """
+        if self._matcher is not None:
+            state = self._matcher.step(state, norm[i])
+            return state, [(i - len(w) + 1, w) for w in self._matcher.words_at(state)] if state else []
+
+        assert isinstance(self.words, MappedDictionary)
+        hits: list[tuple[int, str]] = []
+        for start in range(max(0, i + 1 - self.words.max_len), i + 2 - CONTAINS_MIN_LEN):
+            w = norm[start : i + 1]
+            if w in self.words:
+                hits.append((start, w))
+        return 0, hits
+
+    def _probe_substrings(self, norm: str) -> list[tuple[int, str]]:
+        # O(n * max_len) binary searches: fine for passwords, no word list in memory
+        assert isinstance(self.words, MappedDictionary)
+        n = len(norm)
+        max_len = self.words.max_len
+        hits: list[tuple[int, str]] = []
+        for i in range(n):
+            for j in range(i + CONTAINS_MIN_LEN, min(n, i + max_len) + 1):
+                w = norm[i:j]
+                if w in self.words:
+                    hits.append((i, w))
+        return hits
+
+    @classmethod
+    def from_context(cls, ctx: RuleContext) -> "DictionaryRule":
+        return load_dictionary(dictionary_path(ctx.data_dir), dictionary_version(ctx.data_dir))
 
     @classmethod
-    def from_file(cls, path: Path) -> "DictionaryRule":
-        words: set[str] = set()
-        if path.exists():
-            for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
-                w = line.strip().lower()
-                if w and not w.startswith("#"):
-                    words.add(w)
-        return cls(words)
-
-    def check(self, password: str, policy: Policy) -> list[Finding]:
+    def from_file(cls, path: Path, prefilter: Path | None = None) -> "DictionaryRule":
+        """Load a text word list, or open a compiled (.pscd) dictionary via mmap."""
+        bloom = _load_prefilter(prefilter, path) if prefilter is not None else None
+        if not path.exists():
+            return cls(set(), bloom)
+        if is_compiled_dictionary(path):
+            return cls(MappedDictionary(path), bloom)
+        return cls(set(read_word_list(path)), bloom)
+
+    def close(self) -> None:
+        """Release the mmaps of a compiled dictionary / bloom prefilter (no-op otherwise)."""
+        if isinstance(self.words, MappedDictionary):
+            self.words.close()
+        if self.prefilter is not None:
+            self.prefilter.close()
+
+    def is_exact(self, norm: str) -> bool:
+        if self.prefilter is not None and norm not in self.prefilter:
+            return False
+        return norm in self.words
+
+    # With an analysis, lookups are memoized on it (PasswordAnalysis.memo, keyed by this rule):
+    # the rule, the measurements and the guess estimator share one scan
+
+    def exact_in(self, analysis: PasswordAnalysis) -> bool:
+        key = (self, "exact")
+        exact: bool | None = analysis.memo.get(key)
+        if exact is None:
+            exact = analysis.memo[key] = self.is_exact(analysis.normalized)
+        return exact
+
+    def contained_in(self, analysis: PasswordAnalysis) -> list[tuple[int, str]]:
+        key = (self, "contained")
+        hits: list[tuple[int, str]] | None = analysis.memo.get(key)
+        if hits is None:
+            hits = analysis.memo[key] = self.find_contained(analysis.normalized)
+        return hits
+
+    def remember(self, analysis: PasswordAnalysis, exact: bool, contained: list[tuple[int, str]]) -> None:
+        """Record lookups already done elsewhere (incremental matching) on the analysis."""
+        analysis.memo[(self, "exact")] = exact
+        analysis.memo[(self, "contained")] = contained
+
+    def check(
+        self, password: str, policy: Policy, analysis: PasswordAnalysis | None = None
+    ) -> list[Finding]:
         if not policy.forbid_dictionary:
             return []
 
-        norm = _normalize(password)
+        if analysis is not None:
+            if self.exact_in(analysis):
+                return dictionary_findings(True, [])
+            return dictionary_findings(False, self.contained_in(analysis))
+        norm = normalize(password)
         # match exact or contained long word
-        if norm in self.words:
-            return [Finding("DICT_EXACT", "Mot de passe dans une liste de mots de passe courants.", Severity.CRITICAL, penalty=-35)]
-        for w in self.words:
-            if len(w) >= 5 and w in norm:
-                return [Finding("DICT_CONTAINS", f"Contient un mot courant: '{w}'.", Severity.WARNING, penalty=-20)]
-        return [Finding("DICT_OK", "Pas de mot courant détecté.", Severity.INFO, penalty=0)]
+        if self.is_exact(norm):
+            return dictionary_findings(True, [])
+        return dictionary_findings(False, self.find_contained(norm))
+
+
+def _load_prefilter(prefilter: Path, dictionary: Path) -> BloomFilter | None:
+    # Only trust a sidecar built from this very dictionary file (see bloom.source_stamp)
+    # (missing, unreadable, truncated or corrupt sidecars: load without the prefilter)
+    if not prefilter.exists():
+        return None
+    try:
+        bloom = BloomFilter.load(prefilter)
+    except (OSError, ValueError, struct.error):
+        return None
+    if not bloom.matches_source(dictionary):
+        bloom.close()
+        return None
+    return bloom
+
+
+def dictionary_findings(exact: bool, matches: list[tuple[int, str]]) -> list[Finding]:
+    """`matches` are (start, word) hits sorted by start, longest first."""
+    if exact:
+        return [Finding("DICT_EXACT", "Mot de passe dans une liste de mots de passe courants.", Severity.CRITICAL, penalty=-35)]
+    if matches:
+        w = matches[0][1]
+        return [
+            Finding(
+                "DICT_CONTAINS",
+                f"Contient un mot courant: '{w}'.",
+                Severity.WARNING,
+                penalty=-20,
+                meta={"matches": [{"word": m, "start": i, "end": i + len(m)} for i, m in matches]},
+            )
+        ]
+    return [Finding("DICT_OK", "Pas de mot courant détecté.", Severity.INFO, penalty=0)]
+
+
+def dictionary_path(data_dir: Path) -> Path:
+    # Prefer the compiled (mmap) dictionary when one was built with `psc dict compile`
+    compiled = data_dir / f"common_passwords{COMPILED_SUFFIX}"
+    if compiled.exists():
+        return compiled
+    return data_dir / "common_passwords.txt"
+
+
+def dictionary_version(data_dir: Path) -> str:
+    """Cheap change token (name, mtime, size) of the dictionary files used for data_dir."""
+    path = dictionary_path(data_dir)
+    parts = []
+    for p in (path, path.with_suffix(BLOOM_SUFFIX)):
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        parts.append(f"{p.name}:{st.st_mtime_ns}:{st.st_size}")
+    return "|".join(parts) or "none"
+
+
+@lru_cache(maxsize=8)
+def load_dictionary(path: Path, version: str = "") -> DictionaryRule:
+    # Parsed once per (path, version) and shared by every evaluator using the same data_dir.
+    # A sibling common_passwords.bloom (psc dict bloom) is used as exact-match prefilter.
+    return DictionaryRule.from_file(path, prefilter=path.with_suffix(BLOOM_SUFFIX))
@@ -1,44 +1,183 @@
 from __future__ import annotations
 
 import string
+from itertools import compress, count, pairwise
+from typing import NamedTuple
 
+from password_strength_checker.core.analysis import PasswordAnalysis
 from password_strength_checker.core.models import Finding, Policy, Severity
 from password_strength_checker.core.rules.base import AbstractRule
 
+# Letter rows of the keyboard layouts we consider (left to right)
+KEYBOARD_ROWS = {
+    "qwerty": ("qwertyuiop", "asdfghjkl", "zxcvbnm"),
+    "azerty": ("azertyuiop", "qsdfghjklm", "wxcvbn"),
+}
+
+
+def _build_pairs() -> dict[tuple[str, str], tuple[str, int, int]]:
+    # (previous char, char) -> (letter/digit kind, its step, keyboard step); steps are
+    # +1 ascending, -1 descending, 0 when the pair isn't a step of that kind
+    steps: dict[tuple[str, str], tuple[str, int]] = {}
+    for kind, pool in (("alpha", string.ascii_lowercase), ("digit", string.digits)):
+        for a, b in pairwise(pool):
+            steps[(a, b)] = (kind, 1)
+            steps[(b, a)] = (kind, -1)
+    keyboard: dict[tuple[str, str], int] = {}
+    for rows in KEYBOARD_ROWS.values():
+        for row in rows:
+            for a, b in pairwise(row):
+                keyboard.setdefault((a, b), 1)
+                keyboard.setdefault((b, a), -1)
+    return {
+        pair: (*steps.get(pair, ("", 0)), keyboard.get(pair, 0))
+        for pair in steps.keys() | keyboard.keys()
+    }
+
+
+_PAIRS = _build_pairs()
+
+
+class SequenceRun(NamedTuple):
+    start: int
+    length: int
+    direction: str  # "asc" | "desc"
+    kind: str  # "alpha" | "digit" | "keyboard"
+
+
+# PasswordAnalysis.memo key of analysis_runs()
+RUNS_MEMO = "sequence_runs"
+
+
+class RunState(NamedTuple):
+    """Runs extending at the current position: at most one letter/digit run and one keyboard run."""
+
+    kind: str = ""  # "alpha" | "digit" of the letter/digit run
+    start: int = 0
+    direction: int = 0  # 0: no letter/digit run
+    kb_start: int = 0
+    kb_direction: int = 0  # 0: no keyboard run
 
-def _has_sequence(s: str, k: int) -> bool:
-    if k <= 1 or len(s) < k:
-        return False
 
-    # check ascending/descending sequences for letters and digits
-    alph = string.ascii_lowercase
-    digits = string.digits
+NO_RUNS = RunState()
 
-    lower = s.lower()
 
-    def scan(pool: str) -> bool:
-        for i in range(len(pool) - k + 1):
-            seq = pool[i : i + k]
-            if seq in lower:
-                return True
-            if seq[::-1] in lower:
-                return True
+def _run(start: int, end: int, direction: int, kind: str) -> SequenceRun:
+    return SequenceRun(start, end - start + 1, "asc" if direction > 0 else "desc", kind)
+
+
+def advance_runs(
+    state: RunState, prev: str, ch: str, i: int, min_len: int = 2
+) -> tuple[RunState, list[SequenceRun]]:
+    """
+    Feed the pair (lower[i - 1], lower[i]) = (prev, ch): the state after it, and the runs
+    of at least `min_len` characters that ended at i - 1.
+    """
+    kind, d, kd = _PAIRS.get((prev, ch), ("", 0, 0))
+    closed: list[SequenceRun] = []
+    start, kb_start = state.start, state.kb_start
+    if state.direction and (d != state.direction or kind != state.kind) and i - state.start >= min_len:
+        closed.append(_run(state.start, i - 1, state.direction, state.kind))
+    if d and not (d == state.direction and kind == state.kind):
+        start = i - 1
+    if state.kb_direction and kd != state.kb_direction and i - state.kb_start >= min_len:
+        closed.append(_run(state.kb_start, i - 1, state.kb_direction, "keyboard"))
+    if kd and kd != state.kb_direction:
+        kb_start = i - 1
+    return RunState(kind, start, d, kb_start, kd), closed
+
+
+def close_runs(state: RunState, end: int, min_len: int = 2) -> list[SequenceRun]:
+    """Runs of `state` that stop at index `end` (at least `min_len` characters long)."""
+    runs: list[SequenceRun] = []
+    if state.direction and end - state.start + 1 >= min_len:
+        runs.append(_run(state.start, end, state.direction, state.kind))
+    if state.kb_direction and end - state.kb_start + 1 >= min_len:
+        runs.append(_run(state.kb_start, end, state.kb_direction, "keyboard"))
+    return runs
+
+
+def sequence_runs(lower: str, min_len: int = 2) -> list[SequenceRun]:
+    """
+    Every ascending/descending run (letters, digits, keyboard rows) of at least `min_len`
+    characters, found in one left-to-right pass over consecutive character pairs.
+    """
+    # Same logic as advance_runs(), on plain ints. The pair lookups run in C (map/compress):
+    # the Python loop only sees the pairs that are steps of some kind, usually a few.
+    runs: list[SequenceRun] = []
+    steps = list(map(_PAIRS.get, pairwise(lower)))
+    kind, start, direction = "", 0, 0
+    kb_start, kb_direction = 0, 0
+    last = -2  # index of the previous step pair
+    for p in compress(count(), steps):
+        step = steps[p]
+        assert step is not None
+        k, d, kd = step
+        i = p + 1  # the pair is (lower[i - 1], lower[i])
+        if p != last + 1:
+            # gap: whatever was running ended at the second character of the previous step
+            if direction:
+                if last + 2 - start >= min_len:
+                    runs.append(_run(start, last + 1, direction, kind))
+                direction = 0
+            if kb_direction:
+                if last + 2 - kb_start >= min_len:
+                    runs.append(_run(kb_start, last + 1, kb_direction, "keyboard"))
+                kb_direction = 0
+        last = p
+        if d != direction or k != kind:
+            if direction and i - start >= min_len:
+                runs.append(_run(start, i - 1, direction, kind))
+            kind, start, direction = k, i - 1, d
+        if kd != kb_direction:
+            if kb_direction and i - kb_start >= min_len:
+                runs.append(_run(kb_start, i - 1, kb_direction, "keyboard"))
+            kb_start, kb_direction = i - 1, kd
+    runs.extend(close_runs(RunState(kind, start, direction, kb_start, kb_direction), last + 1, min_len))
+    if len(runs) > 1:
+        runs.sort()
+    return runs
+
+
+def analysis_runs(analysis: PasswordAnalysis) -> list[SequenceRun]:
+    """sequence_runs(analysis.lower), computed once per analysis (callers must not mutate it)."""
+    runs: list[SequenceRun] | None = analysis.memo.get(RUNS_MEMO)
+    if runs is None:
+        runs = analysis.memo[RUNS_MEMO] = sequence_runs(analysis.lower)
+    return runs
+
+
+def _has_sequence(s: str, k: int, lower: str | None = None) -> bool:
+    if k <= 1 or len(s) < k:
         return False
+    if lower is None:
+        lower = s.lower()
+    return bool(sequence_runs(lower, k))
+
 
-    return scan(alph) or scan(digits)
+def sequence_findings(runs: list[SequenceRun], policy: Policy) -> list[Finding]:
+    """Findings from all runs (min length 2); only runs of forbid_sequences_len+ count."""
+    k = policy.forbid_sequences_len
+    hits = [r for r in runs if r.length >= k] if k > 1 else []
+    if hits:
+        return [
+            Finding(
+                "SEQUENCE",
+                f"Suite détectée (ex: 1234/abcd/qwerty) sur {k}+ caractères.",
+                Severity.WARNING,
+                penalty=-15,
+                meta={"sequence_len": k, "runs": [r._asdict() for r in hits]},
+            )
+        ]
+    return [Finding("SEQUENCE_OK", "Pas de suite simple détectée.", Severity.INFO, penalty=0)]
 
 
 class SequencesRule(AbstractRule):
-    def check(self, password: str, policy: Policy) -> list[Finding]:
-        k = policy.forbid_sequences_len
-        if _has_sequence(password, k):
-            return [
-                Finding(
-                    "SEQUENCE",
-                    f"Suite détectée (ex: 1234/abcd) sur {k}+ caractères.",
-                    Severity.WARNING,
-                    penalty=-15,
-                    meta={"sequence_len": k},
-                )
-            ]
-        return [Finding("SEQUENCE_OK", "Pas de suite simple détectée.", Severity.INFO, penalty=0)]
+    def check(
+        self, password: str, policy: Policy, analysis: PasswordAnalysis | None = None
+    ) -> list[Finding]:
+        if analysis is not None:
+            # shared with the guess estimator
+            return sequence_findings(analysis_runs(analysis), policy)
+        # only runs of forbid_sequences_len+ are reported: don't build the shorter ones
+        return sequence_findings(sequence_runs(password.lower(), max(policy.forbid_sequences_len, 2)), policy)
@@ -0,0 +1,119 @@
+"""
+Several policies in one process, keyed by tenant ID.
+
+Tenants configuration (JSON); policy paths are relative to the file:
+
+    {
+      "default": "retail",
+      "tenants": {
+        "retail": "policies/retail.json",
+        "bank": {"min_length": 16, "banned_words": ["bank"]}
+      }
+    }
+
+Every tenant evaluator reads the same data_dir, so the dictionary (load_dictionary cache)
+and breach corpus are loaded once; tenants whose policies are identical share one evaluator.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+from password_strength_checker.core.evaluate import Evaluator
+from password_strength_checker.core.models import Policy, Result
+from password_strength_checker.core.policy import CompiledPolicy, compile_policy, load_policy, policy_from_dict
+
+
+class UnknownTenantError(KeyError):
+    pass
+
+
+def load_tenants(path: Path) -> tuple[dict[str, CompiledPolicy], str | None]:
+    """(compiled policy by tenant ID, default tenant) from a tenants JSON file."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    tenants = data.get("tenants") if isinstance(data, dict) else None
+    if not isinstance(tenants, dict):
+        raise ValueError(f"{path}: expected an object with a 'tenants' mapping")
+
+    policies: dict[str, CompiledPolicy] = {}
+    for tenant, spec in tenants.items():
+        if isinstance(spec, str):
+            policy = load_policy(path.parent / spec)
+        elif isinstance(spec, dict):
+            policy = policy_from_dict(spec)
+        else:
+            raise ValueError(f"{path}: tenant {tenant!r} must be a policy path or object")
+        policies[tenant] = compile_policy(policy)
+
+    default = data.get("default")
+    if default is not None and default not in policies:
+        raise ValueError(f"{path}: unknown default tenant {default!r}")
+    return policies, default
+
+
+class TenantEvaluator:
+    """Evaluators by tenant ID over one data_dir (built on first use, shared between equal policies)."""
+
+    def __init__(
+        self,
+        policies: Mapping[str, Policy | CompiledPolicy],
+        data_dir: Path | None = None,
+        default: str | None = None,
+    ) -> None:
+        # None: the packaged data dir (resolved by Evaluator)
+        self.data_dir = data_dir
+        self._policies = {tenant: compile_policy(p) for tenant, p in policies.items()}
+        if default is not None and default not in self._policies:
+            raise UnknownTenantError(default)
+        self.default = default
+        # fingerprint -> evaluator
+        self._evaluators: dict[str, Evaluator] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path: Path, data_dir: Path | None = None) -> "TenantEvaluator":
+        policies, default = load_tenants(path)
+        return cls(policies, data_dir, default)
+
+    @property
+    def tenants(self) -> list[str]:
+        return sorted(self._policies)
+
+    def policy(self, tenant: str | None = None) -> CompiledPolicy:
+        key = tenant if tenant is not None else self.default
+        try:
+            return self._policies[key]  # type: ignore[index]
+        except KeyError:
+            raise UnknownTenantError(key) from None
+
+    def set_policy(self, tenant: str, policy: Policy | CompiledPolicy) -> None:
+        """Add or replace a tenant; evaluations already running keep their evaluator."""
+        compiled = compile_policy(policy)
+        with self._lock:
+            self._policies[tenant] = compiled
+            live = {p.fingerprint for p in self._policies.values()}
+            for fp in [fp for fp in self._evaluators if fp not in live]:
+                del self._evaluators[fp]
+
+    def evaluator(self, tenant: str | None = None) -> Evaluator:
+        policy = self.policy(tenant)
+        with self._lock:
+            ev = self._evaluators.get(policy.fingerprint)
+            if ev is None:
+                ev = self._evaluators[policy.fingerprint] = Evaluator(policy, self.data_dir)
+        return ev
+
+    def evaluate(self, password: str, tenant: str | None = None, short_circuit: bool = False) -> Result:
+        return self.evaluator(tenant).evaluate(password, short_circuit=short_circuit)
+
+    def evaluate_batch(
+        self,
+        passwords: Sequence[str],
+        tenant: str | None = None,
+        vectorized: bool = True,
+        short_circuit: bool = False,
+    ) -> list[Result]:
+        return self.evaluator(tenant).evaluate_batch(passwords, vectorized=vectorized, short_circuit=short_circuit)
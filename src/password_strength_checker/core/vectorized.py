@@ -0,0 +1,105 @@
+"""
+Optional NumPy batch engine.
+
+Encodes a chunk of passwords into a padded code-point matrix and computes, for the whole
+chunk at once, what the scalar LengthRule / CharsetRule / RepeatsRule and log10_keyspace()
+compute one character at a time. Findings are built with the same helpers as the scalar
+rules, so results are identical.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from password_strength_checker.core.analysis import CHARSET_CLASSES, DIGIT, LOWER, OTHER, UPPER, class_bits
+from password_strength_checker.core.estimates import alphabet_size
+from password_strength_checker.core.models import Finding, Policy
+from password_strength_checker.core.rules.charset import charset_findings
+from password_strength_checker.core.rules.length import length_findings
+from password_strength_checker.core.rules.repeats import repeat_findings
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency (pip install password-strength-checker[fast])
+    np = None  # type: ignore[assignment]
+
+
+def available() -> bool:
+    return np is not None
+
+
+_ASCII_BITS: Any = None if np is None else np.array([class_bits(chr(i)) for i in range(128)], dtype=np.uint8)
+
+
+def encode(passwords: Sequence[str]) -> tuple[Any, Any]:
+    """(codes[N, L] uint32 zero-padded, lengths[N])."""
+    lengths = np.fromiter((len(p) for p in passwords), dtype=np.int64, count=len(passwords))
+    width = int(lengths.max()) if len(passwords) else 0
+    codes = np.zeros((len(passwords), width), dtype=np.uint32)
+    if width:
+        # surrogatepass: lone surrogates (valid in JSON strings) keep their code point, as in str
+        flat = np.frombuffer("".join(passwords).encode("utf-32-le", "surrogatepass"), dtype="<u4")
+        mask = np.arange(width) < lengths[:, None]
+        codes[mask] = flat  # row-major fill == concatenation order
+    return codes, lengths
+
+
+def _char_bits(codes: Any, mask: Any) -> Any:
+    bits = _ASCII_BITS[np.minimum(codes, 127)]
+    wide = codes >= 128
+    if wide.any():
+        # Non-ASCII: classify each distinct code point once with the str predicates
+        uniq = np.unique(codes[wide])
+        table = np.array([class_bits(chr(int(c))) for c in uniq], dtype=np.uint8)
+        bits[wide] = table[np.searchsorted(uniq, codes[wide])]
+    bits[~mask] = 0
+    return bits
+
+
+def _longest_runs(codes: Any, lengths: Any, mask: Any) -> Any:
+    width = codes.shape[1]
+    if width < 2:
+        return np.minimum(lengths, 1)
+    same = (codes[:, 1:] == codes[:, :-1]) & mask[:, 1:]
+    idx = np.broadcast_to(np.arange(width - 1), same.shape)
+    # index of the last "different" pair at or before each position -> current streak length
+    last_break = np.maximum.accumulate(np.where(same, -1, idx), axis=1)
+    streak = np.where(same, idx - last_break, 0)
+    return np.where(lengths > 0, streak.max(axis=1) + 1, 0)
+
+
+@dataclass(frozen=True)
+class BatchMeasurements:
+    lengths: Any
+    class_mask: Any  # OR of per-character class bits
+    longest_run: Any
+
+    def classes(self, i: int) -> int:
+        m = int(self.class_mask[i])
+        return sum(1 for b in CHARSET_CLASSES if m & b)
+
+    def log10_keyspace(self, i: int) -> float:
+        m = int(self.class_mask[i])
+        alphabet = alphabet_size(bool(m & LOWER), bool(m & UPPER), bool(m & DIGIT), bool(m & OTHER))
+        return int(self.lengths[i]) * math.log10(alphabet)
+
+    def findings(self, i: int, policy: Policy) -> dict[str, list[Finding]]:
+        """Findings of the vectorised rules for password i, keyed by rule name."""
+        return {
+            "length": length_findings(int(self.lengths[i]), policy),
+            "charset": charset_findings(self.classes(i)),
+            "repeats": repeat_findings(int(self.longest_run[i]), policy),
+        }
+
+
+def measure(passwords: Sequence[str]) -> BatchMeasurements:
+    if np is None:
+        raise RuntimeError("NumPy is required for the vectorised batch engine")
+    codes, lengths = encode(passwords)
+    mask = np.arange(codes.shape[1]) < lengths[:, None]
+    bits = _char_bits(codes, mask)
+    class_mask = np.bitwise_or.reduce(bits, axis=1) if codes.shape[1] else np.zeros(len(passwords), np.uint8)
+    return BatchMeasurements(lengths, class_mask, _longest_runs(codes, lengths, mask))
@@ -0,0 +1,316 @@
+"""
+Local HTTP scoring service (`psc serve`), stdlib asyncio only.
+
+    POST /evaluate        {"password": "..."}          -> Result.to_dict()
+    POST /evaluate/batch  {"passwords": ["...", ...]}  -> {"results": [...]}
+                          (both accept "short_circuit": true and, with tenants, "tenant": "<id>";
+                          400 without "tenant" when the tenants configuration has no default)
+    GET  /metrics         Prometheus text format (request counts, latency histograms)
+    GET  /health          {"status": "ok"}
+
+One warm Evaluator serves every request. HTTP/1.1 keep-alive is supported; bodies are
+size-limited and concurrent evaluations are capped (503 when saturated). Evaluations run on
+a thread pool of max_concurrency workers, so the event loop keeps answering /health and
+/metrics while a long password is being scored. With a
+PolicyWatcher, a changed policy.json swaps in a new Evaluator; requests already running
+finish on the old one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Any, TypeVar
+
+from password_strength_checker.core.evaluate import Evaluator
+from password_strength_checker.core.policy import CompiledPolicy, PolicyWatcher
+from password_strength_checker.core.tenants import TenantEvaluator, UnknownTenantError
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+MAX_HEADER_LINE = 8 * 1024
+MAX_HEADERS = 64
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ServerConfig:
+    host: str = "127.0.0.1"
+    port: int = 8765
+    max_body: int = 1024 * 1024
+    max_batch: int = 10_000
+    max_concurrency: int = 64
+    keepalive_timeout: float = 15.0
+
+
+class HttpError(Exception):
+    def __init__(self, status: HTTPStatus, message: str = "") -> None:
+        super().__init__(message or status.phrase)
+        self.status = status
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.requests: Counter[tuple[str, int]] = Counter()
+        self.buckets: dict[str, list[int]] = {}
+        self.sums: defaultdict[str, float] = defaultdict(float)
+        self.counts: Counter[str] = Counter()
+
+    def observe(self, route: str, status: int, seconds: float) -> None:
+        self.requests[(route, status)] += 1
+        buckets = self.buckets.setdefault(route, [0] * len(LATENCY_BUCKETS))
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                buckets[i] += 1
+        self.sums[route] += seconds
+        self.counts[route] += 1
+
+    def render(self) -> str:
+        uptime = time.monotonic() - self.started
+        total = sum(self.requests.values())
+        lines = [
+            "# TYPE psc_uptime_seconds gauge",
+            f"psc_uptime_seconds {uptime:.3f}",
+            "# TYPE psc_requests_per_second gauge",
+            f"psc_requests_per_second {total / uptime if uptime else 0.0:.3f}",
+            "# TYPE psc_requests_total counter",
+        ]
+        for (route, status), n in sorted(self.requests.items()):
+            lines.append(f'psc_requests_total{{route="{route}",status="{status}"}} {n}')
+        lines.append("# TYPE psc_request_duration_seconds histogram")
+        for route, buckets in sorted(self.buckets.items()):
+            for bound, n in zip(LATENCY_BUCKETS, buckets):
+                lines.append(f'psc_request_duration_seconds_bucket{{route="{route}",le="{bound}"}} {n}')
+            lines.append(f'psc_request_duration_seconds_bucket{{route="{route}",le="+Inf"}} {self.counts[route]}')
+            lines.append(f'psc_request_duration_seconds_sum{{route="{route}"}} {self.sums[route]:.6f}')
+            lines.append(f'psc_request_duration_seconds_count{{route="{route}"}} {self.counts[route]}')
+        return "\n".join(lines) + "\n"
+
+
+class ScoringServer:
+    def __init__(
+        self,
+        evaluator: Evaluator | None,
+        config: ServerConfig = ServerConfig(),
+        watcher: PolicyWatcher | None = None,
+        tenants: TenantEvaluator | None = None,
+    ) -> None:
+        self.evaluator = evaluator
+        self.tenants = tenants
+        self.config = config
+        self.metrics = Metrics()
+        self._inflight = 0
+        self._executor = ThreadPoolExecutor(config.max_concurrency, thread_name_prefix="psc-eval")
+        self._server: asyncio.Server | None = None
+        if watcher is not None:
+            watcher.subscribe(self._reload_policy)
+
+    def _reload_policy(self, policy: CompiledPolicy) -> None:
+        # Called from the watcher thread: build first, then swap the reference
+        data_dir = self.evaluator.data_dir if self.evaluator is not None else None
+        self.evaluator = Evaluator(policy, data_dir)
+
+    async def start(self) -> asyncio.Server:
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.config.host, self.config.port, limit=MAX_HEADER_LINE
+        )
+        return self._server
+
+    async def serve_forever(self) -> None:
+        server = self._server or await self.start()
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        # Off the event loop, under a concurrency slot held until the result is back
+        with self._slot():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    # -- connection handling -------------------------------------------------
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), self.config.keepalive_timeout)
+                except (asyncio.TimeoutError, asyncio.LimitOverrunError, ValueError):
+                    break
+                if not request_line:
+                    break
+                keep_alive = await self._handle_request(request_line, reader, writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _handle_request(
+        self, request_line: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        t0 = time.perf_counter()
+        route = "invalid"
+        keep_alive = False
+        try:
+            try:
+                method, target, version = request_line.decode("latin-1").split()
+            except ValueError:
+                raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed request line") from None
+            route = target.split("?", 1)[0]
+            headers = await self._read_headers(reader)
+
+            conn = headers.get("connection", "").lower()
+            keep_alive = conn != "close" if version == "HTTP/1.1" else conn == "keep-alive"
+
+            if "chunked" in headers.get("transfer-encoding", "").lower():
+                keep_alive = False
+                raise HttpError(HTTPStatus.NOT_IMPLEMENTED, "Chunked bodies are not supported")
+            length = int(headers.get("content-length", "0") or 0)
+            if length < 0:
+                raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+            if length > self.config.max_body:
+                keep_alive = False  # body left unread
+                raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Body exceeds {self.config.max_body} bytes")
+            body = await reader.readexactly(length) if length else b""
+
+            status, content_type, payload = await self._dispatch(method, route, body)
+        except HttpError as e:
+            status, content_type = e.status, "application/json"
+            payload = json.dumps({"error": str(e)}).encode("utf-8")
+        except ValueError as e:
+            keep_alive = False  # framing is unreliable past this point
+            status, content_type = HTTPStatus.BAD_REQUEST, "application/json"
+            payload = json.dumps({"error": str(e)}).encode("utf-8")
+
+        self._write_response(writer, status, content_type, payload, keep_alive)
+        if route not in ("/evaluate", "/evaluate/batch", "/metrics", "/health"):
+            route = "other"
+        self.metrics.observe(route, status.value, time.perf_counter() - t0)
+        return keep_alive
+
+    async def _read_headers(self, reader: asyncio.StreamReader) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        for _ in range(MAX_HEADERS + 1):
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                return headers
+            name, sep, value = line.decode("latin-1").partition(":")
+            if not sep:
+                raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed header")
+            headers[name.strip().lower()] = value.strip()
+        raise HttpError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Too many headers")
+
+    @staticmethod
+    def _write_response(
+        writer: asyncio.StreamWriter, status: HTTPStatus, content_type: str, payload: bytes, keep_alive: bool
+    ) -> None:
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "Cache-Control: no-store\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + payload)
+
+    # -- routes --------------------------------------------------------------
+
+    async def _dispatch(self, method: str, route: str, body: bytes) -> tuple[HTTPStatus, str, bytes]:
+        if route == "/metrics":
+            self._require(method, "GET")
+            return HTTPStatus.OK, "text/plain; version=0.0.4", self.metrics.render().encode("utf-8")
+        if route == "/health":
+            self._require(method, "GET")
+            return HTTPStatus.OK, "application/json", b'{"status": "ok"}'
+        if route == "/evaluate":
+            self._require(method, "POST")
+            data = self._json_body(body, "password", str)
+            short_circuit = data.get("short_circuit") is True
+            evaluator = self._evaluator_for(data)
+            result = await self._run(evaluator.evaluate, data["password"], short_circuit=short_circuit)
+            payload: Any = result.to_dict()
+        elif route == "/evaluate/batch":
+            self._require(method, "POST")
+            data = self._json_body(body, "passwords", list)
+            passwords = data["passwords"]
+            short_circuit = data.get("short_circuit") is True
+            evaluator = self._evaluator_for(data)
+            if len(passwords) > self.config.max_batch:
+                raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"More than {self.config.max_batch} passwords")
+            if not all(isinstance(p, str) for p in passwords):
+                raise HttpError(HTTPStatus.BAD_REQUEST, "'passwords' must be a list of strings")
+            results = await self._run(evaluator.evaluate_batch, passwords, short_circuit=short_circuit)
+            payload = {"results": [r.to_dict() for r in results]}
+        else:
+            raise HttpError(HTTPStatus.NOT_FOUND)
+        return HTTPStatus.OK, "application/json", json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    def _evaluator_for(self, data: dict[str, Any]) -> Evaluator:
+        tenant = data.get("tenant")
+        if tenant is None:
+            if self.evaluator is None:
+                raise HttpError(HTTPStatus.BAD_REQUEST, "Missing 'tenant'")
+            return self.evaluator
+        if self.tenants is None or not isinstance(tenant, str):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid 'tenant'")
+        try:
+            return self.tenants.evaluator(tenant)
+        except UnknownTenantError:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Unknown tenant: {tenant}") from None
+
+    @staticmethod
+    def _require(method: str, expected: str) -> None:
+        if method != expected:
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED)
+
+    @staticmethod
+    def _json_body(body: bytes, name: str, kind: type) -> dict[str, Any]:
+        try:
+            data = json.loads(body)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Body must be JSON") from None
+        if not isinstance(data, dict) or not isinstance(data.get(name), kind):
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Missing or invalid '{name}'")
+        return data
+
+    def _slot(self) -> _Slot:
+        if self._inflight >= self.config.max_concurrency:
+            raise HttpError(HTTPStatus.SERVICE_UNAVAILABLE, "Too many concurrent evaluations")
+        return _Slot(self)
+
+
+class _Slot:
+    def __init__(self, server: ScoringServer) -> None:
+        self._server = server
+
+    def __enter__(self) -> None:
+        self._server._inflight += 1
+
+    def __exit__(self, *exc: object) -> None:
+        self._server._inflight -= 1
+
+
+def serve(
+    evaluator: Evaluator | None,
+    config: ServerConfig = ServerConfig(),
+    watcher: PolicyWatcher | None = None,
+    tenants: TenantEvaluator | None = None,
+) -> None:
+    asyncio.run(ScoringServer(evaluator, config, watcher, tenants).serve_forever())
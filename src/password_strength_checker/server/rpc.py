@@ -0,0 +1,219 @@
+"""
+Coprocess mode (`psc rpc`): newline-delimited JSON requests over stdin/stdout or a Unix socket.
+
+    -> {"id": 1, "method": "evaluate", "params": {"password": "..."}}
+    <- {"id": 1, "result": {...Result.to_dict()...}}
+
+    -> {"id": 2, "method": "evaluate_batch", "params": {"passwords": ["...", "..."]}}
+    <- {"id": 2, "result": [{...}, {...}]}
+
+Both methods accept "short_circuit": true in params (see Evaluator.evaluate), and
+"tenant": "<id>" when the server was started with a tenants configuration (required when
+that configuration has no default tenant).
+Requests may be pipelined: responses come back in request order and carry the request id.
+With a PolicyWatcher, requests after a policy.json change use the reloaded policy.
+Errors use JSON-RPC codes: {"id": ..., "error": {"code": -32602, "message": "..."}}; an
+unexpected failure answers -32603 instead of stopping the server.
+The Unix socket is created owner-only; an existing path is only replaced when it is a
+socket nobody is listening on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import stat
+import sys
+from pathlib import Path
+from typing import IO, Any
+
+from password_strength_checker.core.evaluate import Evaluator
+from password_strength_checker.core.policy import CompiledPolicy, PolicyWatcher
+from password_strength_checker.core.tenants import TenantEvaluator, UnknownTenantError
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+MAX_LINE = 1024 * 1024
+
+
+class RpcError(Exception):
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+def _require_evaluator(ev: Evaluator | None) -> Evaluator:
+    # None: tenants configuration without a default tenant
+    if ev is None:
+        raise RpcError(INVALID_PARAMS, "Missing 'tenant'")
+    return ev
+
+
+def _evaluate(ev: Evaluator | None, params: dict[str, Any]) -> Any:
+    pw = params.get("password")
+    if not isinstance(pw, str):
+        raise RpcError(INVALID_PARAMS, "'password' must be a string")
+    ev = _require_evaluator(ev)
+    return ev.evaluate(pw, short_circuit=params.get("short_circuit") is True).to_dict()
+
+
+def _evaluate_batch(ev: Evaluator | None, params: dict[str, Any]) -> Any:
+    pws = params.get("passwords")
+    if not isinstance(pws, list) or not all(isinstance(p, str) for p in pws):
+        raise RpcError(INVALID_PARAMS, "'passwords' must be a list of strings")
+    ev = _require_evaluator(ev)
+    return [r.to_dict() for r in ev.evaluate_batch(pws, short_circuit=params.get("short_circuit") is True)]
+
+
+def _ping(ev: Evaluator | None, params: dict[str, Any]) -> Any:
+    return "pong"
+
+
+METHODS = {
+    "evaluate": _evaluate,
+    "evaluate_batch": _evaluate_batch,
+    "ping": _ping,
+}
+
+
+def _select_tenant(tenants: TenantEvaluator | None, tenant: Any) -> Evaluator:
+    if tenants is None or not isinstance(tenant, str):
+        raise RpcError(INVALID_PARAMS, "Invalid 'tenant'")
+    try:
+        return tenants.evaluator(tenant)
+    except UnknownTenantError:
+        raise RpcError(INVALID_PARAMS, f"Unknown tenant: {tenant!r}") from None
+
+
+def handle_message(ev: Evaluator | None, line: str | bytes, tenants: TenantEvaluator | None = None) -> str:
+    """One request line in, one response line out (without the trailing newline)."""
+    req_id: Any = None
+    try:
+        try:
+            req = json.loads(line)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise RpcError(PARSE_ERROR, "Invalid JSON") from None
+        if not isinstance(req, dict):
+            raise RpcError(INVALID_REQUEST, "Request must be an object")
+        req_id = req.get("id")
+        name = req.get("method")
+        if not isinstance(name, str):
+            raise RpcError(INVALID_REQUEST, "'method' must be a string")
+        method = METHODS.get(name)
+        if method is None:
+            raise RpcError(METHOD_NOT_FOUND, f"Unknown method: {name!r}")
+        params = req.get("params", {})
+        if not isinstance(params, dict):
+            raise RpcError(INVALID_PARAMS, "'params' must be an object")
+        if params.get("tenant") is not None:
+            ev = _select_tenant(tenants, params["tenant"])
+        response: dict[str, Any] = {"id": req_id, "result": method(ev, params)}
+    except RpcError as e:
+        response = {"id": req_id, "error": {"code": e.code, "message": str(e)}}
+    except Exception as e:
+        # One bad request must not take the coprocess down
+        message = f"Internal error: {type(e).__name__}"
+        response = {"id": req_id, "error": {"code": INTERNAL_ERROR, "message": message}}
+    return json.dumps(response, ensure_ascii=False)
+
+
+class _LiveEvaluator:
+    """Evaluator for the next request: rebuilt (on the watcher thread) when the policy changes."""
+
+    def __init__(
+        self, ev: Evaluator | None, watcher: PolicyWatcher | None, tenants: TenantEvaluator | None = None
+    ) -> None:
+        self.evaluator = ev
+        self.tenants = tenants
+        if watcher is not None:
+            watcher.subscribe(self._reload)
+
+    def _reload(self, policy: CompiledPolicy) -> None:
+        data_dir = self.evaluator.data_dir if self.evaluator is not None else None
+        self.evaluator = Evaluator(policy, data_dir)
+
+
+def serve_stdio(
+    ev: Evaluator | None,
+    stdin: IO[bytes] | None = None,
+    stdout: IO[bytes] | None = None,
+    watcher: PolicyWatcher | None = None,
+    tenants: TenantEvaluator | None = None,
+) -> None:
+    fin = stdin if stdin is not None else sys.stdin.buffer
+    fout = stdout if stdout is not None else sys.stdout.buffer
+    live = _LiveEvaluator(ev, watcher)
+    for line in fin:
+        if not line.strip():
+            continue
+        fout.write(handle_message(live.evaluator, line, tenants).encode("utf-8") + b"\n")
+        fout.flush()
+
+
+async def _handle_unix_client(
+    live: _LiveEvaluator, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    try:
+        while line := await reader.readline():
+            if line.strip():
+                # Off the event loop: a slow request must not stall the other clients
+                response = await asyncio.to_thread(handle_message, live.evaluator, line, live.tenants)
+                writer.write(response.encode("utf-8") + b"\n")
+                # no-op until the transport buffer fills up, so pipelined requests aren't stalled
+                await writer.drain()
+    except (ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+def _remove_stale_socket(path: Path) -> None:
+    """Unlink a socket left behind by a dead instance; refuse anything else at `path`."""
+    try:
+        st = path.lstat()
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(st.st_mode):
+        raise FileExistsError(f"{path} exists and is not a socket")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            path.unlink(missing_ok=True)
+            return
+    raise OSError(f"{path} is in use by another running instance")
+
+
+async def _serve_unix(live: _LiveEvaluator, path: Path) -> None:
+    _remove_stale_socket(path)
+    # Created owner-only: no window where other users could connect
+    old_umask = os.umask(0o077)
+    try:
+        server = await asyncio.start_unix_server(
+            lambda r, w: _handle_unix_client(live, r, w), path=str(path), limit=MAX_LINE
+        )
+    finally:
+        os.umask(old_umask)
+    inode = path.stat().st_ino
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        # Only remove our own socket (not one another instance bound since)
+        try:
+            if path.lstat().st_ino == inode:
+                path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def serve_unix(
+    ev: Evaluator | None, path: Path, watcher: PolicyWatcher | None = None, tenants: TenantEvaluator | None = None
+) -> None:
+    asyncio.run(_serve_unix(_LiveEvaluator(ev, watcher, tenants), path))
@@ -4,19 +4,32 @@ import json
 import os
 import random
 import string
+from collections.abc import Sequence
 from dataclasses import replace
 from pathlib import Path
 from typing import Optional
 
 from PySide6.QtCore import (
     QEasingCurve,
+    QModelIndex,
+    QSortFilterProxyModel,
     QPoint,
     QPropertyAnimation,
     QTimer,
     Qt,
     QParallelAnimationGroup,
 )
-from PySide6.QtGui import QAction, QColor, QIcon, QKeySequence, QPainter, QPixmap, QPen, QKeySequence
+from PySide6.QtGui import (
+    QAction,
+    QCloseEvent,
+    QColor,
+    QIcon,
+    QKeySequence,
+    QPainter,
+    QPaintEvent,
+    QPen,
+    QPixmap,
+)
 from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtWidgets import (
     QApplication,
@@ -38,16 +51,16 @@ from PySide6.QtWidgets import (
     QSpinBox,
     QStackedWidget,
     QTabWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTextEdit,
     QToolButton,
     QVBoxLayout,
     QWidget,
 )
 
-from password_strength_checker.core.evaluate import evaluate
-from password_strength_checker.core.models import Policy
+from password_strength_checker.core.models import Finding, Policy, Result
+from password_strength_checker.ui.models import EstimatesModel, FindingsModel
+from password_strength_checker.ui.worker import EvaluationWorker
 
 
 APPLE_QSS = """
@@ -63,7 +76,7 @@ QFrame#Card {
 QLabel#Title { font-size: 18px; font-weight: 800; }
 QLabel#Muted { color: #6B7280; }
 
-QLineEdit, QTextEdit, QComboBox, QSpinBox, QTableWidget {
+QLineEdit, QTextEdit, QComboBox, QSpinBox, QTableView {
     background: #FFFFFF;
     border: 1px solid #E5E7EB;
     border-radius: 12px;
@@ -188,7 +201,7 @@ QComboBox#SevCombo {
 }
 
 /* Table readability */
-QTableWidget {
+QTableView {
   border: 1px solid #E5E7EB;
   border-radius: 14px;
   background: #FFFFFF;
@@ -205,11 +218,11 @@ QHeaderView::section {
   font-weight: 900;
   color: #111827;
 }
-QTableWidget::item {
+QTableView::item {
   padding: 12px 10px;
   border-bottom: 1px solid #EEF2F7;
 }
-QTableWidget::item:selected {
+QTableView::item:selected {
   background: #DBEAFE;
   color: #111827;
 }
@@ -321,7 +334,7 @@ class ScoreRing(QWidget):
         self._value = max(0, min(100, int(v)))
         self.update()
 
-    def paintEvent(self, event) -> None:
+    def paintEvent(self, event: QPaintEvent) -> None:
         p = QPainter(self)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
 
@@ -411,6 +424,11 @@ class MainWindow(QMainWindow):
         self._policy_path: Optional[Path] = None
         self._loaded_policy: Policy = Policy()
         self._last_result_json: str = ""
+        # Evaluations run on a worker thread; only the latest keystroke's result is shown
+        self._last_result: Optional[Result] = None
+        self._worker = EvaluationWorker(self)
+        self._worker.result_ready.connect(self._apply_result)
+        self._worker.error.connect(lambda msg: self._toast(f"Erreur: {msg}"))
 
         self._setup_menu()
 
@@ -559,18 +577,21 @@ class MainWindow(QMainWindow):
         filt_row.addWidget(self.hide_info_cb)
         dl.addLayout(filt_row)
 
-        self.findings_table = QTableWidget(0, 4)
-        self.findings_table.setHorizontalHeaderLabels(["Sévérité", "Code", "Message", "Impact"])
+        self.findings_model = FindingsModel(self)
+        self.findings_proxy = QSortFilterProxyModel(self)
+        self.findings_proxy.setSourceModel(self.findings_model)
+        self.findings_table = QTableView()
+        self.findings_table.setModel(self.findings_proxy)
         self.findings_table.setSortingEnabled(True)
-        self.findings_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.findings_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.findings_table.setShowGrid(False)
         self.findings_table.verticalHeader().setVisible(False)
         self.findings_table.setAlternatingRowColors(True)
-        self.findings_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.findings_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.findings_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.findings_table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
         self.findings_table.setWordWrap(True)
         self.findings_table.setTextElideMode(Qt.TextElideMode.ElideNone)
-        self.findings_table.cellDoubleClicked.connect(self._copy_cell)
+        self.findings_table.doubleClicked.connect(self._copy_cell)
 
         self.findings_table.verticalHeader().setDefaultSectionSize(44)
         self.findings_table.horizontalHeader().setMinimumHeight(44)
@@ -592,18 +613,21 @@ class MainWindow(QMainWindow):
         el.setContentsMargins(14, 14, 14, 14)
         el.setSpacing(12)
 
-        self.estimates_table = QTableWidget(0, 3)
-        self.estimates_table.setHorizontalHeaderLabels(["Scénario", "Essais/s", "Temps"])
+        self.estimates_model = EstimatesModel(self)
+        self.estimates_proxy = QSortFilterProxyModel(self)
+        self.estimates_proxy.setSourceModel(self.estimates_model)
+        self.estimates_table = QTableView()
+        self.estimates_table.setModel(self.estimates_proxy)
         self.estimates_table.setSortingEnabled(True)
-        self.estimates_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.estimates_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.estimates_table.setShowGrid(False)
         self.estimates_table.verticalHeader().setVisible(False)
         self.estimates_table.setAlternatingRowColors(True)
-        self.estimates_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.estimates_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.estimates_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.estimates_table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
         self.estimates_table.setWordWrap(True)
         self.estimates_table.setTextElideMode(Qt.TextElideMode.ElideNone)
-        self.estimates_table.cellDoubleClicked.connect(self._copy_cell)
+        self.estimates_table.doubleClicked.connect(self._copy_cell)
 
         self.estimates_table.verticalHeader().setDefaultSectionSize(44)
         self.estimates_table.horizontalHeader().setMinimumHeight(44)
@@ -668,12 +692,7 @@ class MainWindow(QMainWindow):
 
         self.tabs.addTab(js, "JSON")
 
-        # ---------------- Debounce + signals ----------------
-        self._debounce = QTimer(self)
-        self._debounce.setSingleShot(True)
-        self._debounce.setInterval(220)
-        self._debounce.timeout.connect(self.run_evaluate)
-
+        # ---------------- Signals ----------------
         self.toggle_btn.toggled.connect(self._toggle_password_visibility)
         self.eval_btn.clicked.connect(self.run_evaluate)
         self.clear_btn.clicked.connect(self._clear)
@@ -687,12 +706,13 @@ class MainWindow(QMainWindow):
         self.copy_json_btn.clicked.connect(self._copy_json)
         self.export_report_btn.clicked.connect(self._export_report)
 
-        self.password_input.textChanged.connect(lambda *_: self._debounce.start())
-        self.findings_filter.textChanged.connect(lambda *_: self._debounce.start())
+        self.password_input.textChanged.connect(lambda *_: self.run_evaluate())
+        # Display-only options: re-render the last result, no new evaluation
+        self.findings_filter.textChanged.connect(lambda *_: self._render())
 
-        self.sev_filter.currentIndexChanged.connect(lambda *_: self._debounce.start())
-        self.hide_info_cb.toggled.connect(lambda *_: self._debounce.start())
-        self.strict_cb.toggled.connect(lambda *_: self._debounce.start())
+        self.sev_filter.currentIndexChanged.connect(lambda *_: self._render())
+        self.hide_info_cb.toggled.connect(lambda *_: self._render())
+        self.strict_cb.toggled.connect(lambda *_: self._render())
 
         # Spotlight Ctrl+K (focus filter)
         act_spot = QAction("Focus Search", self)
@@ -737,16 +757,17 @@ class MainWindow(QMainWindow):
     def _toast(self, msg: str) -> None:
         Toast(self, msg).show_bottom_right()
 
-    def _copy_cell(self, row: int, col: int) -> None:
-        table = self.sender()
-        if not isinstance(table, QTableWidget):
+    def _copy_cell(self, index: QModelIndex) -> None:
+        text = index.data()
+        if not text:
             return
-        item = table.item(row, col)
-        if not item:
-            return
-        QApplication.clipboard().setText(item.text())
+        QApplication.clipboard().setText(str(text))
         self._toast("Copié")
 
+    def closeEvent(self, event: QCloseEvent) -> None:
+        self._worker.shutdown()
+        super().closeEvent(event)
+
     def _get_open_json_path(self) -> Optional[Path]:
         # Native dialog (system) => always readable + no stylesheet issues
         path_str, _ = QFileDialog.getOpenFileName(
@@ -900,56 +921,26 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Erreur", f"Impossible d'exporter:\n{e}")
 
-    def _set_findings(self, findings) -> None:
-        was_sorting = self.findings_table.isSortingEnabled()
-        self.findings_table.setSortingEnabled(False)
-
-        self.findings_table.setRowCount(0)
-        for f in findings:
-            row = self.findings_table.rowCount()
-            self.findings_table.insertRow(row)
-
-            it0 = QTableWidgetItem(f.severity.value)
-            it1 = QTableWidgetItem(f.code)
-            it2 = QTableWidgetItem(f.message)
-            it3 = QTableWidgetItem(str(f.penalty))
-
-            if f.severity.value == "critical":
-                bg = QColor("#FEF2F2")
-            elif f.severity.value == "warning":
-                bg = QColor("#FFFBEB")
-            else:
-                bg = QColor("#FFFFFF")
-
-            for it in (it0, it1, it2, it3):
-                it.setBackground(bg)
-
-            self.findings_table.setItem(row, 0, it0)
-            self.findings_table.setItem(row, 1, it1)
-            self.findings_table.setItem(row, 2, it2)
-            self.findings_table.setItem(row, 3, it3)
-
+    def _set_findings(self, findings: Sequence[Finding]) -> None:
+        self.findings_model.set_findings(findings)
         self.findings_table.resizeRowsToContents()
-        self.findings_table.setSortingEnabled(was_sorting)
 
     def _set_estimates(self, estimates: list[dict[str, object]]) -> None:
-        was_sorting = self.estimates_table.isSortingEnabled()
-        self.estimates_table.setSortingEnabled(False)
-
-        self.estimates_table.setRowCount(0)
-        for e in estimates:
-            row = self.estimates_table.rowCount()
-            self.estimates_table.insertRow(row)
-            self.estimates_table.setItem(row, 0, QTableWidgetItem(str(e.get("scenario", ""))))
-            self.estimates_table.setItem(row, 1, QTableWidgetItem(str(e.get("guesses_per_second", ""))))
-            self.estimates_table.setItem(row, 2, QTableWidgetItem(str(e.get("time", ""))))
-
+        self.estimates_model.set_estimates(estimates)
         self.estimates_table.resizeRowsToContents()
-        self.estimates_table.setSortingEnabled(was_sorting)
 
     def run_evaluate(self) -> None:
+        self._worker.submit(self.password_input.text(), self._loaded_policy)
+
+    def _apply_result(self, result: Result) -> None:
+        self._last_result = result
+        self._render()
+
+    def _render(self) -> None:
+        result = self._last_result
+        if result is None:
+            return
         pw = self.password_input.text()
-        result = evaluate(pw, policy=self._loaded_policy)
 
         non_compliant = any(f.severity.value == "critical" for f in result.findings)
         if self.strict_cb.isChecked():
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from collections.abc import Hashable, Sequence
+from difflib import SequenceMatcher
+from typing import Any
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, QPersistentModelIndex, Qt
+from PySide6.QtGui import QColor
+
+from password_strength_checker.core.models import Finding
+
+Row = tuple[Any, ...]
+_Index = QModelIndex | QPersistentModelIndex
+
+_SEVERITY_BG = {"critical": QColor("#FEF2F2"), "warning": QColor("#FFFBEB")}
+
+
+class RowTableModel(QAbstractTableModel):
+    """
+    Read-only table of display rows. set_rows() diffs the new rows against the current ones
+    (by row key) and only emits the inserts/removals/changes, so views keep selection & scroll.
+    """
+
+    headers: tuple[str, ...] = ()
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._rows: list[Row] = []
+        self._keys: list[Hashable] = []
+
+    # ---- subclass hooks ----
+
+    def row_key(self, row: Row) -> Hashable:
+        key: Hashable = row[0]
+        return key
+
+    def background(self, row: Row) -> QColor | None:
+        return None
+
+    # ---- Qt API ----
+
+    def rowCount(self, parent: _Index = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: _Index = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return None
+
+    def data(self, index: _Index, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(row[index.column()])
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self.background(row)
+        return None
+
+    # ---- updates ----
+
+    def set_rows(self, rows: Sequence[Row]) -> None:
+        new_rows = list(rows)
+        new_keys = [self.row_key(r) for r in new_rows]
+        ops = SequenceMatcher(None, self._keys, new_keys, autojunk=False).get_opcodes()
+        # Apply from the end so earlier opcode indices stay valid
+        for tag, i1, i2, j1, j2 in reversed(ops):
+            if tag in ("equal", "replace") and i2 - i1 == j2 - j1:
+                self._rows[i1:i2] = new_rows[j1:j2]
+                self._keys[i1:i2] = new_keys[j1:j2]
+                self._changed(i1, i2)
+                continue
+            if i2 > i1:
+                self.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+                del self._rows[i1:i2]
+                del self._keys[i1:i2]
+                self.endRemoveRows()
+            if j2 > j1:
+                self.beginInsertRows(QModelIndex(), i1, i1 + j2 - j1 - 1)
+                self._rows[i1:i1] = new_rows[j1:j2]
+                self._keys[i1:i1] = new_keys[j1:j2]
+                self.endInsertRows()
+
+    def _changed(self, first: int, last: int) -> None:
+        if last > first:
+            self.dataChanged.emit(self.index(first, 0), self.index(last - 1, self.columnCount() - 1))
+
+    def row(self, i: int) -> Row:
+        return self._rows[i]
+
+
+class FindingsModel(RowTableModel):
+    headers = ("Sévérité", "Code", "Message", "Impact")
+
+    def row_key(self, row: Row) -> Hashable:
+        key: Hashable = row[1]
+        return key
+
+    def background(self, row: Row) -> QColor:
+        return _SEVERITY_BG.get(row[0], QColor("#FFFFFF"))
+
+    def set_findings(self, findings: Sequence[Finding]) -> None:
+        self.set_rows([(f.severity.value, f.code, f.message, f.penalty) for f in findings])
+
+
+class EstimatesModel(RowTableModel):
+    headers = ("Scénario", "Essais/s", "Temps")
+
+    def set_estimates(self, estimates: Sequence[dict[str, object]]) -> None:
+        self.set_rows(
+            [(e.get("scenario", ""), e.get("guesses_per_second", ""), e.get("time", "")) for e in estimates]
+        )
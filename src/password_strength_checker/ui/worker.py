@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from password_strength_checker.core.cache import ResultCache
+from password_strength_checker.core.evaluate import get_evaluator
+from password_strength_checker.core.incremental import IncrementalEvaluator
+from password_strength_checker.core.models import Policy, Result
+
+
+class _Signals(QObject):
+    # (generation, Result)
+    finished = Signal(int, object)
+    failed = Signal(int, str)
+
+
+class _EvaluationTask(QRunnable):
+    def __init__(self, owner: "EvaluationWorker", generation: int, password: str, policy: Policy) -> None:
+        super().__init__()
+        self.owner = owner
+        self.generation = generation
+        self.password = password
+        self.policy = policy
+
+    def run(self) -> None:
+        owner = self.owner
+        # Superseded while queued: a newer keystroke is on its way
+        if self.generation != owner.generation:
+            return
+        try:
+            result = owner._evaluate(self.password, self.policy)
+        except Exception as e:
+            owner.signals.failed.emit(self.generation, str(e))
+            return
+        owner.signals.finished.emit(self.generation, result)
+
+
+class EvaluationWorker(QObject):
+    """
+    Runs evaluations off the GUI thread. Each submit() bumps a generation counter; only the
+    latest generation's result is delivered through `result_ready` (older ones are dropped).
+    A single worker thread owns the incremental evaluator, so it is never shared.
+    Results are also kept in a ResultCache: undo, paste-back or switching back to a policy
+    are served without re-evaluating.
+    """
+
+    result_ready = Signal(object)
+    error = Signal(str)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._incremental: IncrementalEvaluator | None = None
+        self._cache = ResultCache(maxsize=256, ttl=600.0)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self.signals = _Signals(self)
+        self.signals.finished.connect(self._on_finished)
+        self.signals.failed.connect(self._on_failed)
+
+    def submit(self, password: str, policy: Policy) -> int:
+        with self._lock:
+            self.generation += 1
+            gen = self.generation
+        # Drop queued (not yet started) tasks: they can only produce stale results
+        self._pool.clear()
+        self._pool.start(_EvaluationTask(self, gen, password, policy))
+        return gen
+
+    def _evaluate(self, password: str, policy: Policy) -> Result:
+        # Worker thread only (max 1 thread)
+        ev = get_evaluator(policy)
+        inc = self._incremental
+        if inc is None or inc.evaluator is not ev:
+            # new policy or dictionary changed on disk: start over
+            inc = self._incremental = IncrementalEvaluator(ev)
+        return ev.evaluate_cached(password, self._cache, compute=inc.set_password)
+
+    def _on_finished(self, generation: int, result: Result) -> None:
+        if generation == self.generation:
+            self.result_ready.emit(result)
+
+    def _on_failed(self, generation: int, message: str) -> None:
+        if generation == self.generation:
+            self.error.emit(message)
+
+    def shutdown(self, msecs: int = 2000) -> None:
+        self._pool.clear()
+        self._pool.waitForDone(msecs)
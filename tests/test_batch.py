@@ -0,0 +1,41 @@
+import json
+import os
+import subprocess
+import sys
+
+from password_strength_checker.core.evaluate import evaluate, evaluate_many
+
+
+def test_evaluate_many_matches_evaluate():
+    pws = ["password", "mV7!pQ2#zL9@tX", "aaaa1234"]
+    results = evaluate_many(iter(pws))
+    assert [r.to_dict() for r in results] == [evaluate(p).to_dict() for p in pws]
+
+
+def test_cli_batch_writes_jsonl(tmp_path):
+    src = tmp_path / "in.txt"
+    src.write_text("password\n\nmV7!pQ2#zL9@tX\n", encoding="utf-8")
+    out = tmp_path / "out.jsonl"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run(
+        [sys.executable, "-m", "password_strength_checker.cli.main", "batch", "-i", str(src), "-o", str(out)],
+        check=True,
+        env=env,
+    )
+    rows = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert [r["line"] for r in rows] == [1, 3]
+    assert rows[0]["score"] == evaluate("password").score
+
+
+def test_parallel_matches_sequential():
+    from password_strength_checker.core.parallel import evaluate_many_parallel
+
+    pws = [f"pw{i}Abc!" for i in range(50)] + ["password", "aaaa1234"]
+    expected = [evaluate(p).to_dict() for p in pws]
+
+    ordered = list(evaluate_many_parallel(enumerate(pws), workers=2, chunk_size=7))
+    assert [i for i, _ in ordered] == list(range(len(pws)))
+    assert [r.to_dict() for _, r in ordered] == expected
+
+    unordered = dict(evaluate_many_parallel(enumerate(pws), workers=2, chunk_size=7, ordered=False))
+    assert [unordered[i].to_dict() for i in range(len(pws))] == expected
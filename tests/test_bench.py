@@ -0,0 +1,16 @@
+from password_strength_checker.bench import compare, run_benchmarks
+
+
+def test_run_benchmarks_smoke():
+    results = run_benchmarks(count=5, lengths=(8,), dictionary_sizes=(50,))
+    assert "evaluate[len=8]" in results
+    assert "rule:dictionary[len=8]" in results
+    assert "dict_load[pscd,50]" in results
+    assert all(r["ops_per_sec"] > 0 for r in results.values())
+
+
+def test_compare_flags_regressions_only():
+    base = {"a": {"p50_us": 10.0}, "b": {"p50_us": 10.0}}
+    cur = {"a": {"p50_us": 20.0}, "b": {"p50_us": 11.0}, "new": {"p50_us": 1.0}}
+    regressions = compare(cur, base, tolerance=0.25)
+    assert len(regressions) == 1 and regressions[0].startswith("a:")
@@ -0,0 +1,48 @@
+from password_strength_checker.core.bloom import BLOOM_SUFFIX, BloomFilter, build_bloom_file
+from password_strength_checker.core.models import Policy
+from password_strength_checker.core.rules.dictionary import DictionaryRule, load_dictionary
+
+
+def test_bloom_has_no_false_negatives_and_few_false_positives(tmp_path):
+    words = [f"word{i}" for i in range(2000)]
+    bf = BloomFilter.build(words, len(words), fp_rate=0.01)
+    path = tmp_path / "w.bloom"
+    bf.save(path)
+
+    loaded = BloomFilter.load(path)
+    assert all(w in loaded for w in words)
+    fps = sum(1 for i in range(2000) if f"other{i}" in loaded)
+    assert fps < 60
+
+
+def test_dictionary_uses_prefilter():
+    words = {"dragon"}
+    rule = DictionaryRule(words, prefilter=BloomFilter.build(words, 1))
+    assert rule.check("dragon", Policy())[0].code == "DICT_EXACT"
+    assert rule.check("zz9!Qk", Policy())[0].code == "DICT_OK"
+
+
+def test_stale_sidecar_is_ignored(tmp_path):
+    src = tmp_path / "common_passwords.txt"
+    src.write_text("dragon\n", encoding="utf-8")
+    build_bloom_file(lambda: iter(["dragon"]), src.with_suffix(BLOOM_SUFFIX), source=src)
+    assert load_dictionary(src, "v1").prefilter is not None
+
+    # dictionary rebuilt, sidecar not: the filter would hide "monkey"
+    src.write_text("dragon\nmonkey\n", encoding="utf-8")
+    rule = load_dictionary(src, "v2")
+    assert rule.prefilter is None
+    assert rule.check("monkey", Policy())[0].code == "DICT_EXACT"
+
+
+def test_corrupt_sidecar_is_ignored(tmp_path):
+    src = tmp_path / "common_passwords.txt"
+    src.write_text("dragon\n", encoding="utf-8")
+    sidecar = src.with_suffix(BLOOM_SUFFIX)
+    build_bloom_file(lambda: iter(["dragon"]), sidecar, source=src)
+    data = sidecar.read_bytes()
+    for i, broken in enumerate([data[:20], data[:-1], b""]):
+        sidecar.write_bytes(broken)
+        rule = load_dictionary(src, f"corrupt{i}")
+        assert rule.prefilter is None
+        assert rule.check("dragon", Policy())[0].code == "DICT_EXACT"
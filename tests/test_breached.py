@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+
+from password_strength_checker.core.breach import PwnedCorpus, build_hibp_index, sha1_hex
+from password_strength_checker.core.evaluate import Evaluator
+from password_strength_checker.core.models import Policy
+from password_strength_checker.core.rules.breached import BreachedPasswordRule
+
+LEAKED = {"hunter2": 17, "correcthorse": 3, "Tr0ub4dor&3": 1}
+
+
+def _write_dir(root: Path) -> Path:
+    d = root / "pwned"
+    d.mkdir()
+    buckets: dict[str, list[str]] = {}
+    for pw, n in LEAKED.items():
+        h = sha1_hex(pw)
+        buckets.setdefault(h[:5], []).append(f"{h[5:]}:{n}")
+    for prefix, lines in buckets.items():
+        (d / f"{prefix}.txt").write_text("\r\n".join(sorted(lines)) + "\r\n")
+    return d
+
+
+def _write_file(root: Path) -> Path:
+    f = root / "pwned-passwords.txt"
+    lines = sorted(f"{sha1_hex(pw)}:{n}" for pw, n in LEAKED.items())
+    f.write_text("\n".join(lines) + "\n")
+    build_hibp_index(f)
+    return f
+
+
+def test_corpus_layouts_agree(tmp_path):
+    for corpus in (PwnedCorpus(_write_dir(tmp_path)), PwnedCorpus(_write_file(tmp_path))):
+        for pw, n in LEAKED.items():
+            assert corpus.count(pw) == n
+        assert corpus.count("not-in-the-corpus") == 0
+
+
+def test_bucket_lru_is_bounded(tmp_path):
+    corpus = PwnedCorpus(_write_dir(tmp_path), cache_size=2)
+    for pw in LEAKED:
+        corpus.count(pw)
+    assert len(corpus._cache) <= 2
+
+
+def test_rule_reports_count_without_hash(tmp_path):
+    _write_dir(tmp_path)
+    # third-party corpus rule: opt-in per policy
+    assert "breached" not in dict(Evaluator(Policy(), tmp_path).rules)
+    ev = Evaluator(Policy(enabled_rules={"breached": True}), tmp_path)
+    r = ev.evaluate("hunter2")
+    f = next(f for f in r.findings if f.code == "BREACHED")
+    assert f.meta == {"count": 17}
+    assert not r.compliant
+    assert BreachedPasswordRule(None).check("hunter2", Policy()) == []
+    # nothing to report for passwords absent from the corpus
+    assert not any(f.code.startswith("BREACHED") for f in ev.evaluate("zQ8!vL3#pW").findings)
+
+
+def test_index_rejects_unsorted_dump(tmp_path):
+    f = tmp_path / "pwned-passwords.txt"
+    lines = sorted(f"{sha1_hex(pw)}:{n}" for pw, n in LEAKED.items())
+    f.write_text("\n".join(reversed(lines)) + "\n")
+    with pytest.raises(ValueError, match="not sorted"):
+        build_hibp_index(f)
+    assert not f.with_name(f.name + ".idx").exists()
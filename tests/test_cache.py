@@ -0,0 +1,61 @@
+import os
+import time
+
+from password_strength_checker.core.cache import ResultCache
+from password_strength_checker.core.evaluate import Evaluator, evaluate, get_evaluator
+from password_strength_checker.core.models import Policy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_hits_and_never_stores_plaintext():
+    cache = ResultCache(maxsize=4)
+    first = evaluate("hunter2hunter2", cache=cache)
+    second = evaluate("hunter2hunter2", cache=cache)
+    assert second is first
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+    assert all(b"hunter2" not in k for k in cache._entries)
+
+
+def test_policy_and_mode_are_part_of_the_key():
+    cache = ResultCache()
+    a = evaluate("abcdefgh", Policy(min_length=8), cache=cache)
+    b = evaluate("abcdefgh", Policy(min_length=12), cache=cache)
+    c = evaluate("abcdefgh", Policy(min_length=8), cache=cache, short_circuit=True)
+    assert len({id(a), id(b), id(c)}) == 3
+
+
+def test_ttl_and_lru_eviction():
+    clock = FakeClock()
+    cache = ResultCache(maxsize=2, ttl=10, clock=clock)
+    ev = Evaluator()
+    ev.evaluate_cached("one", cache)
+    ev.evaluate_cached("two", cache)
+    ev.evaluate_cached("three", cache)
+    assert len(cache) == 2 and cache.evictions == 1
+
+    clock.now = 11
+    ev.evaluate_cached("three", cache)
+    assert cache.expirations == 1
+
+
+def test_dictionary_change_invalidates(tmp_path):
+    words = tmp_path / "common_passwords.txt"
+    words.write_text("zebrapass\n", encoding="utf-8")
+    cache = ResultCache()
+    assert evaluate("zebrapass", data_dir=tmp_path, cache=cache).findings[-1].code == "DICT_EXACT"
+
+    words.write_text("other\n", encoding="utf-8")
+    st = words.stat()
+    os.utime(words, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    get_evaluator(data_dir=tmp_path)._checked_at = time.monotonic() - 60
+
+    r = evaluate("zebrapass", data_dir=tmp_path, cache=cache)
+    assert r.findings[-1].code == "DICT_OK"
+    assert cache.invalidations == 1
@@ -0,0 +1,44 @@
+from password_strength_checker.core.matching import AhoCorasick
+from password_strength_checker.core.models import Policy
+from password_strength_checker.core.rules.dictionary import DictionaryRule
+
+
+def test_aho_corasick_finds_overlapping_words():
+    ac = AhoCorasick(["he", "she", "his", "hers"])
+    assert sorted(ac.finditer("ushers")) == [(1, "she"), (2, "he"), (2, "hers")]
+
+
+def test_dictionary_contains_reports_all_matches():
+    rule = DictionaryRule({"dragon", "monkey", "abc"})
+    [f] = rule.check("xxDragon!!monkey", Policy())
+    assert f.code == "DICT_CONTAINS"
+    assert f.meta["matches"] == [
+        {"word": "dragon", "start": 2, "end": 8},
+        {"word": "monkey", "start": 10, "end": 16},
+    ]
+
+
+def test_dictionary_exact_and_ok():
+    rule = DictionaryRule({"dragon"})
+    assert rule.check("DRAGON", Policy())[0].code == "DICT_EXACT"
+    assert rule.check("zz9!Qk", Policy())[0].code == "DICT_OK"
+
+
+def test_compiled_dictionary_roundtrip(tmp_path):
+    from password_strength_checker.core.dictfile import MappedDictionary, compile_dictionary
+
+    src = tmp_path / "words.txt"
+    src.write_text("# comment\nDragon\nmonkey\nété2024\nmonkey\n", encoding="utf-8")
+    dst = tmp_path / "words.pscd"
+    assert compile_dictionary(src, dst) == 3
+
+    mapped = MappedDictionary(dst)
+    assert len(mapped) == 3
+    assert "dragon" in mapped and "été2024" in mapped
+    assert "drago" not in mapped and "zzz" not in mapped
+    assert list(mapped) == sorted(list(mapped), key=lambda w: w.encode("utf-8"))
+
+    rule = DictionaryRule.from_file(dst)
+    text_rule = DictionaryRule.from_file(src)
+    for pw in ("dragon", "xxDragon!!monkey", "zz9!Qk"):
+        assert rule.check(pw, Policy()) == text_rule.check(pw, Policy())
@@ -21,3 +21,97 @@ def test_strong_has_longer_estimates_than_weak():
     strong_secs = float(strong.estimates[2]["seconds"]) # offline fast hash GPU
 
     assert strong_secs > weak_secs
+
+
+def test_guess_decomposition_finds_patterns():
+    from password_strength_checker.core.estimates import estimate_guesses
+    from password_strength_checker.core.rules.dictionary import DictionaryRule
+
+    d = DictionaryRule({"dragon", "monkey"})
+    g = estimate_guesses("Dragon1990aaaa", dictionary=d)
+    assert [m.pattern for m in g.matches] == ["dictionary", "date", "repeat"]
+    assert g.matches[0].token == "Dragon"
+
+    random_like = estimate_guesses("Zq9!vX#2mLp$7wRt", dictionary=d)
+    assert [m.pattern for m in random_like.matches] == ["bruteforce"]
+    assert random_like.log10_guesses > g.log10_guesses
+
+
+def test_guesses_in_result():
+    r = evaluate("qwerty123")
+    assert r.guesses is not None
+    assert {m["pattern"] for m in r.guesses["matches"]} >= {"sequence"}
+    assert r.to_dict()["guesses"]["log10"] == r.guesses["log10"]
+
+
+def test_huge_password_estimates_stay_finite():
+    import json
+
+    r = evaluate("aB3$" * 2500)
+    assert r.log10_guesses is not None and r.log10_guesses <= 300
+    assert r.estimates[2]["time"] == "~1000y+"
+    json.dumps(r.to_dict(), allow_nan=False)
+
+
+def test_log10_guesses_matches_estimates():
+    import math
+
+    r = evaluate("mV7!pQ2#zL9@tX__2026!")
+    secs = float(r.estimates[2]["seconds"])  # 1e10 guesses/s
+    assert abs((r.log10_guesses - 10) - math.log10(secs)) < 1e-2
+
+
+def test_result_json_never_contains_the_password():
+    import json
+
+    pw = "Zorglub1990xcvbZZZZ"  # brute force + date + sequence + repeat
+    r = evaluate(pw)
+    assert {m["pattern"] for m in r.guesses["matches"]} == {"bruteforce", "date", "sequence", "repeat"}
+    out = json.dumps(r.to_dict())
+    leaked = [pw[i:j] for i in range(len(pw)) for j in range(i + 3, len(pw) + 1) if pw[i:j] in out]
+    assert leaked == []
+
+
+def test_log10_keyspace_same_with_or_without_analysis():
+    from password_strength_checker.core.analysis import analyze
+    from password_strength_checker.core.estimates import log10_keyspace
+
+    pw = "a" * 300 + "Z9!"  # classes only past the first 256 characters
+    assert log10_keyspace(pw) == log10_keyspace(pw, analyze(pw))
+
+
+def test_expanding_lowercase_does_not_break_the_estimator():
+    # 'İ'.lower() is two characters: matches found in analysis.lower must map back
+    for pw in ["İpassword", "İabc", "xİİİqwerty", "İ" * 200 + "abcd"]:
+        r = evaluate(pw)
+        assert r.guesses is not None
+        for m in r.guesses["matches"]:
+            assert 0 <= m["i"] <= m["j"] < len(pw)
+    [m] = [m for m in evaluate("İpassword").guesses["matches"] if m["pattern"] == "dictionary"]
+    assert (m["i"], m["j"]) == (1, 8)
+
+
+def test_estimator_reuses_the_rules_scans(monkeypatch):
+    from password_strength_checker.core.evaluate import Evaluator
+    from password_strength_checker.core.rules import sequences
+    from password_strength_checker.core.rules.dictionary import DictionaryRule
+
+    calls = {"contained": 0, "runs": 0}
+    find_contained = DictionaryRule.find_contained
+    sequence_runs = sequences.sequence_runs
+
+    def count_contained(self, norm):
+        calls["contained"] += 1
+        return find_contained(self, norm)
+
+    def count_runs(lower, min_len=2):
+        calls["runs"] += 1
+        return sequence_runs(lower, min_len)
+
+    monkeypatch.setattr(DictionaryRule, "find_contained", count_contained)
+    monkeypatch.setattr(sequences, "sequence_runs", count_runs)
+    ev = Evaluator()
+    ev.evaluate("xpassword1234")
+    assert calls == {"contained": 1, "runs": 1}
+    ev.evaluate_batch(["xpassword1234"])
+    assert calls == {"contained": 2, "runs": 2}
@@ -0,0 +1,79 @@
+from password_strength_checker.core.evaluate import Evaluator, evaluate, get_evaluator
+from password_strength_checker.core.models import Policy
+
+
+def test_get_evaluator_is_reused():
+    a = get_evaluator(Policy())
+    b = get_evaluator(Policy())
+    assert a is b
+
+
+def test_distinct_policies_get_distinct_evaluators():
+    a = get_evaluator(Policy(min_length=12))
+    b = get_evaluator(Policy(min_length=14))
+    assert a is not b
+    # the dictionary is shared between them
+    assert dict(a.rules)["dictionary"] is dict(b.rules)["dictionary"]
+
+
+def test_evaluator_matches_evaluate():
+    ev = Evaluator(Policy())
+    assert ev.evaluate("password").to_dict() == evaluate("password").to_dict()
+
+
+def test_analysis_single_pass_facts():
+    from password_strength_checker.core.analysis import DIGIT, LOWER, UPPER, analyze
+
+    a = analyze("aaB11!")
+    assert a.length == 6
+    assert a.runs == (("a", 2), ("B", 1), ("1", 2), ("!", 1))
+    assert a.longest_run == 2
+    assert a.has(LOWER) and a.has(UPPER) and a.has(DIGIT)
+    assert a.classes == 4
+    assert a.normalized == "aablli"
+
+
+def test_rules_agree_with_and_without_analysis():
+    from password_strength_checker.core.analysis import analyze
+
+    ev = Evaluator(Policy(banned_words=["acme"]))
+    for pw in ("", "password", "Acme-1234!!!", "Ééé€ zz"):
+        a = analyze(pw)
+        for _, rule in ev.rules:
+            assert rule.check(pw, ev.policy, a) == rule.check(pw, ev.policy)
+
+
+def test_instrumented_evaluator_records_timings():
+    seen = []
+    ev = Evaluator(Policy(), hooks=[lambda name, s: seen.append(name)])
+    r = ev.evaluate("password")
+    assert set(r.to_dict()["timings"]) >= {"analyze", "rule:dictionary", "estimate", "evaluate"}
+    stats = ev.stats.snapshot()
+    assert stats["rule:length"]["calls"] == 1
+    assert "load:dictionary" in stats
+    assert "evaluate" in seen
+    # results are otherwise unchanged, and uninstrumented results carry no timings
+    plain = evaluate("password").to_dict()
+    assert "timings" not in plain
+    assert {k: v for k, v in r.to_dict().items() if k != "timings"} == plain
+
+
+def test_short_circuit_stops_at_first_critical():
+    ev = Evaluator(Policy())
+    r = ev.evaluate("abc", short_circuit=True)
+    assert r.short_circuited
+    assert not r.compliant
+    # length is the cheapest rule and already critical for 3 characters
+    assert [f.code for f in r.findings] == ["LEN_TOO_SHORT"]
+    assert r.policy_violations == ["LEN_TOO_SHORT"]
+    assert r.estimates == []
+
+
+def test_short_circuit_runs_everything_for_compliant_passwords():
+    ev = Evaluator(Policy())
+    pw = "mV7!pQ2#zL9@tX"
+    r = ev.evaluate(pw, short_circuit=True)
+    full = ev.evaluate(pw)
+    assert not r.short_circuited and r.compliant
+    assert sorted(f.code for f in r.findings) == sorted(f.code for f in full.findings)
+    assert r.score == full.score
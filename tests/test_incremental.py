@@ -0,0 +1,56 @@
+import random
+
+from password_strength_checker.core.cache import ResultCache
+from password_strength_checker.core.dictfile import MappedDictionary, compile_dictionary
+from password_strength_checker.core.evaluate import Evaluator
+from password_strength_checker.core.incremental import IncrementalEvaluator
+from password_strength_checker.core.models import Policy
+
+
+def test_incremental_matches_full_evaluation_under_random_edits():
+    rng = random.Random(7)
+    ev = Evaluator(Policy(banned_words=["acme"]))
+    inc = IncrementalEvaluator(ev)
+    alphabet = "abcdeqwerty0123456789AZ!@$ pass"
+    pw = ""
+    for _ in range(400):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+        i = rng.randint(0, len(pw))
+        op = rng.random()
+        if op < 0.5 and len(pw) < 40:
+            result = inc.append(text)
+            pw += text
+        elif op < 0.8 and pw:
+            n = rng.randint(1, 3)
+            result = inc.delete(i, n)
+            pw = pw[:i] + pw[i + n :]
+        else:
+            n = rng.randint(0, 2)
+            result = inc.replace(i, n, text)
+            pw = pw[:i] + text + pw[i + n :]
+        assert inc.password == pw
+        assert result == ev.evaluate(pw)
+
+
+def test_incremental_with_mapped_dictionary_and_non_ascii(tmp_path):
+    src = tmp_path / "common_passwords.txt"
+    src.write_text("dragon\nmonkey\nsunshine\n")
+    compile_dictionary(src, tmp_path / "common_passwords.pscd")
+    ev = Evaluator(Policy(), tmp_path)
+    assert any(isinstance(getattr(r, "words", None), MappedDictionary) for _, r in ev.rules)
+
+    inc = IncrementalEvaluator(ev)
+    for pw in ["xsunsh", "xsunsh1ne!", "xsunsh1ne!ΣΣ", "D4 dragon", "monkey", ""]:
+        assert inc.set_password(pw) == ev.evaluate(pw)
+
+
+def test_incremental_fills_result_cache():
+    ev = Evaluator()
+    inc = IncrementalEvaluator(ev)
+    cache = ResultCache()
+    first = ev.evaluate_cached("dragon12", cache, compute=inc.set_password)
+    assert first == ev.evaluate("dragon12") and inc.password == "dragon12"
+    inc.set_password("x")
+    # served from the cache: the incremental state is left alone
+    assert ev.evaluate_cached("dragon12", cache, compute=inc.set_password) is first
+    assert inc.password == "x" and cache.hits == 1
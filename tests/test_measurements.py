@@ -0,0 +1,56 @@
+from password_strength_checker.core.evaluate import evaluate
+from password_strength_checker.core.measurements import evaluate_policies
+from password_strength_checker.core.models import Policy
+
+POLICIES = [
+    Policy(),
+    Policy(min_length=16, max_repeated_run=2, forbid_sequences_len=3),
+    Policy(banned_words=["azerty", "acme"], forbid_dictionary=False),
+    Policy(enabled_rules={"dictionary": False, "sequences": False}),
+]
+PASSWORDS = ["", "password", "Acme1234!!!", "aaaBBB123qwerty", "Xk9#mQ2v!LzR7pT", "Été-2024-azerty"]
+
+
+def test_evaluate_policies_matches_evaluate():
+    for pw in PASSWORDS:
+        results = evaluate_policies(pw, POLICIES)
+        assert [r.to_dict() for r in results] == [evaluate(pw, p).to_dict() for p in POLICIES]
+
+
+def test_evaluate_policies_mapping():
+    results = evaluate_policies("Summer2024", {"strict": POLICIES[1], "lax": POLICIES[2]})
+    assert list(results) == ["strict", "lax"]
+    assert "LEN_WEAK" in [f.code for f in results["strict"].findings]
+    assert results["lax"].to_dict() == evaluate("Summer2024", POLICIES[2]).to_dict()
+
+
+def test_evaluate_policies_bypasses_evaluator_lru(monkeypatch):
+    from password_strength_checker.core import evaluate as evaluate_mod
+
+    # more policies than the LRU holds: going through it would rebuild evaluators every call
+    many = [Policy(min_length=n) for n in range(4, 4 + 2 * evaluate_mod.MAX_CACHED_EVALUATORS)]
+    expected = [evaluate("Summer2024", p).to_dict() for p in many]
+
+    def no_lru(*args, **kwargs):
+        raise AssertionError("evaluate_policies() must not use get_evaluator()")
+
+    monkeypatch.setattr(evaluate_mod, "get_evaluator", no_lru)
+    assert [r.to_dict() for r in evaluate_policies("Summer2024", many)] == expected
+
+
+def test_evaluate_policies_reuses_evaluators_across_calls(monkeypatch):
+    from password_strength_checker.core import evaluate as evaluate_mod
+
+    many = [Policy(min_length=n) for n in range(4, 4 + 2 * evaluate_mod.MAX_CACHED_EVALUATORS)]
+    evaluate_policies("Summer2024", many)
+    built = []
+    init = evaluate_mod.Evaluator.__init__
+
+    def counting_init(self, *args, **kwargs):
+        built.append(args)
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(evaluate_mod.Evaluator, "__init__", counting_init)
+    evaluate_policies("Autumn2025", many)
+    evaluate_policies("Summer2024", {"a": many[0], "b": many[-1]})
+    assert built == []
@@ -0,0 +1,78 @@
+import json
+import os
+import time
+
+from password_strength_checker.core.evaluate import Evaluator
+from password_strength_checker.core.models import Policy
+from password_strength_checker.core.policy import BannedWords, PolicyWatcher, compile_policy
+from password_strength_checker.core.rules.banned import BannedWordsRule
+
+
+def test_compiled_policy_is_hashable_and_isolated():
+    words = ["Acme "]
+    a = compile_policy(Policy(banned_words=words, enabled_rules={"sequences": False}))
+    words.append("other")
+    b = compile_policy(Policy(banned_words=["Acme "], enabled_rules={"sequences": False}))
+    assert a == b and hash(a) == hash(b) and len({a, b}) == 1
+    assert not a.rule_enabled("sequences") and a.rule_enabled("length")
+    assert Evaluator(a).fingerprint == a.fingerprint
+
+
+def test_banned_words_keep_policy_order_with_automaton():
+    words = [f"w{i:02d}xx" for i in range(20)] + [" Zeta", "alpha"]
+    banned = BannedWords(words)
+    assert banned._matcher is not None
+    # "alpha" appears first in the password, " Zeta" first in the policy
+    assert banned.first_match("alpha-zeta") == " Zeta"
+    assert banned.first_match("nothing") is None
+    [f] = BannedWordsRule(banned).check("ALPHA", Policy(banned_words=words))
+    assert f.meta == {"word": "alpha"}
+
+
+def test_watcher_reloads_and_keeps_last_good_policy(tmp_path):
+    path = tmp_path / "policy.json"
+    path.write_text(json.dumps({"min_length": 12}))
+    seen = []
+    watcher = PolicyWatcher(path, on_change=seen.append)
+    assert watcher.poll() is False
+
+    path.write_text(json.dumps({"min_length": 14}))
+    os.utime(path, ns=(1, 1))
+    assert watcher.poll() is True
+    assert watcher.policy.policy.min_length == 14 and seen == [watcher.policy]
+
+    path.write_text("{ half written")
+    assert watcher.poll() is False
+    assert watcher.error and watcher.policy.policy.min_length == 14
+
+
+def test_watcher_survives_failing_subscriber(tmp_path):
+    path = tmp_path / "policy.json"
+    path.write_text(json.dumps({"min_length": 12}))
+    seen = []
+
+    def broken(policy):
+        raise RuntimeError("reload failed")
+
+    watcher = PolicyWatcher(path, on_change=broken)
+    watcher.subscribe(seen.append)
+    path.write_text(json.dumps({"min_length": 14}))
+    os.utime(path, ns=(1, 1))
+    assert watcher.poll() is True
+    assert seen == [watcher.policy]
+    [err] = watcher.callback_errors
+    assert "broken" in err and "reload failed" in err
+
+    # the thread keeps polling through errors that aren't parse errors
+    path.write_text("[]")
+    os.utime(path, ns=(2, 2))
+    watcher.interval = 0.01
+    watcher.start()
+    try:
+        for _ in range(200):
+            if watcher.error:
+                break
+            time.sleep(0.01)
+        assert watcher.error and watcher._thread.is_alive()
+    finally:
+        watcher.stop()
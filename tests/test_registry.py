@@ -0,0 +1,77 @@
+import importlib.metadata
+
+import pytest
+
+from password_strength_checker.core.evaluate import Evaluator
+from password_strength_checker.core.models import Finding, Policy, Severity
+from password_strength_checker.core.registry import BUILTIN_RULES, Cost, RuleRegistry, RuleSpec
+
+
+class NoAdminRule:
+    cost = Cost.TRIVIAL
+    requires = ("length",)
+
+    def check(self, password, policy, analysis=None):
+        if "admin" in password.lower():
+            return [Finding("NO_ADMIN", "Contient 'admin'.", Severity.CRITICAL, penalty=-30)]
+        return []
+
+
+def test_banned_rule_is_registered_and_honours_policy():
+    ev = Evaluator(Policy(banned_words=["Acme"]))
+    assert "banned" in dict(ev.rules)
+    assert any(f.code == "BANNED_WORD" for f in ev.evaluate("acme-Secure-2024!").findings)
+
+    ev = Evaluator(Policy(banned_words=["Acme"], enabled_rules={"banned": False}))
+    assert "banned" not in dict(ev.rules)
+
+
+def test_requires_orders_rules_and_rejects_missing_dependency():
+    reg = RuleRegistry(BUILTIN_RULES)
+    reg.register(RuleSpec("first", f"{__name__}:NoAdminRule", requires=("dictionary",)))
+    names = [s.name for s in reg.resolve(Policy())]
+    assert names.index("first") > names.index("dictionary")
+
+    with pytest.raises(ValueError, match="requires 'dictionary'"):
+        reg.resolve(Policy(enabled_rules={"dictionary": False}))
+
+
+def test_entry_point_rules_are_discovered(monkeypatch):
+    ep = importlib.metadata.EntryPoint("no_admin", f"{__name__}:NoAdminRule", "password_strength_checker.rules")
+    monkeypatch.setattr(importlib.metadata, "entry_points", lambda group: [ep])
+
+    reg = RuleRegistry(BUILTIN_RULES)
+    reg.load_entry_points()
+    [spec] = [s for s in reg.resolve(Policy()) if s.name == "no_admin"]
+    assert spec.cost is Cost.TRIVIAL and spec.requires == ("length",)
+
+    ev = Evaluator(Policy(), registry=reg)
+    assert any(f.code == "NO_ADMIN" for f in ev.evaluate("SuperAdmin!2024xx").findings)
+    # disabled entry-point rules are not even resolved
+    assert "no_admin" not in [s.name for s in reg.resolve(Policy(enabled_rules={"no_admin": False}))]
+
+
+def test_plugins_are_opt_in(monkeypatch):
+    from password_strength_checker.core import registry
+
+    calls = []
+    monkeypatch.setattr(RuleRegistry, "load_entry_points", lambda self: calls.append(self))
+    monkeypatch.setattr(registry, "_default_registry", None)
+    monkeypatch.setattr(registry, "_plugins_loaded", False)
+    monkeypatch.setenv(registry.PLUGINS_ENV, "0")
+
+    registry.default_registry()
+    assert calls == []
+    registry.load_plugins()
+    registry.load_plugins()
+    assert len(calls) == 1
+
+
+def test_resolve_uses_the_compiled_disabled_rules():
+    from password_strength_checker.core.policy import compile_policy
+
+    enabled = {"sequences": False}
+    compiled = compile_policy(Policy(enabled_rules=enabled))
+    enabled["sequences"] = True  # the compiled policy holds its own copy
+    names = [s.name for s in RuleRegistry(BUILTIN_RULES).resolve(compiled)]
+    assert "sequences" not in names and "length" in names
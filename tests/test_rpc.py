@@ -0,0 +1,89 @@
+import io
+import json
+import socket
+import stat
+import sys
+import threading
+import time
+
+import pytest
+
+from password_strength_checker.core.evaluate import Evaluator, evaluate
+from password_strength_checker.server.rpc import handle_message, serve_stdio, serve_unix
+
+
+def test_handle_message_result_and_errors():
+    ev = Evaluator()
+    ok = json.loads(handle_message(ev, '{"id": 7, "method": "evaluate", "params": {"password": "password"}}'))
+    assert ok == {"id": 7, "result": evaluate("password").to_dict()}
+
+    assert json.loads(handle_message(ev, "{oops"))["error"]["code"] == -32700
+    assert json.loads(handle_message(ev, '{"id": 1, "method": "nope"}'))["error"]["code"] == -32601
+    bad = json.loads(handle_message(ev, '{"id": 2, "method": "evaluate", "params": {"password": 3}}'))
+    assert bad == {"id": 2, "error": {"code": -32602, "message": "'password' must be a string"}}
+    assert json.loads(handle_message(ev, '{"id": 3, "method": ["x"]}'))["error"]["code"] == -32600
+
+
+def test_unexpected_errors_become_internal_error():
+    ev = Evaluator()
+
+    def boom(password, short_circuit=False):
+        raise RuntimeError(password)
+
+    ev.evaluate = boom
+    out = json.loads(handle_message(ev, '{"id": 4, "method": "evaluate", "params": {"password": "s3cret"}}'))
+    assert out == {"id": 4, "error": {"code": -32603, "message": "Internal error: RuntimeError"}}
+
+
+def test_stdio_pipelined_requests_keep_order():
+    lines = b"".join(
+        json.dumps({"id": i, "method": "evaluate", "params": {"password": f"pw{i}"}}).encode() + b"\n"
+        for i in range(5)
+    )
+    out = io.BytesIO()
+    serve_stdio(Evaluator(), io.BytesIO(lines), out)
+    ids = [json.loads(line)["id"] for line in out.getvalue().splitlines()]
+    assert ids == [0, 1, 2, 3, 4]
+
+
+def _start_unix(path):
+    threading.Thread(target=serve_unix, args=(Evaluator(), path), daemon=True).start()
+    for _ in range(100):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            try:
+                s.connect(str(path))
+                return
+            except OSError:
+                time.sleep(0.02)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="unix sockets")
+def test_unix_socket_roundtrip(tmp_path):
+    path = tmp_path / "psc.sock"
+    # stale socket from a dead instance: replaced
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(str(path))
+    _start_unix(path)
+    assert stat.S_IMODE(path.stat().st_mode) & 0o077 == 0
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(str(path))
+        s.sendall(b'{"id": 1, "method": "ping"}\n{"id": 2, "method": "ping"}\n')
+        buf = b""
+        while buf.count(b"\n") < 2:
+            buf += s.recv(4096)
+    assert [json.loads(line)["id"] for line in buf.splitlines()] == [1, 2]
+
+    # a live socket is left alone
+    with pytest.raises(OSError, match="in use"):
+        serve_unix(Evaluator(), path)
+    assert path.exists()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="unix sockets")
+def test_unix_socket_refuses_to_replace_a_file(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        serve_unix(Evaluator(), path)
+    assert path.read_text() == "keep me"
@@ -0,0 +1,51 @@
+import random
+
+from password_strength_checker.core.models import Policy
+from password_strength_checker.core.rules.sequences import (
+    NO_RUNS,
+    SequenceRun,
+    SequencesRule,
+    advance_runs,
+    close_runs,
+    sequence_runs,
+)
+
+
+def test_sequence_runs_report_start_length_direction():
+    assert sequence_runs("xabcdx9876", min_len=3) == [
+        SequenceRun(1, 4, "asc", "alpha"),
+        SequenceRun(6, 4, "desc", "digit"),
+    ]
+
+
+def test_pivot_is_shared_by_both_directions():
+    assert sequence_runs("abcba", min_len=3) == [
+        SequenceRun(0, 3, "asc", "alpha"),
+        SequenceRun(2, 3, "desc", "alpha"),
+    ]
+
+
+def test_keyboard_sequences():
+    [f] = SequencesRule().check("Xqwerty!", Policy())
+    assert f.code == "SEQUENCE"
+    assert f.meta["runs"] == [{"start": 1, "length": 6, "direction": "asc", "kind": "keyboard"}]
+    assert SequencesRule().check("zz-azer-zz", Policy())[0].code == "SEQUENCE"
+
+
+def test_sequence_threshold_and_ok():
+    assert SequencesRule().check("ab12cd", Policy(forbid_sequences_len=4))[0].code == "SEQUENCE_OK"
+    assert SequencesRule().check("1234", Policy(forbid_sequences_len=1))[0].code == "SEQUENCE_OK"
+
+
+def test_sequence_runs_matches_step_by_step_state():
+    # sequence_runs() inlines advance_runs() (used by the incremental evaluator): same runs
+    rng = random.Random(7)
+    for _ in range(300):
+        lower = "".join(rng.choice("abcdcbqwertzyx0123210 ") for _ in range(rng.randint(0, 30)))
+        for min_len in (2, 3, 4):
+            state, runs = NO_RUNS, []
+            for i in range(1, len(lower)):
+                state, closed = advance_runs(state, lower[i - 1], lower[i], i, min_len)
+                runs.extend(closed)
+            runs.extend(close_runs(state, len(lower) - 1, min_len))
+            assert sequence_runs(lower, min_len) == sorted(runs), lower
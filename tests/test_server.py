@@ -0,0 +1,100 @@
+import asyncio
+import http.client
+import json
+import threading
+import time
+
+import pytest
+
+from password_strength_checker.core.evaluate import Evaluator, evaluate
+from password_strength_checker.server.httpd import ScoringServer, ServerConfig
+
+
+def _running(srv):
+    loop = asyncio.new_event_loop()
+    aserver = loop.run_until_complete(srv.start())
+    port = aserver.sockets[0].getsockname()[1]
+    t = threading.Thread(target=loop.run_forever, daemon=True)
+    t.start()
+    yield port
+
+    async def shutdown():
+        aserver.close()
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout=2)
+    loop.call_soon_threadsafe(loop.stop)
+    t.join(timeout=2)
+    loop.close()
+
+
+@pytest.fixture
+def server():
+    yield from _running(ScoringServer(Evaluator(), ServerConfig(port=0, max_body=2048, max_batch=3)))
+
+
+def _post(conn, path, payload):
+    conn.request("POST", path, body=json.dumps(payload), headers={"Content-Type": "application/json"})
+    resp = conn.getresponse()
+    return resp.status, json.loads(resp.read())
+
+
+def test_evaluate_and_batch_over_one_keepalive_connection(server):
+    conn = http.client.HTTPConnection("127.0.0.1", server, timeout=5)
+    status, body = _post(conn, "/evaluate", {"password": "password"})
+    assert status == 200 and body == evaluate("password").to_dict()
+
+    status, body = _post(conn, "/evaluate/batch", {"passwords": ["password", "mV7!pQ2#zL9@tX"]})
+    assert status == 200 and len(body["results"]) == 2
+
+    assert _post(conn, "/evaluate/batch", {"passwords": ["a"] * 4})[0] == 413
+    assert _post(conn, "/evaluate", {"nope": 1})[0] == 400
+
+    conn.request("GET", "/metrics")
+    resp = conn.getresponse()
+    text = resp.read().decode()
+    assert resp.status == 200
+    assert 'psc_requests_total{route="/evaluate",status="200"} 1' in text
+    assert "psc_request_duration_seconds_bucket" in text
+    conn.close()
+
+
+def test_body_size_limit(server):
+    conn = http.client.HTTPConnection("127.0.0.1", server, timeout=5)
+    status, _ = _post(conn, "/evaluate", {"password": "x" * 4096})
+    assert status == 413
+    conn.close()
+
+
+def test_slow_evaluation_does_not_block_the_loop():
+    release = threading.Event()
+    ev = Evaluator()
+    evaluate_one = ev.evaluate
+
+    def slow_evaluate(password, short_circuit=False):
+        release.wait(5)
+        return evaluate_one(password, short_circuit=short_circuit)
+
+    ev.evaluate = slow_evaluate
+    srv = ScoringServer(ev, ServerConfig(port=0, max_concurrency=1))
+    for port in _running(srv):
+        slow = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        pending = threading.Thread(target=_post, args=(slow, "/evaluate", {"password": "x"}))
+        pending.start()
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+        conn.request("GET", "/health")
+        resp = conn.getresponse()
+        assert resp.status == 200 and resp.read() == b'{"status": "ok"}'
+        # the single slot is held while the evaluation is in flight
+        for _ in range(100):
+            if srv._inflight:
+                break
+            time.sleep(0.01)
+        assert _post(conn, "/evaluate", {"password": "y"})[0] == 503
+        release.set()
+        pending.join(5)
+        slow.close()
+        conn.close()
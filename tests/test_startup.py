@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+
+# Cumulative import time budget for the CLI module (python -X importtime), in microseconds
+CLI_IMPORT_BUDGET_US = 250_000
+
+
+def _run(code, *args):
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def _imports(stderr):
+    # "import time: <self us> | <cumulative us> | <indented module name>"
+    out = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            out[name.strip()] = int(cumulative)
+    return out
+
+
+def test_json_mode_does_not_import_rich_and_fits_budget():
+    proc = _run("from password_strength_checker.cli.main import main; main()", "--json", "--password", "x")
+    imports = _imports(proc.stderr)
+    assert not any(name == "rich" or name.startswith("rich.") for name in imports)
+    assert imports["password_strength_checker.cli.main"] < CLI_IMPORT_BUDGET_US
+
+
+def test_disabled_rules_are_never_imported():
+    code = (
+        "import sys\n"
+        "from password_strength_checker.core.evaluate import evaluate\n"
+        "from password_strength_checker.core.models import Policy\n"
+        "evaluate('x', Policy(enabled_rules={'dictionary': False}))\n"
+        "assert 'password_strength_checker.core.rules.dictionary' not in sys.modules\n"
+        "assert 'password_strength_checker.core.rules.length' in sys.modules\n"
+        # plugin discovery (importlib.metadata scan) is opt-in
+        "assert 'importlib.metadata' not in sys.modules\n"
+    )
+    _run(code)
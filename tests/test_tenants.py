@@ -0,0 +1,108 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from password_strength_checker.core.evaluate import Evaluator, evaluate
+from password_strength_checker.core.models import Policy
+from password_strength_checker.core.tenants import TenantEvaluator, UnknownTenantError
+from password_strength_checker.server.rpc import handle_message
+
+
+def _write_config(tmp_path):
+    (tmp_path / "retail.json").write_text(json.dumps({"min_length": 10}))
+    cfg = tmp_path / "tenants.json"
+    cfg.write_text(
+        json.dumps(
+            {
+                "default": "retail",
+                "tenants": {
+                    "retail": "retail.json",
+                    "bank": {"min_length": 16, "banned_words": ["bank"]},
+                    "shop": {"min_length": 10},
+                },
+            }
+        )
+    )
+    return cfg
+
+
+def test_tenants_share_state_and_select_policy(tmp_path):
+    tenants = TenantEvaluator.from_file(_write_config(tmp_path))
+    assert tenants.tenants == ["bank", "retail", "shop"]
+    # identical policies share one evaluator; every evaluator shares the dictionary
+    assert tenants.evaluator("retail") is tenants.evaluator("shop") is tenants.evaluator()
+    assert tenants.evaluator("bank").dictionary is tenants.evaluator("retail").dictionary
+
+    pw = "MyBankPass2024!"
+    assert tenants.evaluate(pw, "bank").to_dict() == evaluate(pw, Policy(min_length=16, banned_words=["bank"])).to_dict()
+    assert tenants.evaluate(pw).to_dict() == evaluate(pw, Policy(min_length=10)).to_dict()
+    with pytest.raises(UnknownTenantError):
+        tenants.evaluator("nope")
+
+
+def test_rpc_tenant_param(tmp_path):
+    tenants = TenantEvaluator.from_file(_write_config(tmp_path))
+    msg = json.dumps({"id": 1, "method": "evaluate", "params": {"password": "bank-2024-Xy!", "tenant": "bank"}})
+    out = json.loads(handle_message(Evaluator(), msg, tenants))
+    assert "BANNED_WORD" in out["result"]["policy_violations"]
+
+    msg = json.dumps({"id": 2, "method": "evaluate", "params": {"password": "x", "tenant": "nope"}})
+    assert json.loads(handle_message(Evaluator(), msg, tenants))["error"]["code"] == -32602
+
+
+def test_cli_batch_tenant(tmp_path):
+    cfg = _write_config(tmp_path)
+    src = tmp_path / "in.txt"
+    src.write_text("MyBankPass2024!\n", encoding="utf-8")
+    out = tmp_path / "out.jsonl"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    cmd = [sys.executable, "-m", "password_strength_checker.cli.main", "batch", "-i", str(src), "-o", str(out)]
+    subprocess.run([*cmd, "--tenants", str(cfg), "--tenant", "bank"], check=True, env=env)
+    [row] = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert row["policy_violations"] == ["BANNED_WORD"]
+
+
+def test_http_tenant_selection(tmp_path):
+    import asyncio
+
+    from password_strength_checker.server.httpd import HttpError, ScoringServer
+
+    srv = ScoringServer(Evaluator(), tenants=TenantEvaluator.from_file(_write_config(tmp_path)))
+    body = json.dumps({"password": "bank-2024-Xy!", "tenant": "bank"}).encode()
+    status, _, payload = asyncio.run(srv._dispatch("POST", "/evaluate", body))
+    assert status == 200 and json.loads(payload)["policy_violations"] == ["BANNED_WORD"]
+
+    with pytest.raises(HttpError) as e:
+        asyncio.run(srv._dispatch("POST", "/evaluate", json.dumps({"password": "x", "tenant": "nope"}).encode()))
+    assert e.value.status == 404
+
+
+def test_tenants_without_default_require_a_tenant_per_request(tmp_path):
+    import argparse
+    import asyncio
+
+    from password_strength_checker.cli.main import default_evaluator_from_args
+    from password_strength_checker.server.httpd import HttpError, ScoringServer
+
+    cfg = tmp_path / "tenants.json"
+    cfg.write_text(json.dumps({"tenants": {"bank": {"min_length": 16, "banned_words": ["bank"]}}}))
+    tenants = TenantEvaluator.from_file(cfg)
+    args = argparse.Namespace(tenant=None)
+    assert default_evaluator_from_args(args, tenants, None) is None
+
+    msg = json.dumps({"id": 1, "method": "evaluate", "params": {"password": "x"}})
+    assert json.loads(handle_message(None, msg, tenants))["error"] == {"code": -32602, "message": "Missing 'tenant'"}
+    msg = json.dumps({"id": 2, "method": "evaluate", "params": {"password": "bank-2024-Xy!", "tenant": "bank"}})
+    assert "BANNED_WORD" in json.loads(handle_message(None, msg, tenants))["result"]["policy_violations"]
+    assert json.loads(handle_message(None, json.dumps({"id": 3, "method": "ping"}), tenants))["result"] == "pong"
+
+    srv = ScoringServer(None, tenants=tenants)
+    with pytest.raises(HttpError) as e:
+        asyncio.run(srv._dispatch("POST", "/evaluate", json.dumps({"password": "x"}).encode()))
+    assert e.value.status == 400
+    body = json.dumps({"password": "bank-2024-Xy!", "tenant": "bank"}).encode()
+    status, _, payload = asyncio.run(srv._dispatch("POST", "/evaluate", body))
+    assert status == 200 and json.loads(payload)["policy_violations"] == ["BANNED_WORD"]
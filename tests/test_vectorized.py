@@ -0,0 +1,26 @@
+import pytest
+
+from password_strength_checker.core import vectorized
+from password_strength_checker.core.evaluate import Evaluator
+from password_strength_checker.core.models import Policy
+
+pytestmark = pytest.mark.skipif(not vectorized.available(), reason="numpy not installed")
+
+PASSWORDS = [
+    "",
+    "a",
+    "password",
+    "aaaa1234",
+    "mV7!pQ2#zL9@tX",
+    "Ééé€€€ 11",
+    "zzzzzzzzzzzzzzzzzzzzzzzzzz",
+    "abßCD٣",
+    "a\ud800b\udfff",  # lone surrogates (JSON allows them)
+]
+
+
+def test_batch_engine_matches_scalar_rules():
+    ev = Evaluator(Policy(max_repeated_run=2))
+    scalar = [ev.evaluate(pw).to_dict() for pw in PASSWORDS]
+    batch = [r.to_dict() for r in ev.evaluate_batch(PASSWORDS)]
+    assert batch == scalar